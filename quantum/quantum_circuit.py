@@ -5,19 +5,14 @@ import sympy
 import logging
 import json
 import argparse
+import os
+import numpy as np
+from simulator_pool import run_circuit, run_sweep
 
 # Load configuration
-with open('config.json') as config_file:
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')) as config_file:
     config = json.load(config_file)
 
-# Configure logging
-logging.basicConfig(level=getattr(logging, config['logging']['level']),
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler(config['logging']['file']),
-                        logging.StreamHandler()
-                    ])
-
 logger = logging.getLogger(__name__)
 
 # Create separate loggers for different parts of the application
@@ -31,7 +26,7 @@ def create_qubit():
 
 def create_hadamard_gate(qubit):
     """Apply a Hadamard gate to a qubit."""
-    circuit_logger.debug(f"Applying Hadamard gate to qubit: {qubit}.")
+    circuit_logger.debug("Applying Hadamard gate to qubit: %s.", qubit)
     return cirq.H(qubit)
 
 def create_quantum_circuit():
@@ -62,7 +57,7 @@ def measure_qubit(circuit, qubit):
     """
     Add a measurement to the circuit.
     """
-    circuit_logger.debug(f"Adding measurement to qubit: {qubit}.")
+    circuit_logger.debug("Adding measurement to qubit: %s.", qubit)
     circuit.append(cirq.measure(qubit, key='result'))
     return circuit
 
@@ -71,10 +66,9 @@ def simulate_circuit(circuit):
     Simulate the given quantum circuit.
     """
     simulation_logger.info("Simulating the quantum circuit.")
-    simulator = cirq.Simulator()
     try:
-        result = simulator.run(circuit)
-        simulation_logger.info(f"Simulation result: {result}")
+        result = run_circuit(circuit)
+        simulation_logger.info("Simulation result: %.512s", result)
         return result
     except Exception as e:
         simulation_logger.error(f"Error during simulation: {e}")
@@ -94,23 +88,99 @@ def create_parametric_and_simulate(theta_value):
     """
     Create and simulate a parametric quantum circuit.
     """
-    circuit_logger.info(f"Creating and simulating a parametric quantum circuit with theta={theta_value}.")
+    circuit_logger.info("Creating and simulating a parametric quantum circuit with theta=%s.", theta_value)
     qubit = create_qubit()
     circuit = create_parametric_circuit()
     circuit = measure_qubit(circuit, qubit)
-    simulator = cirq.Simulator()
-    param_resolver = cirq.ParamResolver({'theta': theta_value})
     try:
-        result = simulator.run(circuit, param_resolver=param_resolver)
-        simulation_logger.info(f"Parametric simulation result: {result}")
+        # Same structure for every theta, so the prepared circuit is reused
+        result = run_circuit(circuit, {'theta': theta_value})
+        simulation_logger.info("Parametric simulation result: %.512s", result)
         return result
     except Exception as e:
         simulation_logger.error(f"Error during parametric simulation: {e}")
         return None
 
+def build_sweep(symbol_values):
+    """
+    Build a cirq sweep from per-symbol values.
+
+    Several symbols form a grid (cartesian product) in which the last symbol varies
+    fastest.
+
+    Args:
+        symbol_values (dict): Maps each symbol name to a sequence of values or to a
+            ready-made cirq.Sweep over that symbol, such as cirq.Linspace.
+
+    Returns:
+        cirq.Sweep: The combined sweep.
+    """
+    sweeps = []
+    for name, values in symbol_values.items():
+        if isinstance(values, cirq.Sweep):
+            sweeps.append(values)
+        else:
+            sweeps.append(cirq.Points(name, np.asarray(values, dtype=float).ravel().tolist()))
+    return sweeps[0] if len(sweeps) == 1 else cirq.Product(*sweeps)
+
+def sweep_circuit(circuit, symbol_values, repetitions=100, key='result'):
+    """
+    Simulate a parametric circuit over every sweep point in one batched run.
+
+    Args:
+        circuit (cirq.Circuit): The measured parametric circuit.
+        symbol_values (dict): Per-symbol values, see build_sweep.
+        repetitions (int): Number of samples per sweep point.
+        key (str): The measurement key to collect.
+
+    Returns:
+        tuple: An array of the sweep points of shape (points, symbols), in sweep order,
+            and an int8 array of measured bits of shape (points, repetitions, qubits).
+    """
+    sweep = build_sweep(symbol_values)
+    simulation_logger.info("Running a %d-point parameter sweep with %d repetitions.", len(sweep), repetitions)
+    try:
+        results = run_sweep(circuit, sweep, repetitions=repetitions)
+        points = np.array([[resolver.value_of(name) for name in sweep.keys] for resolver in sweep],
+                          dtype=np.float64).reshape(len(sweep), len(sweep.keys))
+        bits = np.stack([result.measurements[key] for result in results]).astype(np.int8, copy=False)
+        return points, bits
+    except Exception as e:
+        simulation_logger.error(f"Error during parameter sweep: {e}")
+        return None
+
+def sweep_parametric(theta_values, repetitions=100):
+    """
+    Simulate the parametric circuit for an array of theta values in one batched sweep.
+
+    Args:
+        theta_values (array-like or cirq.Sweep): The theta values, or e.g.
+            cirq.Linspace('theta', 0, np.pi, 50).
+        repetitions (int): Number of samples per theta.
+
+    Returns:
+        numpy.ndarray: An int8 array of measured bits of shape (len(theta_values), repetitions),
+            or None if the sweep failed.
+    """
+    circuit_logger.info("Creating a parametric quantum circuit for a theta sweep.")
+    qubit = create_qubit()
+    circuit = measure_qubit(create_parametric_circuit(), qubit)
+    swept = sweep_circuit(circuit, {'theta': theta_values}, repetitions=repetitions)
+    if swept is None:
+        return None
+    _, bits = swept
+    return bits[:, :, 0]
+
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(level=config['logging']['level'],
+                      log_file=config['logging']['file'],
+                      module_levels=config['logging'].get('modules'))
+
     parser = argparse.ArgumentParser(description="Quantum Circuit Simulator")
     parser.add_argument("--theta", type=float, default=config['quantum_circuit']['theta'], help="Parameter value for the parametric circuit")
+    parser.add_argument("--sweep_points", type=int, default=0, help="Also sweep theta over [0, pi] with this many points")
+    parser.add_argument("--repetitions", type=int, default=100, help="Samples per sweep point")
     args = parser.parse_args()
 
     logger.info("Starting the Quantum Circuit Simulator")
@@ -121,4 +191,9 @@ if __name__ == "__main__":
     logger.info("Creating and simulating a parametric quantum circuit...")
     create_parametric_and_simulate(args.theta)
 
+    if args.sweep_points:
+        logger.info("Sweeping the parametric quantum circuit over theta...")
+        bits = sweep_parametric(cirq.Linspace('theta', 0, np.pi, args.sweep_points), repetitions=args.repetitions)
+        print(f"P(1) per sweep point: {bits.mean(axis=1)}")
+
     logger.info("Quantum Circuit Simulator finished.")
@@ -5,13 +5,6 @@ import tensorflow_quantum as tfq
 import logging
 import importlib
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("quantum_utils.log"),
-                        logging.StreamHandler()
-                    ])
 logger = logging.getLogger(__name__)
 
 def initialize_quantum_resources():
@@ -124,6 +117,9 @@ def allocate_resources_for_bundling(classical_code, quantum_code):
         return None
 
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="quantum_utils.log")
+
     logger.info("Starting quantum utilities module...")
 
     # Example usage
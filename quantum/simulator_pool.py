@@ -0,0 +1,216 @@
+# quantum/simulator_pool.py
+
+import contextlib
+import hashlib
+import logging
+import queue
+import threading
+from collections import OrderedDict
+import cirq
+import statevector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_CACHE_SIZE = 128
+# "auto" runs supported circuits of up to AUTO_MAX_QUBITS qubits on the NumPy
+# statevector engine, where per-call overhead dominates, and the rest on cirq
+ENGINES = ("auto", "numpy", "cirq")
+DEFAULT_ENGINE = "auto"
+AUTO_MAX_QUBITS = 12
+
+def circuit_fingerprint(circuit):
+    """
+    Compute a stable fingerprint of a circuit's structure.
+
+    Symbols are part of the fingerprint but their values are not, so every run of a
+    parametric circuit shares one fingerprint regardless of its parameters.
+
+    Args:
+        circuit (cirq.AbstractCircuit): The circuit to fingerprint.
+
+    Returns:
+        str: A hex SHA-256 digest of the circuit's repr.
+    """
+    return hashlib.sha256(repr(circuit).encode()).hexdigest()
+
+def prepare_circuit(circuit):
+    """
+    Optimize a circuit once so it can be simulated many times.
+
+    Negligible operations and empty moments are dropped. Fixed single-qubit gate runs
+    are merged into one PhasedXZ gate each; symbolic gates are left untouched so the
+    circuit still resolves with any parameters. The result is frozen.
+
+    Args:
+        circuit (cirq.AbstractCircuit): The circuit to prepare.
+
+    Returns:
+        cirq.FrozenCircuit: The prepared, immutable circuit.
+    """
+    prepared = cirq.drop_negligible_operations(circuit.unfreeze(copy=True))
+    if not cirq.is_parameterized(prepared):
+        prepared = cirq.merge_single_qubit_gates_to_phxz(prepared)
+    prepared = cirq.drop_empty_moments(prepared)
+    return prepared.freeze()
+
+class CircuitCache:
+    """
+    Thread-safe LRU cache of prepared circuits keyed by circuit fingerprint.
+
+    Each entry also holds the circuit compiled for the NumPy statevector engine, or
+    None when the circuit is outside what that engine supports.
+    """
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _entry(self, circuit):
+        key = circuit_fingerprint(circuit)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = {"prepared": prepare_circuit(circuit)}
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug("Evicted prepared circuit %s", evicted[:12])
+        return entry
+
+    def get(self, circuit):
+        """Return the prepared circuit, preparing and caching it on a miss."""
+        return self._entry(circuit)["prepared"]
+
+    def get_compiled(self, circuit):
+        """Return the prepared circuit compiled for the NumPy engine, or None if unsupported."""
+        entry = self._entry(circuit)
+        if "compiled" not in entry:
+            try:
+                entry["compiled"] = statevector.compile_circuit(entry["prepared"])
+            except statevector.UnsupportedCircuitError as e:
+                logger.debug("Circuit stays on the cirq engine: %s", e)
+                entry["compiled"] = None
+        return entry["compiled"]
+
+    def clear(self):
+        """Drop every cached circuit and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+class SimulatorPool:
+    """
+    Pool of reusable cirq simulators.
+
+    Simulators carry their own random state, so each one is handed to a single caller
+    at a time. Up to ``max_size`` simulators are created on demand and then reused.
+    """
+
+    def __init__(self, max_size=DEFAULT_POOL_SIZE, factory=None):
+        self.max_size = max_size
+        self._factory = factory
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout=None):
+        """Take a simulator from the pool, creating one if the pool is not yet full."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.max_size:
+                self._created += 1
+                logger.debug("Creating pooled simulator %d of %d", self._created, self.max_size)
+                return self._factory() if self._factory is not None else cirq.Simulator()
+        return self._idle.get(timeout=timeout)
+
+    def release(self, simulator):
+        """Return a simulator to the pool."""
+        self._idle.put(simulator)
+
+    @contextlib.contextmanager
+    def simulator(self, timeout=None):
+        """Borrow a simulator for the duration of a ``with`` block."""
+        simulator = self.acquire(timeout)
+        try:
+            yield simulator
+        finally:
+            self.release(simulator)
+
+_default_pool = SimulatorPool()
+_default_cache = CircuitCache()
+
+def get_default_pool():
+    """Return the process-wide simulator pool."""
+    return _default_pool
+
+def get_default_cache():
+    """Return the process-wide prepared circuit cache."""
+    return _default_cache
+
+def run_circuit(circuit, parameters=None, repetitions=1, pool=None, cache=None, engine=DEFAULT_ENGINE):
+    """
+    Run a circuit, reusing its prepared form across calls.
+
+    Args:
+        circuit (cirq.AbstractCircuit): The circuit to run.
+        parameters (dict or cirq.ParamResolver, optional): Values for the circuit's symbols.
+        repetitions (int): Number of times to sample the circuit.
+        pool (SimulatorPool, optional): The pool to borrow from. Defaults to the shared pool.
+        cache (CircuitCache, optional): The prepared circuit cache. Defaults to the shared cache.
+        engine (str): "cirq" for a pooled cirq.Simulator, "numpy" for the NumPy
+            statevector engine, or "auto" to use NumPy for small supported circuits.
+
+    Returns:
+        cirq.Result: The measurement results.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unsupported engine: {engine}")
+    pool = _default_pool if pool is None else pool
+    cache = _default_cache if cache is None else cache
+    if engine != "cirq":
+        compiled = cache.get_compiled(circuit)
+        if compiled is not None and (engine == "numpy" or compiled.num_qubits <= AUTO_MAX_QUBITS):
+            return compiled.run(parameters, repetitions=repetitions)
+        if engine == "numpy":
+            raise statevector.UnsupportedCircuitError("Circuit is not supported by the NumPy engine")
+    prepared = cache.get(circuit)
+    with pool.simulator() as simulator:
+        return simulator.run(prepared, param_resolver=cirq.ParamResolver(parameters), repetitions=repetitions)
+
+def run_sweep(circuit, sweep, repetitions=1, pool=None, cache=None):
+    """
+    Run a circuit over a whole parameter sweep in one batched call.
+
+    Args:
+        circuit (cirq.AbstractCircuit): The circuit to run.
+        sweep (cirq.Sweepable): The parameter sweep, e.g. cirq.Linspace or a cirq.Product.
+        repetitions (int): Number of samples per sweep point.
+        pool (SimulatorPool, optional): The pool to borrow from. Defaults to the shared pool.
+        cache (CircuitCache, optional): The prepared circuit cache. Defaults to the shared cache.
+
+    Returns:
+        list of cirq.Result: One result per sweep point, in sweep order.
+    """
+    pool = _default_pool if pool is None else pool
+    cache = _default_cache if cache is None else cache
+    prepared = cache.get(circuit)
+    with pool.simulator() as simulator:
+        return simulator.run_sweep(prepared, params=sweep, repetitions=repetitions)
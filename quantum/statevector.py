@@ -0,0 +1,234 @@
+# quantum/statevector.py
+
+import logging
+import threading
+import numpy as np
+import cirq
+
+logger = logging.getLogger(__name__)
+
+# Largest circuit the NumPy engine accepts
+MAX_QUBITS = 20
+
+_SQRT_HALF = np.sqrt(0.5)
+FIXED_GATES = {
+    cirq.H: np.array([[_SQRT_HALF, _SQRT_HALF], [_SQRT_HALF, -_SQRT_HALF]], dtype=np.complex128),
+    cirq.X: np.array([[0, 1], [1, 0]], dtype=np.complex128),
+    cirq.Y: np.array([[0, -1j], [1j, 0]], dtype=np.complex128),
+    cirq.Z: np.array([[1, 0], [0, -1]], dtype=np.complex128),
+}
+
+_rng = threading.local()
+
+class UnsupportedCircuitError(ValueError):
+    """Raised when a circuit falls outside what the NumPy engine supports."""
+
+def rotation_matrix(axis, rads):
+    """
+    Build the matrix of cirq.rx, cirq.ry or cirq.rz.
+
+    Args:
+        axis (str): 'x', 'y' or 'z'.
+        rads (float): The rotation angle in radians.
+
+    Returns:
+        numpy.ndarray: The 2x2 complex rotation matrix.
+    """
+    c, s = np.cos(rads / 2), np.sin(rads / 2)
+    if axis == 'x':
+        return np.array([[c, -1j * s], [-1j * s, c]], dtype=np.complex128)
+    if axis == 'y':
+        return np.array([[c, -s], [s, c]], dtype=np.complex128)
+    return np.array([[np.exp(-0.5j * rads), 0], [0, np.exp(0.5j * rads)]], dtype=np.complex128)
+
+def apply_single_qubit(state, matrix, target, num_qubits):
+    """Apply a 2x2 matrix to one qubit; qubit 0 is the most significant bit."""
+    psi = state.reshape(1 << target, 2, 1 << (num_qubits - target - 1))
+    return np.einsum('ij,ajb->aib', matrix, psi).reshape(-1)
+
+def apply_cnot(state, control, target, num_qubits):
+    """Flip ``target`` on the half of the amplitudes where ``control`` is 1, in place."""
+    psi = state.reshape((2,) * num_qubits)
+    index = [slice(None)] * num_qubits
+    index[control] = 1
+    index = tuple(index)
+    axis = target - 1 if target > control else target
+    psi[index] = np.flip(psi[index], axis=axis).copy()
+    return state
+
+def apply_cz(state, control, target, num_qubits):
+    """Negate the amplitudes where both qubits are 1, in place."""
+    psi = state.reshape((2,) * num_qubits)
+    index = [slice(None)] * num_qubits
+    index[control] = 1
+    index[target] = 1
+    psi[tuple(index)] *= -1
+    return state
+
+class CompiledCircuit:
+    """
+    A cirq circuit lowered to a flat list of NumPy gate applications.
+
+    Symbolic rotation angles stay symbolic and are resolved on every run, so one
+    compiled circuit serves every parameter value.
+
+    Attributes:
+        qubits (tuple): The circuit's qubits; the first one is the most significant bit.
+        operations (list): (kind, qubit indices, payload) tuples in execution order.
+        measurements (list): (key, qubit indices, invert mask) tuples.
+    """
+
+    def __init__(self, qubits, operations, measurements):
+        self.qubits = qubits
+        self.operations = operations
+        self.measurements = measurements
+
+    @property
+    def num_qubits(self):
+        return len(self.qubits)
+
+    def final_state(self, parameters=None):
+        """
+        Compute the final state vector, ignoring measurements.
+
+        Args:
+            parameters (dict or cirq.ParamResolver, optional): Values for the circuit's symbols.
+
+        Returns:
+            numpy.ndarray: The complex128 state vector of length 2**num_qubits.
+        """
+        resolver = cirq.ParamResolver(parameters)
+        n = self.num_qubits
+        state = np.zeros(1 << n, dtype=np.complex128)
+        state[0] = 1.0
+        for kind, qubits, payload in self.operations:
+            if kind == "matrix":
+                state = apply_single_qubit(state, payload, qubits[0], n)
+            elif kind == "rotation":
+                axis, exponent = payload
+                rads = float(resolver.value_of(exponent)) * np.pi
+                state = apply_single_qubit(state, rotation_matrix(axis, rads), qubits[0], n)
+            elif kind == "cnot":
+                state = apply_cnot(state, qubits[0], qubits[1], n)
+            else:
+                state = apply_cz(state, qubits[0], qubits[1], n)
+        return state
+
+    def sample(self, parameters=None, repetitions=1, seed=None):
+        """
+        Sample the circuit's measurements.
+
+        Args:
+            parameters (dict or cirq.ParamResolver, optional): Values for the circuit's symbols.
+            repetitions (int): Number of samples.
+            seed (int or numpy.random.Generator, optional): Random seed or generator.
+
+        Returns:
+            dict: Maps each measurement key to an int8 array of shape (repetitions, qubits).
+        """
+        if seed is None:
+            rng = getattr(_rng, "generator", None)
+            if rng is None:
+                rng = _rng.generator = np.random.default_rng()
+        else:
+            rng = np.random.default_rng(seed)
+        if not self.measurements:
+            return {}
+        state = self.final_state(parameters)
+        probabilities = np.abs(state) ** 2
+        probabilities /= probabilities.sum()
+        outcomes = rng.choice(probabilities.size, size=repetitions, p=probabilities)
+        shifts = self.num_qubits - 1 - np.arange(self.num_qubits)
+        bits = ((outcomes[:, None] >> shifts) & 1).astype(np.int8)
+        return {key: bits[:, list(indices)] ^ invert_mask for key, indices, invert_mask in self.measurements}
+
+    def run(self, parameters=None, repetitions=1, seed=None):
+        """
+        Run the circuit and package the samples like cirq.Simulator.run does.
+
+        Returns:
+            cirq.ResultDict: The measurement results.
+        """
+        measurements = self.sample(parameters, repetitions, seed)
+        return cirq.ResultDict(params=cirq.ParamResolver(parameters), measurements=measurements)
+
+def compile_circuit(circuit, max_qubits=MAX_QUBITS):
+    """
+    Lower a cirq circuit to the NumPy engine.
+
+    Supported operations are H, X, Y, Z, rx/ry/rz (possibly symbolic), CNOT, CZ,
+    any other fixed single-qubit gate with a unitary (e.g. PhasedXZ from circuit
+    preparation) and measurements that are not followed by gates on the same qubit.
+
+    Args:
+        circuit (cirq.AbstractCircuit): The circuit to compile.
+        max_qubits (int): The largest circuit to accept.
+
+    Returns:
+        CompiledCircuit: The compiled circuit.
+
+    Raises:
+        UnsupportedCircuitError: If the circuit is too large or uses unsupported operations.
+    """
+    qubits = tuple(sorted(circuit.all_qubits()))
+    if len(qubits) > max_qubits:
+        raise UnsupportedCircuitError(f"{len(qubits)} qubits exceeds the NumPy engine limit of {max_qubits}")
+    index = {qubit: i for i, qubit in enumerate(qubits)}
+    operations = []
+    measurements = []
+    measured = set()
+
+    for op in circuit.all_operations():
+        targets = tuple(index[qubit] for qubit in op.qubits)
+        if measured.intersection(targets):
+            raise UnsupportedCircuitError(f"Operation {op} acts on an already measured qubit")
+        gate = op.gate
+        if isinstance(gate, cirq.MeasurementGate):
+            invert_mask = np.zeros(len(targets), dtype=np.int8)
+            invert_mask[:len(gate.invert_mask)] = gate.invert_mask
+            measurements.append((cirq.measurement_key_name(op), targets, invert_mask))
+            measured.update(targets)
+        elif gate in FIXED_GATES:
+            operations.append(("matrix", targets, FIXED_GATES[gate]))
+        elif isinstance(gate, (cirq.Rx, cirq.Ry, cirq.Rz)):
+            axis = {cirq.Rx: 'x', cirq.Ry: 'y', cirq.Rz: 'z'}[type(gate)]
+            operations.append(("rotation", targets, (axis, gate.exponent)))
+        elif gate == cirq.CNOT:
+            operations.append(("cnot", targets, None))
+        elif gate == cirq.CZ:
+            operations.append(("cz", targets, None))
+        elif len(targets) == 1 and not cirq.is_parameterized(op) and cirq.has_unitary(op):
+            operations.append(("matrix", targets, cirq.unitary(op).astype(np.complex128)))
+        else:
+            raise UnsupportedCircuitError(f"Operation {op} is not supported by the NumPy engine")
+    return CompiledCircuit(qubits, operations, measurements)
+
+def is_supported(circuit, max_qubits=MAX_QUBITS):
+    """Check whether a circuit can run on the NumPy engine."""
+    try:
+        compile_circuit(circuit, max_qubits)
+        return True
+    except UnsupportedCircuitError:
+        return False
+
+def cross_check(circuit, parameters=None, atol=1e-7):
+    """
+    Compare the NumPy engine's final state with cirq.Simulator's, up to global phase.
+
+    Args:
+        circuit (cirq.AbstractCircuit): The circuit to check.
+        parameters (dict or cirq.ParamResolver, optional): Values for the circuit's symbols.
+        atol (float): Absolute tolerance per amplitude.
+
+    Returns:
+        bool: True if both engines agree.
+    """
+    compiled = compile_circuit(circuit)
+    unmeasured = cirq.Circuit(op for op in circuit.all_operations() if not cirq.is_measurement(op))
+    expected = cirq.Simulator(dtype=np.complex128).simulate(
+        unmeasured, param_resolver=cirq.ParamResolver(parameters), qubit_order=compiled.qubits).final_state_vector
+    actual = compiled.final_state(parameters)
+    agree = cirq.allclose_up_to_global_phase(actual, expected, atol=atol)
+    if not agree:
+        logger.warning("NumPy engine disagrees with cirq for circuit:\n%.2048s", circuit)
+    return agree
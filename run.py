@@ -0,0 +1,51 @@
+# quantum_firmware_optimization/run.py
+
+import os
+import runpy
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+# Modules in these directories import each other by bare module name
+SOURCE_DIRS = [os.path.join(PROJECT_ROOT, name) for name in ("src", "scripts", "quantum", "utils")]
+
+def add_source_dirs():
+    """Put the project's source directories at the front of the import path."""
+    for path in reversed(SOURCE_DIRS):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+def entry_points():
+    """
+    List the modules that can be run as entry points.
+
+    Returns:
+        list: Sorted names of the modules with a ``__main__`` block.
+    """
+    names = []
+    for source_dir in SOURCE_DIRS:
+        for file_name in os.listdir(source_dir):
+            if not file_name.endswith(".py") or file_name.startswith("_"):
+                continue
+            with open(os.path.join(source_dir, file_name), encoding="utf-8") as source_file:
+                if 'if __name__ == "__main__":' in source_file.read():
+                    names.append(file_name[:-3])
+    return sorted(names)
+
+def main(argv=None):
+    """
+    Run an entry point with the source directories on the import path.
+
+    Args:
+        argv (list, optional): The entry point's module name followed by its arguments.
+            Defaults to the command line.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print("usage: python run.py <entry point> [arguments...]\n\nentry points:\n  " + "\n  ".join(entry_points()))
+        return
+    add_source_dirs()
+    sys.argv = list(argv)
+    runpy.run_module(argv[0], run_name="__main__", alter_sys=True)
+
+if __name__ == "__main__":
+    main()
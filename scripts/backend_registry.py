@@ -0,0 +1,273 @@
+# quantum_firmware_optimization/scripts/backend_registry.py
+
+import atexit
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL = float(os.environ.get("QFO_BACKEND_REFRESH_INTERVAL", 60.0))
+# Seconds a provider may take per refresh before its previous statuses are kept
+DEFAULT_PROVIDER_TIMEOUT = 15.0
+# Comma-separated provider names, e.g. "local" to run offline
+DEFAULT_PROVIDERS = os.environ.get("QFO_BACKEND_PROVIDERS", "qiskit,cirq,pennylane")
+
+@dataclass(frozen=True)
+class BackendStatus:
+    """
+    Availability of one quantum backend.
+
+    Attributes:
+        name (str): Backend name, e.g. 'ibmq_lima' or 'default.qubit'.
+        provider (str): Name of the provider that reported the backend.
+        available (bool): Whether the backend currently accepts jobs.
+        pending_jobs (int or None): Queue depth, or None if the provider does not report it.
+    """
+    name: str
+    provider: str
+    available: bool = True
+    pending_jobs: Optional[int] = None
+
+@dataclass(frozen=True)
+class BackendSnapshot:
+    """
+    Immutable view of every provider's backends at one refresh.
+
+    Attributes:
+        backends (tuple): BackendStatus entries of every provider.
+        refreshed_at (float): time.time() of the refresh.
+        errors (Mapping): Provider name -> error message for providers whose last
+            refresh failed; their statuses are carried over from the refresh before.
+    """
+    backends: Tuple[BackendStatus, ...] = ()
+    refreshed_at: float = 0.0
+    errors: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    def available(self, provider=None):
+        """Return the available backends, optionally limited to one provider."""
+        return tuple(status for status in self.backends
+                     if status.available and (provider is None or status.provider == provider))
+
+    def has_available(self, provider=None):
+        """Check whether any backend (of ``provider``) is available."""
+        return bool(self.available(provider))
+
+    def least_busy(self, provider=None):
+        """Return the available backend with the shortest queue, or None."""
+        candidates = self.available(provider)
+        if not candidates:
+            return None
+        return min(candidates, key=lambda status: status.pending_jobs if status.pending_jobs is not None else 0)
+
+    @property
+    def age(self):
+        """float: Seconds since the snapshot was taken."""
+        return time.time() - self.refreshed_at
+
+def qiskit_provider():
+    """Report IBM Quantum backends and their queue depth."""
+    from qiskit import IBMQ
+    if not IBMQ.active_account():
+        IBMQ.load_account()  # Load account from disk
+    provider = IBMQ.get_provider(hub='ibm-q')
+    statuses = []
+    for backend in provider.backends():
+        status = backend.status()
+        statuses.append(BackendStatus(backend.name(), "qiskit", bool(status.operational), int(status.pending_jobs)))
+    return statuses
+
+def cirq_provider():
+    """Report the Google devices Cirq knows about; they do not expose a queue depth."""
+    import cirq_google
+    names = [name for name in ("Sycamore", "Sycamore23") if hasattr(cirq_google, name)]
+    return [BackendStatus(name, "cirq") for name in names]
+
+def pennylane_provider():
+    """Report the default PennyLane simulator if a device can be created."""
+    import pennylane as qml
+    qml.device("default.qubit", wires=1)
+    return [BackendStatus("default.qubit", "pennylane", True, 0)]
+
+class LocalProvider:
+    """
+    In-process stand-in provider with statuses the caller controls.
+
+    Useful for running the decision path offline and in tests: register it in place
+    of the network providers and flip availability or queue depth with set_status.
+    """
+
+    def __init__(self, name="local", backends=(("local_simulator", 0),)):
+        self.name = name
+        self._lock = threading.Lock()
+        self._statuses = {backend: BackendStatus(backend, name, True, pending) for backend, pending in backends}
+
+    def set_status(self, backend, available=True, pending_jobs=0):
+        """Add or update one stand-in backend."""
+        with self._lock:
+            self._statuses[backend] = BackendStatus(backend, self.name, available, pending_jobs)
+
+    def remove(self, backend):
+        """Remove one stand-in backend."""
+        with self._lock:
+            self._statuses.pop(backend, None)
+
+    def __call__(self):
+        with self._lock:
+            return list(self._statuses.values())
+
+PROVIDER_FACTORIES = {
+    "qiskit": lambda: qiskit_provider,
+    "cirq": lambda: cirq_provider,
+    "pennylane": lambda: pennylane_provider,
+    "local": LocalProvider,
+}
+
+def providers_from_names(names=DEFAULT_PROVIDERS):
+    """
+    Build a provider mapping from a comma-separated list of names.
+
+    Args:
+        names (str or iterable): Provider names from PROVIDER_FACTORIES.
+
+    Returns:
+        dict: Provider name -> provider callable.
+    """
+    if isinstance(names, str):
+        names = [name.strip() for name in names.split(",") if name.strip()]
+    providers = {}
+    for name in names:
+        if name not in PROVIDER_FACTORIES:
+            raise ValueError(f"Unknown backend provider: {name}")
+        providers[name] = PROVIDER_FACTORIES[name]()
+    return providers
+
+class BackendRegistry:
+    """
+    Caches backend availability and queue depth, refreshed in the background.
+
+    Providers are callables returning a list of BackendStatus. A refresh calls all
+    of them concurrently; a provider that fails or exceeds ``provider_timeout`` keeps
+    the statuses from its previous refresh and its error is recorded in the snapshot.
+    Decisions read ``snapshot()``, which never touches the network once the first
+    refresh has completed.
+
+    Attributes:
+        providers (dict): Provider name -> provider callable.
+        interval (float): Seconds between background refreshes.
+        provider_timeout (float): Seconds to wait for each provider per refresh.
+    """
+
+    def __init__(self, providers=None, interval=DEFAULT_REFRESH_INTERVAL, provider_timeout=DEFAULT_PROVIDER_TIMEOUT):
+        self.providers = dict(providers) if providers is not None else providers_from_names()
+        self.interval = interval
+        self.provider_timeout = provider_timeout
+        self._snapshot = None
+        self._by_provider = {}
+        # Provider calls still running from an earlier refresh are awaited, not repeated
+        self._pending = {}
+        self._refresh_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self.providers)), thread_name_prefix="backend-provider")
+        self._stop = threading.Event()
+        self._thread = None
+
+    def refresh(self):
+        """
+        Query every provider once and publish a new snapshot.
+
+        Returns:
+            BackendSnapshot: The new snapshot.
+        """
+        with self._refresh_lock:
+            futures = {}
+            for name, provider in self.providers.items():
+                pending = self._pending.get(name)
+                futures[name] = pending if pending is not None and not pending.done() else self._executor.submit(provider)
+            self._pending = futures
+            deadline = time.monotonic() + self.provider_timeout
+            errors = {}
+            for name, future in futures.items():
+                try:
+                    self._by_provider[name] = tuple(future.result(timeout=max(0.0, deadline - time.monotonic())))
+                except FutureTimeoutError:
+                    errors[name] = f"timed out after {self.provider_timeout}s"
+                except Exception as e:
+                    errors[name] = str(e) or type(e).__name__
+                if name in errors:
+                    logger.warning("Backend provider %s failed, keeping its previous statuses: %s", name, errors[name])
+            backends = tuple(status for name in self.providers for status in self._by_provider.get(name, ()))
+            self._snapshot = BackendSnapshot(backends, time.time(), MappingProxyType(errors))
+            logger.debug("Backend snapshot refreshed: %d backends, %d provider errors", len(backends), len(errors))
+            return self._snapshot
+
+    def snapshot(self):
+        """Return the latest snapshot, refreshing synchronously only if there is none yet."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        return snapshot
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Error refreshing backend registry: {e}")
+
+    def start(self):
+        """Take a first snapshot if needed and start the background refresh thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self.snapshot()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="backend-registry", daemon=True)
+        self._thread.start()
+        logger.info(f"Backend registry started with a {self.interval}s refresh interval")
+        return self
+
+    def stop(self):
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.provider_timeout + 1.0)
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+def get_backend_registry():
+    """Return the process-wide backend registry, starting it on first use."""
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = BackendRegistry().start()
+                atexit.register(_default_registry.stop)
+    return _default_registry
+
+def set_backend_registry(registry):
+    """Replace the process-wide backend registry, e.g. with local stand-ins for tests."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is not None:
+            _default_registry.stop()
+        _default_registry = registry
+
+if __name__ == "__main__":
+    with BackendRegistry(providers_from_names(DEFAULT_PROVIDERS), interval=5.0) as registry:
+        snapshot = registry.snapshot()
+        for status in snapshot.backends:
+            print(f"{status.provider}/{status.name}: available={status.available} pending_jobs={status.pending_jobs}")
+        for provider, error in snapshot.errors.items():
+            print(f"{provider}: {error}")
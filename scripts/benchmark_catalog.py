@@ -0,0 +1,104 @@
+# quantum_firmware_optimization/scripts/benchmark_catalog.py
+
+import argparse
+import json
+import logging
+import os
+import time
+import numpy as np
+import pandas as pd
+from catalog_cache import DATA_DIR
+from hardware_catalog import load_catalog
+from normalization import normalize_frame
+
+logger = logging.getLogger(__name__)
+
+# (table, equality conditions, range conditions in canonical units) typical of hardware selection
+QUERIES = {
+    "cpu_by_socket_and_tdp": ("CPUData", {"Socket": "AM4"}, {"TDP": (None, 65.0)}),
+    "cpu_by_producer_and_clock": ("CPUData", {"Producer": "Intel"}, {"Base Clock": (3.0e9, None), "Price": (None, 400.0)}),
+    "motherboard_by_socket_and_memory": ("MotherboardData", {"Socket": "AM4", "Memory Type": "DDR4"}, {"Price": (100.0, 200.0)}),
+    "motherboard_by_chipset": ("MotherboardData", {"Chipset": "B550"}, {}),
+    "ram_by_capacity": ("RAMData", {"Memory Type": "DDR5"}, {"Size": (32e9, None)}),
+    "gpu_by_vram_and_tdp": ("GPUData", {}, {"Vram": (8e9, None), "TDP": (None, 200.0)}),
+    "psu_by_wattage": ("PSUData", {}, {"Watt": (650.0, 850.0)}),
+    "part_by_mpn": ("CPUData", {"MPN": "100-100000065BOX"}, {}),
+}
+
+def scan(frame, equals, ranges):
+    """The pandas way: one boolean mask per condition over every row."""
+    mask = np.ones(len(frame), dtype=bool)
+    for column, value in equals.items():
+        mask &= (frame[column].astype(str).str.strip().str.casefold() == value.casefold()).to_numpy()
+    for column, (low, high) in ranges.items():
+        values = frame[column].to_numpy(dtype=np.float64)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+    return np.flatnonzero(mask)
+
+def load_frame(csv_path, table):
+    """Read and normalize a CSV with pandas, deriving RAMData's 'Memory Type' as the catalog does."""
+    frame = normalize_frame(pd.read_csv(csv_path, dtype=str, encoding="utf-8-sig"), dataset=table)
+    if "Memory Type" not in frame and "Ram Type" in frame:
+        frame["Memory Type"] = frame["Ram Type"].str.split("-", n=1).str[0]
+    return frame
+
+def latencies_us(fn, repeat):
+    """Return the p50 and p95 latency of ``repeat`` calls in microseconds."""
+    times = np.empty(repeat)
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times[i] = time.perf_counter() - start
+    return float(np.percentile(times, 50) * 1e6), float(np.percentile(times, 95) * 1e6)
+
+def benchmark_catalog(data_dir=DATA_DIR, repeat=1000, reload_repeat=5):
+    """
+    Time each query of QUERIES on the indexed catalog, on a pandas frame already in
+    memory, and with the CSV reloaded and scanned as before.
+
+    Args:
+        data_dir (str): Directory with the CSV files.
+        repeat (int): Calls per indexed and in-memory scan measurement.
+        reload_repeat (int): Calls per reload-and-scan measurement.
+
+    Returns:
+        dict: The catalog load time and per-query latencies and match counts.
+    """
+    start = time.perf_counter()
+    catalog = load_catalog(data_dir)
+    report = {"load_seconds": time.perf_counter() - start, "queries": {}}
+    for name, (table, equals, ranges) in QUERIES.items():
+        csv_path = os.path.join(data_dir, f"{table}.csv")
+        frame = load_frame(csv_path, table)
+        rows = catalog.query(table, equals, ranges)
+        expected = scan(frame, equals, ranges)
+        if not np.array_equal(rows, expected):
+            raise AssertionError(f"{name}: indexed query returned {len(rows)} rows, the scan {len(expected)}")
+
+        indexed = latencies_us(lambda: catalog.query(table, equals, ranges), repeat)
+        in_memory = latencies_us(lambda: scan(frame, equals, ranges), max(1, repeat // 10))
+        reload = latencies_us(lambda: scan(load_frame(csv_path, table), equals, ranges), reload_repeat)
+        report["queries"][name] = {
+            "matches": len(rows),
+            "indexed_p50_us": indexed[0],
+            "indexed_p95_us": indexed[1],
+            "pandas_scan_p50_us": in_memory[0],
+            "reload_and_scan_p50_us": reload[0],
+        }
+        logger.info("%s: %s", name, report["queries"][name])
+    return report
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="benchmark_catalog.log")
+
+    parser = argparse.ArgumentParser(description="Benchmark indexed catalog queries against pandas scans.")
+    parser.add_argument('--data_dir', type=str, default=DATA_DIR, help='Directory with the CSV files')
+    parser.add_argument('--repeat', type=int, default=1000, help='Calls per indexed query measurement')
+    parser.add_argument('--reload_repeat', type=int, default=5, help='Calls per reload-and-scan measurement')
+    args = parser.parse_args()
+
+    print(json.dumps(benchmark_catalog(args.data_dir, args.repeat, args.reload_repeat), indent=4))
@@ -0,0 +1,94 @@
+# quantum_firmware_optimization/scripts/benchmark_logging.py
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+import numpy as np
+from hybrid_processing import hybrid_processing
+from routing_plan import RoutingPlan
+from logging_setup import DEFAULT_FORMAT, configure_logging, shutdown_logging
+
+logger = logging.getLogger(__name__)
+
+TASK_DESCRIPTION = "Sort a list of numbers"
+
+class StubModel:
+    """Classical model stand-in that returns a fixed predictions array."""
+
+    def __init__(self, size):
+        self.predictions = np.random.default_rng(42).random(size)
+
+    def predict(self, data):
+        return self.predictions
+
+def configure_sync(log_file):
+    """Reproduce the previous setup: a synchronous FileHandler on the root logger."""
+    shutdown_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging.FileHandler(log_file)
+    handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    return handler
+
+def time_calls(calls, model, plan):
+    """Return the mean wall time in microseconds of one hybrid_processing call."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        hybrid_processing(TASK_DESCRIPTION, None, model=model, plan=plan)
+    return (time.perf_counter() - start) / calls * 1e6
+
+def benchmark_logging(calls=10000, payload_size=10000):
+    """
+    Measure the per-call logging overhead of hybrid_processing on the classical path.
+
+    Args:
+        calls (int): Number of hybrid_processing calls per mode.
+        payload_size (int): Length of the predictions array that gets logged.
+
+    Returns:
+        dict: Mean microseconds per call for each logging mode.
+    """
+    model = StubModel(payload_size)
+    plan = RoutingPlan(TASK_DESCRIPTION, "Classical", "benchmark")
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_file = os.path.join(tmp_dir, "benchmark.log")
+
+        configure_logging(level="WARNING", log_file=None, console=False)
+        results["disabled"] = time_calls(calls, model, plan)
+
+        handler = configure_sync(log_file)
+        results["sync_file_handler"] = time_calls(calls, model, plan)
+        # The old hot path formatted the whole array eagerly in the calling thread
+        start = time.perf_counter()
+        for _ in range(calls):
+            logger.info(f"Classical model predictions: {model.predict(None)}")
+        results["sync_eager_fstring_only"] = (time.perf_counter() - start) / calls * 1e6
+        logging.getLogger().removeHandler(handler)
+        handler.close()
+
+        configure_logging(level="INFO", log_file=log_file, console=False)
+        results["async_queue_handler"] = time_calls(calls, model, plan)
+        flush_start = time.perf_counter()
+        shutdown_logging()
+        results["async_drain_seconds"] = time.perf_counter() - flush_start
+
+    results["overhead_vs_disabled_us"] = {
+        mode: results[mode] - results["disabled"] for mode in ("sync_file_handler", "async_queue_handler")
+    }
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-call logging overhead on hybrid_processing.")
+    parser.add_argument('--calls', type=int, default=10000, help='Number of calls per logging mode')
+    parser.add_argument('--payload_size', type=int, default=10000, help='Length of the logged predictions array')
+    args = parser.parse_args()
+
+    print(json.dumps(benchmark_logging(args.calls, args.payload_size), indent=4))
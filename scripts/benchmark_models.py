@@ -0,0 +1,196 @@
+# quantum_firmware_optimization/scripts/benchmark_models.py
+
+import argparse
+import glob
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from catalog_cache import DATA_DIR
+from model_registry import MODELS_DIR
+from train_model import ALGORITHMS, get_model_and_grid, load_data, numeric_features, preprocess_data, split_data
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE_PATH = os.path.join(MODELS_DIR, "benchmark_models_baseline.json")
+# Label column train_model predicts; datasets without it are skipped
+LABEL_COLUMN = 'Producer'
+# Metrics compared against the baseline; lower is better for all of them
+COMPARED_METRICS = ("fit_seconds", "single_predict_p50_ms", "single_predict_p95_ms", "batch_predict_ms",
+                    "peak_rss_mb", "model_bytes")
+
+def _rss_mb():
+    """Peak RSS of this process so far in MiB (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+def measure(data_path, algorithm, single_calls=200, fit_repeat=3):
+    """
+    Fit and time one algorithm on one dataset, in the calling process.
+
+    Run it in a fresh process (see benchmark_models) so the peak RSS belongs to
+    this dataset and algorithm alone.
+
+    Returns:
+        dict: Fit time, single-row and batch predict latency, peak RSS, serialized
+        model size and test accuracy.
+    """
+    import joblib
+
+    features, labels = preprocess_data(load_data(data_path))
+    known = labels.notna()
+    X_train, X_test, y_train, y_test = split_data(numeric_features(features[known]), labels[known].astype(str))
+    X_train, X_test = X_train.to_numpy(), X_test.to_numpy()
+    rss_before_fit = _rss_mb()
+
+    fit_times = []
+    for _ in range(fit_repeat):
+        model, _ = get_model_and_grid(algorithm)
+        start = time.perf_counter()
+        model.fit(X_train, y_train)
+        fit_times.append(time.perf_counter() - start)
+
+    single = np.empty(single_calls)
+    rows = X_test[np.arange(single_calls) % len(X_test)]
+    for i in range(single_calls):
+        start = time.perf_counter()
+        model.predict(rows[i:i + 1])
+        single[i] = time.perf_counter() - start
+
+    batch_times = []
+    for _ in range(fit_repeat):
+        start = time.perf_counter()
+        predictions = model.predict(X_test)
+        batch_times.append(time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_path = os.path.join(tmpdir, "model.joblib")
+        joblib.dump(model, model_path)
+        model_bytes = os.path.getsize(model_path)
+
+    peak_rss = _rss_mb()
+    return {
+        "train_rows": len(X_train),
+        "test_rows": len(X_test),
+        "features": X_train.shape[1],
+        "classes": len(np.unique(y_train)),
+        "fit_seconds": float(np.median(fit_times)),
+        "single_predict_p50_ms": float(np.percentile(single, 50) * 1e3),
+        "single_predict_p95_ms": float(np.percentile(single, 95) * 1e3),
+        "batch_predict_ms": float(np.median(batch_times) * 1e3),
+        "batch_predict_us_per_row": float(np.median(batch_times) / len(X_test) * 1e6),
+        "peak_rss_mb": peak_rss,
+        "fit_rss_delta_mb": peak_rss - rss_before_fit,
+        "model_bytes": model_bytes,
+        "accuracy": float(np.mean(predictions == y_test.to_numpy())),
+    }
+
+def benchmarkable(data_path, min_rows=20):
+    """Check that a dataset has the label column, enough rows and at least two labels."""
+    with open(data_path, encoding="utf-8-sig") as f:
+        header = f.readline().strip().split(",")
+    if LABEL_COLUMN not in header:
+        return False
+    labels = load_data(data_path)[LABEL_COLUMN].dropna()
+    return len(labels) >= min_rows and labels.nunique() >= 2
+
+def benchmark_models(data_paths, algorithms=ALGORITHMS, single_calls=200, fit_repeat=3):
+    """
+    Measure every algorithm on every dataset, each pair in a fresh spawned process.
+
+    Args:
+        data_paths (iterable): Catalog CSVs; those without a Producer label are skipped.
+        algorithms (iterable): Algorithms from train_model.ALGORITHMS.
+        single_calls (int): Single-row predict calls per pair.
+        fit_repeat (int): Fits and batch predicts per pair; the median is reported.
+
+    Returns:
+        dict: dataset file name -> algorithm -> metrics.
+    """
+    report = {}
+    context = multiprocessing.get_context("spawn")
+    for data_path in data_paths:
+        name = os.path.basename(data_path)
+        if not benchmarkable(data_path):
+            logger.info(f"Skipping {name}: no {LABEL_COLUMN} label to predict")
+            continue
+        report[name] = {}
+        for algorithm in algorithms:
+            # One task per worker: ru_maxrss never goes down, so each pair needs its own process
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                metrics = executor.submit(measure, data_path, algorithm, single_calls, fit_repeat).result()
+            report[name][algorithm] = metrics
+            logger.info("%s %s: %s", name, algorithm, metrics)
+    return report
+
+def compare_to_baseline(report, baseline, tolerance=1.25):
+    """
+    Compare a report with a baseline report.
+
+    Args:
+        report (dict): Current benchmark_models report.
+        baseline (dict): A previous report.
+        tolerance (float): A metric regresses when it exceeds ``tolerance`` times its baseline.
+
+    Returns:
+        tuple: (ratios, regressions); ratios maps dataset -> algorithm -> metric ->
+        current/baseline, and regressions lists "dataset/algorithm/metric" entries.
+    """
+    ratios = {}
+    regressions = []
+    for dataset, algorithms in report.items():
+        for algorithm, metrics in algorithms.items():
+            reference = baseline.get(dataset, {}).get(algorithm)
+            if not reference:
+                continue
+            for metric in COMPARED_METRICS:
+                if not reference.get(metric):
+                    continue
+                ratio = metrics[metric] / reference[metric]
+                ratios.setdefault(dataset, {}).setdefault(algorithm, {})[metric] = ratio
+                if ratio > tolerance:
+                    regressions.append(f"{dataset}/{algorithm}/{metric}")
+    return ratios, regressions
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="benchmark_models.log")
+
+    parser = argparse.ArgumentParser(description="Benchmark training and inference cost of the supported algorithms.")
+    parser.add_argument('--data_paths', type=str, nargs='+', default=sorted(glob.glob(os.path.join(DATA_DIR, "*.csv"))), help='Dataset CSV files')
+    parser.add_argument('--algorithms', type=str, nargs='+', default=list(ALGORITHMS), choices=ALGORITHMS, help='Algorithms to benchmark')
+    parser.add_argument('--single_calls', type=int, default=200, help='Single-row predict calls per algorithm and dataset')
+    parser.add_argument('--fit_repeat', type=int, default=3, help='Fits and batch predicts per algorithm and dataset')
+    parser.add_argument('--report_path', type=str, default=None, help='Write the JSON report to this file')
+    parser.add_argument('--baseline_path', type=str, default=DEFAULT_BASELINE_PATH, help='Baseline report to compare against')
+    parser.add_argument('--update_baseline', action='store_true', help='Store this report as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=1.25, help='Fail if a metric exceeds this multiple of its baseline')
+    args = parser.parse_args()
+
+    report = benchmark_models(args.data_paths, args.algorithms, args.single_calls, args.fit_repeat)
+    output = {"results": report}
+    regressions = []
+    if os.path.exists(args.baseline_path) and not args.update_baseline:
+        with open(args.baseline_path) as f:
+            baseline = json.load(f)
+        output["baseline_ratios"], regressions = compare_to_baseline(report, baseline.get("results", baseline), args.tolerance)
+        output["regressions"] = regressions
+    if args.report_path:
+        with open(args.report_path, 'w') as f:
+            json.dump(output, f, indent=4)
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline_path)), exist_ok=True)
+        with open(args.baseline_path, 'w') as f:
+            json.dump({"results": report}, f, indent=4)
+        logger.info(f"Baseline written to {args.baseline_path}")
+    print(json.dumps(output, indent=4))
+
+    if regressions:
+        logger.error(f"{len(regressions)} metric(s) regressed beyond {args.tolerance}x the baseline: {', '.join(regressions)}")
+        sys.exit(1)
@@ -0,0 +1,78 @@
+# quantum_firmware_optimization/scripts/benchmark_normalization.py
+
+import argparse
+import glob
+import json
+import logging
+import os
+import time
+import pandas as pd
+from catalog_cache import DATA_DIR
+from normalization import clear_cache, dataset_name, normalize_frame
+
+logger = logging.getLogger(__name__)
+
+LEGACY_NUMERIC_COLUMNS = ['Price', 'TDP', 'Boost Clock', 'Base Clock', 'Turbo Clock', 'Watt', 'Capacity', 'Memory', 'Size']
+
+def legacy_normalize(data):
+    """The previous preprocess_data loop: strip non-digits column by column."""
+    data = data.copy()
+    for column in data.columns:
+        if column in LEGACY_NUMERIC_COLUMNS:
+            data[column] = data[column].replace('[^0-9.]', '', regex=True)
+            data[column] = pd.to_numeric(data[column], errors='coerce')
+    return data
+
+def time_ms(fn, repeat):
+    """Return the best wall time of ``repeat`` calls in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+def benchmark_normalization(data_dir=DATA_DIR, repeat=5):
+    """
+    Time normalization of every CSV in ``data_dir``, parsed as raw strings.
+
+    Args:
+        data_dir (str): Directory with the CSV files.
+        repeat (int): Calls per measurement; the best one is reported.
+
+    Returns:
+        dict: Per-dataset timings in milliseconds and the normalized column count.
+    """
+    report = {}
+    for csv_path in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+        raw = pd.read_csv(csv_path, dtype=str, encoding="utf-8-sig")
+        raw.attrs["dataset"] = dataset_name(csv_path)
+
+        def cold():
+            clear_cache()
+            normalize_frame(raw)
+
+        report[os.path.basename(csv_path)] = {
+            "rows": len(raw),
+            "normalized_columns": len(normalize_frame(raw).attrs["units"]),
+            "legacy_regex_ms": time_ms(lambda: legacy_normalize(raw), repeat),
+            "vectorized_cold_ms": time_ms(cold, repeat),
+            "vectorized_cached_ms": time_ms(lambda: normalize_frame(raw), repeat),
+        }
+        logger.info("%s: %s", csv_path, report[os.path.basename(csv_path)])
+    report["total"] = {
+        key: sum(entry[key] for entry in report.values())
+        for key in ("rows", "normalized_columns", "legacy_regex_ms", "vectorized_cold_ms", "vectorized_cached_ms")
+    }
+    return report
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="benchmark_normalization.log")
+
+    parser = argparse.ArgumentParser(description="Benchmark unit normalization on the catalog CSVs.")
+    parser.add_argument('--data_dir', type=str, default=DATA_DIR, help='Directory with the CSV files')
+    parser.add_argument('--repeat', type=int, default=5, help='Calls per measurement')
+    args = parser.parse_args()
+
+    print(json.dumps(benchmark_normalization(args.data_dir, args.repeat), indent=4))
@@ -0,0 +1,59 @@
+# quantum_firmware_optimization/scripts/benchmark_search.py
+
+import argparse
+import json
+import logging
+import os
+from catalog_cache import DATA_DIR
+from train_model import ALGORITHMS, load_data, numeric_features, preprocess_data, search_model, split_data
+
+logger = logging.getLogger(__name__)
+
+def benchmark_search(data_path, algorithms=ALGORITHMS, strategies=("grid", "halving"), n_jobs=-1):
+    """
+    Time the serial grid search against parallel searches for each algorithm.
+
+    Args:
+        data_path (str): Catalog CSV to train on.
+        algorithms (iterable): Algorithms to search.
+        strategies (iterable): Strategies to run on ``n_jobs``; a serial grid search
+            is always run first as the baseline.
+        n_jobs (int): Parallel fits for the strategies under test.
+
+    Returns:
+        dict: Per-algorithm wall time, CPU time, CPU utilization, fit counts and best
+        score of each run.
+    """
+    features, labels = preprocess_data(load_data(data_path))
+    known = labels.notna()
+    X_train, _, y_train, _ = split_data(numeric_features(features[known]), labels[known].astype(str))
+    report = {}
+    for algorithm in algorithms:
+        runs = {}
+        for name, strategy, jobs in [("serial_grid", "grid", 1)] + [(f"parallel_{s}", s, n_jobs) for s in strategies]:
+            result = search_model(X_train, y_train, algorithm, search_strategy=strategy, n_jobs=jobs)
+            runs[name] = {
+                key: result.stats[key]
+                for key in ("n_jobs", "fits", "wall_seconds", "cpu_seconds", "cpu_utilization")
+            }
+            runs[name]["best_score"] = result.best_score
+            runs[name]["best_params"] = result.best_params
+        runs["speedup"] = {
+            name: runs["serial_grid"]["wall_seconds"] / run["wall_seconds"]
+            for name, run in runs.items() if name != "serial_grid"
+        }
+        report[algorithm] = runs
+        logger.info("%s: %s", algorithm, runs)
+    return report
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="benchmark_search.log")
+
+    parser = argparse.ArgumentParser(description="Benchmark serial and parallel hyperparameter searches.")
+    parser.add_argument('--data_path', type=str, default=os.path.join(DATA_DIR, "CPUData.csv"), help='Path to the dataset CSV file')
+    parser.add_argument('--algorithms', type=str, nargs='+', default=list(ALGORITHMS), choices=ALGORITHMS, help='Algorithms to search')
+    parser.add_argument('--n_jobs', type=int, default=-1, help='Parallel fits for the parallel searches')
+    args = parser.parse_args()
+
+    print(json.dumps(benchmark_search(args.data_path, args.algorithms, n_jobs=args.n_jobs), indent=4, default=str))
@@ -0,0 +1,90 @@
+# quantum_firmware_optimization/scripts/benchmark_startup.py
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+
+logger = logging.getLogger(__name__)
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+HEAVY_MODULES = ['tensorflow', 'tensorflow_quantum', 'cirq', 'pennylane', 'qiskit']
+
+# Executed in a fresh interpreter so every run is a true cold start
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+from resource_allocation import allocate_resources
+imported = time.perf_counter()
+decision = allocate_resources({task!r})
+decided = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": imported - start,
+    "decision_seconds": decided - start,
+    "decision": decision,
+    "heavy_modules": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+def run_once(task_description):
+    """
+    Measure one cold start, from interpreter launch to the first routing decision.
+
+    Args:
+        task_description (str): The task description to route.
+
+    Returns:
+        dict: Timings, the routing decision and the heavy modules that were imported.
+    """
+    code = PROBE.format(task=task_description, heavy=HEAVY_MODULES)
+    env = dict(os.environ, PYTHONPATH=SRC_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def benchmark_startup(task_description, repeat=5):
+    """
+    Run the cold start probe several times and summarize the results.
+
+    Args:
+        task_description (str): The task description to route.
+        repeat (int): Number of cold starts to measure.
+
+    Returns:
+        dict: Median and max timings plus the heavy modules seen across runs.
+    """
+    runs = [run_once(task_description) for _ in range(repeat)]
+    decision_times = [run["decision_seconds"] for run in runs]
+    summary = {
+        "runs": repeat,
+        "median_import_seconds": statistics.median(run["import_seconds"] for run in runs),
+        "median_decision_seconds": statistics.median(decision_times),
+        "max_decision_seconds": max(decision_times),
+        "decision": runs[-1]["decision"],
+        "heavy_modules": sorted({m for run in runs for m in run["heavy_modules"]}),
+    }
+    logger.info(f"Startup benchmark: {summary}")
+    return summary
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="benchmark_startup.log")
+
+    parser = argparse.ArgumentParser(description="Benchmark cold start time up to the first routing decision.")
+    parser.add_argument('--task_description', type=str, default='Optimize the portfolio using quantum methods', help='Task description to route')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of cold starts to measure')
+    parser.add_argument('--max_seconds', type=float, default=None, help='Fail if the median decision time exceeds this budget')
+    args = parser.parse_args()
+
+    summary = benchmark_startup(args.task_description, repeat=args.repeat)
+    print(json.dumps(summary, indent=4))
+
+    if summary["heavy_modules"]:
+        logger.error(f"Heavy backends imported before the first routing decision: {summary['heavy_modules']}")
+        sys.exit(1)
+    if args.max_seconds is not None and summary["median_decision_seconds"] > args.max_seconds:
+        logger.error(f"Median decision time {summary['median_decision_seconds']:.3f}s exceeds budget of {args.max_seconds}s")
+        sys.exit(1)
@@ -0,0 +1,93 @@
+# quantum_firmware_optimization/scripts/benchmark_statevector.py
+
+import argparse
+import json
+import logging
+import time
+import numpy as np
+import cirq
+import sympy
+import statevector
+
+logger = logging.getLogger(__name__)
+
+def hadamard_circuit():
+    """The single-qubit H circuit from quantum_circuit.create_and_simulate."""
+    qubit = cirq.GridQubit(0, 0)
+    return cirq.Circuit(cirq.H(qubit), cirq.measure(qubit, key='result')), {}
+
+def parametric_circuit():
+    """The Ry + H circuit from quantum_circuit.create_parametric_and_simulate."""
+    qubit = cirq.GridQubit(0, 0)
+    circuit = cirq.Circuit(cirq.ry(sympy.Symbol('theta')).on(qubit), cirq.H(qubit), cirq.measure(qubit, key='result'))
+    return circuit, {'theta': 0.5}
+
+def layered_circuit(num_qubits, layers, seed=42):
+    """A brickwork circuit of random rotations and CNOT/CZ entanglers."""
+    rng = np.random.default_rng(seed)
+    qubits = cirq.LineQubit.range(num_qubits)
+    circuit = cirq.Circuit()
+    for layer in range(layers):
+        circuit.append(cirq.H(q) if rng.random() < 0.3 else cirq.rx(rng.uniform(0, np.pi)).on(q) for q in qubits)
+        entangler = cirq.CNOT if layer % 2 == 0 else cirq.CZ
+        circuit.append(entangler(a, b) for a, b in zip(qubits[layer % 2::2], qubits[layer % 2 + 1::2]))
+    circuit.append(cirq.measure(*qubits, key='result'))
+    return circuit, {}
+
+def time_per_call(fn, calls):
+    """Return the mean wall time of one call in microseconds."""
+    fn()
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+def benchmark_statevector(calls=200, repetitions=100):
+    """
+    Compare per-call latency of the NumPy engine and cirq.Simulator.
+
+    Each circuit is also cross-checked against cirq before it is timed.
+
+    Args:
+        calls (int): Number of timed calls per engine and circuit.
+        repetitions (int): Samples drawn per call.
+
+    Returns:
+        dict: Per-circuit latencies in microseconds, speedup and cross-check verdict.
+    """
+    circuits = {
+        "hadamard_1q": hadamard_circuit(),
+        "parametric_1q": parametric_circuit(),
+        "layered_8q": layered_circuit(8, 8),
+        "layered_16q": layered_circuit(16, 4),
+        "layered_20q": layered_circuit(20, 2),
+    }
+    simulator = cirq.Simulator()
+    report = {}
+    for name, (circuit, parameters) in circuits.items():
+        compiled = statevector.compile_circuit(circuit)
+        resolver = cirq.ParamResolver(parameters)
+        engine_calls = max(1, calls // (1 << max(0, compiled.num_qubits - 12)))
+        numpy_us = time_per_call(lambda: compiled.run(parameters, repetitions=repetitions), engine_calls)
+        cirq_us = time_per_call(lambda: simulator.run(circuit, param_resolver=resolver, repetitions=repetitions), engine_calls)
+        report[name] = {
+            "qubits": compiled.num_qubits,
+            "calls": engine_calls,
+            "numpy_us": numpy_us,
+            "cirq_us": cirq_us,
+            "speedup": cirq_us / numpy_us,
+            "cross_check": statevector.cross_check(circuit, parameters, atol=1e-5),
+        }
+        logger.info("%s: %s", name, report[name])
+    return report
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="benchmark_statevector.log")
+
+    parser = argparse.ArgumentParser(description="Benchmark the NumPy statevector engine against cirq.Simulator.")
+    parser.add_argument('--calls', type=int, default=200, help='Timed calls per engine and circuit')
+    parser.add_argument('--repetitions', type=int, default=100, help='Samples drawn per call')
+    args = parser.parse_args()
+
+    print(json.dumps(benchmark_statevector(args.calls, args.repetitions), indent=4))
@@ -0,0 +1,330 @@
+# quantum_firmware_optimization/scripts/catalog_cache.py
+
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.environ.get("QFO_DATA_DIR", os.path.join(PROJECT_ROOT, "data"))
+CACHE_DIR = os.environ.get("QFO_CATALOG_CACHE_DIR", os.path.join(DATA_DIR, ".cache"))
+# Bump when the on-disk layout or the column typing rules change
+CACHE_FORMAT = 1
+
+# Identifier columns stay strings even when every value looks like a number
+STRING_COLUMNS = frozenset({"MPN", "EAN", "UPC", "POSTAL_CODE"})
+# Share of the values containing a digit that must parse for a column to be stored
+# as numbers; values without any digit (e.g. a bare "GHz") become missing values
+MIN_PARSED_FRACTION = 0.95
+# "3.7 GHz", "159 mm", "$64.54 USD", '23.8"': an optional $, a number and a unit
+UNIT_PATTERN = r'^\s*\$?\s*(?P<value>-?\d+(?:\.\d+)?)\s*(?P<unit>[A-Za-z%"]+(?: [A-Za-z]+)?)?\s*$'
+
+def file_digest(path, chunk_size=1 << 20):
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def table_name(csv_path):
+    """Cache name of a CSV: its stem plus a short hash of its absolute path."""
+    csv_path = os.path.abspath(csv_path)
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return f"{stem}-{hashlib.sha1(csv_path.encode()).hexdigest()[:8]}"
+
+def encode_strings(values):
+    """Pack strings into one UTF-8 byte blob plus int64 offsets, both memory-mappable."""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+def decode_strings(blob, offsets):
+    """Inverse of encode_strings: return an object array of Python strings."""
+    data = blob.tobytes()
+    bounds = offsets.tolist()
+    if data.isascii():
+        # Byte offsets are character offsets, so decode once and slice
+        text = data.decode("ascii")
+        strings = [text[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+    else:
+        strings = [data[start:end].decode("utf-8") for start, end in zip(bounds[:-1], bounds[1:])]
+    result = np.empty(len(strings), dtype=object)
+    result[:] = strings
+    return result
+
+def type_column(name, series):
+    """
+    Decide how a raw string column is stored.
+
+    Returns:
+        tuple: (kind, payload, unit) where kind is 'int', 'float', 'bool' or
+        'category'. Numbers with a single consistent unit become floats and the
+        unit is returned alongside; everything else is dictionary-encoded.
+    """
+    values = series.dropna()
+    if name not in STRING_COLUMNS and len(values):
+        if values.isin(("True", "False")).all() and len(values) == len(series):
+            return "bool", (series == "True").to_numpy(), None
+        numbers = pd.to_numeric(values, errors="coerce")
+        if numbers.notna().all():
+            numbers = pd.to_numeric(series, errors="coerce")
+            if len(values) == len(series) and (numbers % 1 == 0).all():
+                return "int", numbers.to_numpy(dtype=np.int64), None
+            return "float", numbers.to_numpy(dtype=np.float64), None
+        parsed = series.str.extract(UNIT_PATTERN)
+        matched = parsed["value"].notna()
+        units = parsed.loc[matched, "unit"].fillna("").unique()
+        with_digits = values.str.contains(r"\d").sum()
+        if matched.any() and matched.sum() >= MIN_PARSED_FRACTION * with_digits and len(units) == 1:
+            if matched.sum() < len(values):
+                logger.debug("Column %s: %d unparseable value(s) stored as missing", name, len(values) - matched.sum())
+            numbers = pd.to_numeric(parsed["value"], errors="coerce")
+            return "float", numbers.to_numpy(dtype=np.float64), units[0] or None
+    if not len(values):
+        return "float", np.full(len(series), np.nan), None
+    codes, categories = pd.factorize(series, use_na_sentinel=True)
+    return "category", (codes.astype(np.int32), list(categories)), None
+
+def _load_manifest(path):
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+        return manifest if manifest.get("format") == CACHE_FORMAT else None
+    except (OSError, ValueError):
+        return None
+
+def _write_json(path, payload):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
+
+def compile_csv(csv_path, cache_dir=CACHE_DIR, force=False):
+    """
+    Compile a CSV into the typed columnar cache unless the cache is already current.
+
+    Each column is stored as .npy files in a new, uniquely named directory; a JSON
+    manifest next to it points at the current directory and records the source's
+    size, mtime and hash. The manifest is replaced atomically after the columns are
+    written, so readers never see a half-built table, and a directory is never
+    renamed or overwritten once a manifest may point at it. The previous directory
+    is removed after the swap. A source whose mtime changed but whose content did
+    not is not recompiled.
+
+    Args:
+        csv_path (str): The CSV file.
+        cache_dir (str): The cache root.
+        force (bool): Recompile even if the cache is current.
+
+    Returns:
+        dict: The table's manifest.
+    """
+    try:
+        csv_path = os.path.abspath(csv_path)
+        name = table_name(csv_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        manifest_path = os.path.join(cache_dir, f"{name}.json")
+        stat = os.stat(csv_path)
+        manifest = _load_manifest(manifest_path)
+        current = (not force and manifest is not None
+                   and os.path.isdir(os.path.join(cache_dir, manifest["table_dir"])))
+        if current and (manifest["source_size"], manifest["source_mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            return manifest
+
+        digest = file_digest(csv_path)
+        if current and manifest["source_sha256"] == digest:
+            manifest["source_mtime_ns"] = stat.st_mtime_ns
+            _write_json(manifest_path, manifest)
+            return manifest
+
+        start = time.perf_counter()
+        frame = pd.read_csv(csv_path, dtype=str, encoding="utf-8-sig")
+        # A fresh directory per build, so concurrent builds and readers never share one
+        build_dir = tempfile.mkdtemp(dir=cache_dir, prefix=f"{name}-{digest[:16]}.")
+        table_dir = os.path.basename(build_dir)
+        columns = []
+        for index, column in enumerate(frame.columns):
+            kind, payload, unit = type_column(column, frame[column])
+            entry = {"name": column, "kind": kind, "unit": unit, "files": {}}
+            prefix = f"{index:03d}"
+            if kind == "category":
+                codes, categories = payload
+                blob, offsets = encode_strings(categories)
+                arrays = {"codes": codes, "blob": blob, "offsets": offsets}
+            else:
+                arrays = {"values": payload}
+            for part, array in arrays.items():
+                filename = f"{prefix}.{part}.npy"
+                np.save(os.path.join(build_dir, filename), np.ascontiguousarray(array))
+                entry["files"][part] = filename
+            columns.append(entry)
+
+        previous_dir = manifest.get("table_dir") if manifest else None
+        manifest = {
+            "format": CACHE_FORMAT,
+            "source": csv_path,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_sha256": digest,
+            "table_dir": table_dir,
+            "rows": len(frame),
+            "columns": columns,
+        }
+        _write_json(manifest_path, manifest)
+        if previous_dir and previous_dir != table_dir:
+            # Processes still mapping the old files keep their inodes until they unmap
+            shutil.rmtree(os.path.join(cache_dir, previous_dir), ignore_errors=True)
+        logger.info("Compiled %s (%d rows, %d columns) in %.3fs", csv_path, len(frame), len(columns),
+                    time.perf_counter() - start)
+        return manifest
+    except Exception as e:
+        logger.error(f"Error compiling {csv_path} into the catalog cache: {e}")
+        raise
+
+class CategoryColumn:
+    """
+    Dictionary-encoded string column.
+
+    Attributes:
+        codes (numpy.ndarray): int32 code per row, -1 for missing values.
+    """
+
+    def __init__(self, codes, blob, offsets):
+        self.codes = codes
+        self._blob = blob
+        self._offsets = offsets
+        self._categories = None
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def categories(self):
+        """numpy.ndarray: The distinct values, decoded on first access."""
+        if self._categories is None:
+            self._categories = decode_strings(self._blob, self._offsets)
+        return self._categories
+
+    def to_pandas(self):
+        return pd.Categorical.from_codes(self.codes, self.categories)
+
+class CatalogTable:
+    """
+    A compiled CSV loaded from the columnar cache.
+
+    Numeric columns are float64/int64/bool arrays, already stripped of their unit
+    (recorded in ``units``); string columns are CategoryColumn objects. With the
+    default ``mmap_mode`` every array is a read-only memory map.
+
+    Attributes:
+        name (str): The cache name of the table.
+        rows (int): Number of rows.
+        columns (dict): Column name -> NumPy array or CategoryColumn, in CSV order.
+        units (dict): Column name -> unit parsed off its values, for unit columns.
+    """
+
+    def __init__(self, manifest, cache_dir=CACHE_DIR, mmap_mode="r"):
+        self.manifest = manifest
+        self.name = manifest["table_dir"]
+        self.rows = manifest["rows"]
+        table_dir = os.path.join(cache_dir, manifest["table_dir"])
+        self.columns = {}
+        self.units = {}
+        for entry in manifest["columns"]:
+            arrays = {part: np.load(os.path.join(table_dir, filename), mmap_mode=mmap_mode)
+                      for part, filename in entry["files"].items()}
+            if entry["kind"] == "category":
+                self.columns[entry["name"]] = CategoryColumn(arrays["codes"], arrays["blob"], arrays["offsets"])
+            else:
+                self.columns[entry["name"]] = arrays["values"]
+            if entry["unit"]:
+                self.units[entry["name"]] = entry["unit"]
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def __len__(self):
+        return self.rows
+
+    def to_pandas(self):
+        """
+        Build a DataFrame; numeric columns are copied, string columns become categoricals.
+
+        ``attrs["dataset"]`` holds the source's file stem and ``attrs["units"]`` the
+        units parsed off numeric columns, so normalization can scale them.
+        """
+        frame = pd.DataFrame({
+            column: values.to_pandas() if isinstance(values, CategoryColumn) else np.asarray(values)
+            for column, values in self.columns.items()
+        })
+        frame.attrs["dataset"] = os.path.splitext(os.path.basename(self.manifest["source"]))[0]
+        frame.attrs["units"] = dict(self.units)
+        return frame
+
+def load_table(csv_path, cache_dir=CACHE_DIR, mmap_mode="r"):
+    """
+    Load a CSV through the columnar cache, compiling it first if it changed.
+
+    Args:
+        csv_path (str): The CSV file.
+        cache_dir (str): The cache root.
+        mmap_mode (str or None): np.load mmap_mode, or None to read into memory.
+
+    Returns:
+        CatalogTable: The loaded table.
+    """
+    manifest = compile_csv(csv_path, cache_dir)
+    try:
+        return CatalogTable(manifest, cache_dir, mmap_mode)
+    except (OSError, ValueError) as e:
+        # Another process swapped the table in the meantime, or its files are damaged
+        latest = compile_csv(csv_path, cache_dir)
+        force = latest["table_dir"] == manifest["table_dir"]
+        logger.warning(f"Could not load cached table {manifest['table_dir']} ({e}); "
+                       f"{'rebuilding it' if force else 'loading the newer one'}")
+        return CatalogTable(compile_csv(csv_path, cache_dir, force=True) if force else latest, cache_dir, mmap_mode)
+
+def load_frame(csv_path, cache_dir=CACHE_DIR):
+    """Load a CSV through the columnar cache as a pandas DataFrame."""
+    return load_table(csv_path, cache_dir).to_pandas()
+
+def build_all(data_dir=DATA_DIR, cache_dir=CACHE_DIR, force=False):
+    """
+    Compile every CSV in a directory.
+
+    Returns:
+        dict: CSV file name -> row count.
+    """
+    built = {}
+    for csv_path in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+        built[os.path.basename(csv_path)] = compile_csv(csv_path, cache_dir, force)["rows"]
+    return built
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="catalog_cache.log")
+
+    parser = argparse.ArgumentParser(description="Compile the hardware catalog CSVs into the columnar cache.")
+    parser.add_argument('--data_dir', type=str, default=DATA_DIR, help='Directory with the CSV files')
+    parser.add_argument('--cache_dir', type=str, default=CACHE_DIR, help='Directory for the compiled cache')
+    parser.add_argument('--force', action='store_true', help='Recompile even if the cache is current')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    built = build_all(args.data_dir, args.cache_dir, args.force)
+    print(json.dumps({"tables": built, "seconds": time.perf_counter() - start}, indent=4))
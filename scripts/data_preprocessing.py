@@ -1,8 +1,11 @@
+import os
 import pandas as pd
+from catalog_cache import DATA_DIR, load_frame
 
 def load_and_preprocess_data():
-    cpu_data = pd.read_csv('../data/CPUData.csv')
-    gpu_data = pd.read_csv('../data/GPUData.csv')
+    # Typed columns come from the compiled cache, rebuilt only when a CSV changes
+    cpu_data = load_frame(os.path.join(DATA_DIR, 'CPUData.csv'))
+    gpu_data = load_frame(os.path.join(DATA_DIR, 'GPUData.csv'))
     
     cpu_data['Hardware'] = 'CPU'
     gpu_data['Hardware'] = 'GPU'
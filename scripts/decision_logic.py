@@ -1,27 +1,51 @@
-import joblib
-from resource_monitoring import get_cpu_usage, get_gpu_usage, get_qiskit_backends, get_cirq_backends, get_pennylane_devices
+import numpy as np
+from model_registry import COMPILED_MODEL_PATH, DEFAULT_MODEL_PATH, get_registry
+from backend_registry import get_backend_registry
+from resource_monitoring import get_cpu_usage, get_gpu_usage
 from feature_extraction import extract_features
 
-# Load the trained model
-model = joblib.load('../models/combined_model.joblib')
+# The trained model is loaded on first use, memory-mapped, and swapped when its file changes.
+# The flat-array export from tree_engine is preferred whenever it exists: it loads and predicts single rows faster.
+registry = get_registry((COMPILED_MODEL_PATH, DEFAULT_MODEL_PATH))
 
-def decide_computation_method(task_features):
-    prediction = model.predict([task_features])[0]
-    
+# Load thresholds in percent; a processor at or above its threshold is considered busy
+CPU_LOAD_THRESHOLD = 80
+GPU_LOAD_THRESHOLD = 80
+
+def get_system_snapshot():
+    # One read of telemetry and backend availability, shared by every task in a batch
     cpu_usage = get_cpu_usage()
     gpu_usage = get_gpu_usage()
-    qiskit_backends = get_qiskit_backends()
-    cirq_backends = get_cirq_backends()
-    pennylane_devices = get_pennylane_devices()
-    
-    if prediction == 'CPU' and cpu_usage < 80:
-        return 'CPU'
-    elif prediction == 'GPU' and gpu_usage and all(load < 80 for _, load in gpu_usage):
-        return 'GPU'
-    elif prediction == 'QPU':
-        if qiskit_backends or cirq_backends or pennylane_devices:
-            return 'QPU'
-    return 'Hybrid'
+    backends = get_backend_registry().snapshot()
+    return {
+        "cpu_available": cpu_usage is not None and cpu_usage < CPU_LOAD_THRESHOLD,
+        # get_gpu_usage reports loads as fractions of 1
+        "gpu_available": bool(gpu_usage) and all(load * 100 < GPU_LOAD_THRESHOLD for _, load in gpu_usage),
+        "qpu_available": backends.has_available(),
+    }
+
+def decide_computation_methods(feature_matrix, snapshot=None):
+    # Route N tasks with one predict call and one system snapshot
+    feature_matrix = np.asarray(feature_matrix)
+    if feature_matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D feature matrix, got shape {feature_matrix.shape}")
+    if len(feature_matrix) == 0:
+        return np.array([], dtype='<U6')
+    predictions = np.asarray(registry.get().predict(feature_matrix))
+    snapshot = get_system_snapshot() if snapshot is None else snapshot
+
+    return np.select(
+        [
+            (predictions == 'CPU') & snapshot["cpu_available"],
+            (predictions == 'GPU') & snapshot["gpu_available"],
+            (predictions == 'QPU') & snapshot["qpu_available"],
+        ],
+        ['CPU', 'GPU', 'QPU'],
+        default='Hybrid',
+    )
+
+def decide_computation_method(task_features):
+    return str(decide_computation_methods([task_features])[0])
 
 if __name__ == "__main__":
     task = {"Task Type": "optimization"}
@@ -1,6 +1,6 @@
-import multiprocessing as mp
 from decision_logic import decide_computation_method
 from feature_extraction import extract_features
+from worker_pool import CLASSICAL, QUANTUM, get_worker_pool
 
 def run_classical_computation(task):
     print("Running classical computation")
@@ -10,16 +10,14 @@ def run_quantum_computation(task):
     print("Running quantum computation")
     pass  # Placeholder for quantum computation (QPU)
 
-def hybrid_processing(task):
+def hybrid_processing(task, timeout=None):
     print("Running hybrid processing")
-    cpu_process = mp.Process(target=run_classical_computation, args=(task,))
-    qpu_process = mp.Process(target=run_quantum_computation, args=(task,))
-    
-    cpu_process.start()
-    qpu_process.start()
-    
-    cpu_process.join()
-    qpu_process.join()
+    # Persistent workers: no process is created per task
+    pool = get_worker_pool({CLASSICAL: run_classical_computation, QUANTUM: run_quantum_computation})
+    cpu_future = pool.submit(CLASSICAL, task)
+    qpu_future = pool.submit(QUANTUM, task)
+
+    return cpu_future.result(timeout), qpu_future.result(timeout)
 
 def dynamic_switching(task):
     task_features = extract_features(task)
@@ -2,19 +2,100 @@
 
 import pandas as pd
 import joblib
+import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 import logging
 import argparse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("evaluate_model.log"),
-                        logging.StreamHandler()
-                    ])
 logger = logging.getLogger(__name__)
 
+FEATURE_COLUMNS = ['clock_speed', 'cores', 'logical_cores', 'memory', 'total_storage']
+LABEL_COLUMN = 'brand'
+# Rows per chunk in streaming mode; memory is bounded by (n_jobs + 1) chunks
+DEFAULT_CHUNK_SIZE = 10000
+
+class RunningConfusion:
+    """
+    Confusion matrix accumulated chunk by chunk, over labels discovered as they appear.
+
+    Counts are kept in a square matrix indexed by label code, in order of first
+    appearance, and grown when a new true or predicted label shows up. Accuracy,
+    the confusion matrix and the classification report are derived from the counts
+    alone, in scikit-learn's sorted label order and report format, so the result
+    is the same as evaluating all rows at once.
+    """
+
+    def __init__(self):
+        self.codes = {}
+        self.counts = np.zeros((0, 0), dtype=np.int64)
+
+    def _encode(self, values):
+        uniques, inverse = np.unique(np.asarray(values), return_inverse=True)
+        for label in uniques.tolist():
+            if label not in self.codes:
+                self.codes[label] = len(self.codes)
+        return np.array([self.codes[label] for label in uniques.tolist()], dtype=np.intp)[inverse]
+
+    def update(self, y_true, y_pred):
+        """Add one chunk of true and predicted labels."""
+        true_codes = self._encode(y_true)
+        pred_codes = self._encode(y_pred)
+        n = len(self.codes)
+        if n > len(self.counts):
+            grown = np.zeros((n, n), dtype=np.int64)
+            grown[:len(self.counts), :len(self.counts)] = self.counts
+            self.counts = grown
+        self.counts += np.bincount(true_codes * n + pred_codes, minlength=n * n).reshape(n, n)
+
+    @property
+    def labels(self):
+        """list: Every label seen, sorted as scikit-learn sorts them."""
+        return sorted(self.codes)
+
+    def matrix(self):
+        """Return the confusion matrix with rows (true) and columns (predicted) in sorted label order."""
+        order = [self.codes[label] for label in self.labels]
+        return self.counts[np.ix_(order, order)]
+
+    @property
+    def total(self):
+        """int: Number of rows counted."""
+        return int(self.counts.sum())
+
+    def accuracy(self):
+        """Return the fraction of rows predicted correctly."""
+        return float(np.trace(self.counts) / self.total) if self.total else 0.0
+
+    def report(self, digits=2):
+        """Return the text classification report, formatted like sklearn.metrics.classification_report."""
+        matrix = self.matrix()
+        tp = np.diag(matrix).astype(np.float64)
+        support = matrix.sum(axis=1)
+        predicted = matrix.sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.where(predicted > 0, tp / predicted, 0.0)
+            recall = np.where(support > 0, tp / support, 0.0)
+            denominator = 2 * tp + (predicted - tp) + (support - tp)
+            f1 = np.where(denominator > 0, 2 * tp / denominator, 0.0)
+
+        names = ["%s" % label for label in self.labels]
+        headers = ["precision", "recall", "f1-score", "support"]
+        width = max(max((len(name) for name in names), default=0), len("weighted avg"), digits)
+        report = ("{:>{width}s} " + " {:>9}" * len(headers)).format("", *headers, width=width) + "\n\n"
+        row_fmt = "{:>{width}s} " + " {:>9.{digits}f}" * 3 + " {:>9}\n"
+        for row in zip(names, precision, recall, f1, support):
+            report += row_fmt.format(*row, width=width, digits=digits)
+        report += "\n"
+        total = int(support.sum())
+        accuracy_fmt = "{:>{width}s} " + " {:>9.{digits}}" * 2 + " {:>9.{digits}f}" + " {:>9}\n"
+        report += accuracy_fmt.format("accuracy", "", "", self.accuracy(), total, width=width, digits=digits)
+        weights = support / total if total else np.zeros_like(precision)
+        report += row_fmt.format("macro avg", precision.mean(), recall.mean(), f1.mean(), total, width=width, digits=digits)
+        report += row_fmt.format("weighted avg", precision @ weights, recall @ weights, f1 @ weights, total,
+                                 width=width, digits=digits)
+        return report
+
 def load_model(model_path):
     """Load the pre-trained model from the specified path."""
     try:
@@ -38,8 +119,8 @@ def load_test_data(data_path):
 def evaluate_model(model, test_data):
     """Evaluate the model using the test data."""
     try:
-        features = test_data[['clock_speed', 'cores', 'logical_cores', 'memory', 'total_storage']]
-        labels = test_data['brand']
+        features = test_data[FEATURE_COLUMNS]
+        labels = test_data[LABEL_COLUMN]
         predictions = model.predict(features)
 
         accuracy = accuracy_score(labels, predictions)
@@ -55,16 +136,83 @@ def evaluate_model(model, test_data):
         logger.error(f"Error during model evaluation: {e}")
         raise
 
+def iter_test_chunks(data_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield (features, labels) chunks of the test CSV, reading only the columns evaluation needs."""
+    reader = pd.read_csv(data_path, usecols=FEATURE_COLUMNS + [LABEL_COLUMN], chunksize=chunk_size)
+    for chunk in reader:
+        known = chunk[LABEL_COLUMN].notna()
+        if not known.all():
+            logger.warning(f"Skipping {int((~known).sum())} test rows without a {LABEL_COLUMN} label")
+            chunk = chunk[known]
+        yield chunk[FEATURE_COLUMNS], chunk[LABEL_COLUMN].to_numpy()
+
+def evaluate_model_streaming(model, data_path, chunk_size=DEFAULT_CHUNK_SIZE, n_jobs=1):
+    """
+    Evaluate the model on a test CSV read in fixed-size chunks.
+
+    Each chunk is predicted and folded into a RunningConfusion, then dropped, so
+    peak memory is bounded by the chunk size rather than the file size. With
+    ``n_jobs`` > 1, up to ``n_jobs`` chunks are predicted concurrently on threads
+    (scikit-learn's predict releases the GIL in its compiled loops, and threads
+    share the model instead of pickling it); the reader waits for a free slot
+    before reading the next chunk.
+
+    Args:
+        model: The model to evaluate.
+        data_path (str): Path to the test CSV file.
+        chunk_size (int): Rows per chunk.
+        n_jobs (int): Chunks predicted at once.
+
+    Returns:
+        tuple: (accuracy, classification report, confusion matrix), as evaluate_model.
+    """
+    try:
+        running = RunningConfusion()
+        if n_jobs <= 1:
+            for features, labels in iter_test_chunks(data_path, chunk_size):
+                running.update(labels, model.predict(features))
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs, thread_name_prefix="evaluate-chunk") as executor:
+                pending = {}
+                for features, labels in iter_test_chunks(data_path, chunk_size):
+                    if len(pending) >= n_jobs:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            running.update(pending.pop(future), future.result())
+                    pending[executor.submit(model.predict, features)] = labels
+                for future in pending:
+                    running.update(pending[future], future.result())
+
+        accuracy = running.accuracy()
+        report = running.report()
+        confusion = running.matrix()
+        logger.info(f"Model accuracy: {accuracy} over {running.total} rows")
+        logger.info(f"Classification report:\n{report}")
+        logger.info(f"Confusion matrix:\n{confusion}")
+
+        return accuracy, report, confusion
+    except Exception as e:
+        logger.error(f"Error during streaming model evaluation: {e}")
+        raise
+
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="evaluate_model.log")
+
     parser = argparse.ArgumentParser(description="Evaluate the pre-trained model using test data.")
     parser.add_argument('--model_path', type=str, required=True, help='Path to the pre-trained model file')
     parser.add_argument('--data_path', type=str, required=True, help='Path to the test data CSV file')
+    parser.add_argument('--chunk_size', type=int, default=None, help='Stream the CSV in chunks of this many rows instead of loading it whole')
+    parser.add_argument('--n_jobs', type=int, default=1, help='Chunks predicted concurrently in streaming mode')
     args = parser.parse_args()
 
     logger.info("Starting model evaluation...")
 
     model = load_model(args.model_path)
-    test_data = load_test_data(args.data_path)
-    evaluate_model(model, test_data)
+    if args.chunk_size:
+        evaluate_model_streaming(model, args.data_path, chunk_size=args.chunk_size, n_jobs=args.n_jobs)
+    else:
+        test_data = load_test_data(args.data_path)
+        evaluate_model(model, test_data)
 
     logger.info("Model evaluation completed.")
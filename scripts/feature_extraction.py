@@ -1,11 +1,23 @@
+from feature_store import FeatureStore
+
+FEATURE_MAP = {
+    "matrix_multiplication": [1000, 50000, 3, 1, 1],
+    "image_processing": [5000, 100000, 2, 2, 1],
+    "optimization": [50, 1000000, 1, 3, 5],
+    # Add more task types as needed
+}
+
+# Compiled once at import; unknown task types get the mean feature vector
+feature_store = FeatureStore(FEATURE_MAP)
+
 def extract_features(task):
-    feature_map = {
-        "matrix_multiplication": [1000, 50000, 3, 1, 1],
-        "image_processing": [5000, 100000, 2, 2, 1],
-        "optimization": [50, 1000000, 1, 3, 5],
-        # Add more task types as needed
-    }
-    return feature_map[task["Task Type"]]
+    # A read-only float32 row of the store, not a list; unknown task types get the
+    # fallback row instead of raising KeyError. Copy it before modifying it.
+    return feature_store.extract(task)
+
+def extract_features_batch(tasks):
+    # One vectorized gather for all tasks; feeds decide_computation_methods directly
+    return feature_store.extract_batch(tasks)
 
 if __name__ == "__main__":
     tasks = [
@@ -17,3 +29,4 @@ if __name__ == "__main__":
     for task in tasks:
         features = extract_features(task)
         print(f"Features for {task['Task Type']}: {features}")
+    print(f"Batch features:\n{extract_features_batch(tasks)}")
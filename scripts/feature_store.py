@@ -0,0 +1,102 @@
+# quantum_firmware_optimization/scripts/feature_store.py
+
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Fallbacks for unknown task types: "mean" of the known rows, "zeros", an explicit
+# vector, or None to raise KeyError
+DEFAULT_FALLBACK = "mean"
+
+class FeatureStore:
+    """
+    Task-type feature table compiled once into a read-only float32 matrix.
+
+    Row ``i`` of ``matrix`` holds the features of ``task_types[i]``; the last row holds
+    the fallback vector for unknown task types. Batch extraction maps task types to
+    row codes and gathers all rows in one ``np.take`` into a C-contiguous float32
+    array, the layout scikit-learn's tree models convert their input to anyway, so it
+    reaches ``predict`` and ``fit`` without another copy.
+
+    Attributes:
+        task_types (tuple): Known task types in row order.
+        index (dict): Task type -> row number.
+        matrix (numpy.ndarray): (len(task_types) + 1, n_features) read-only float32 table.
+        fallback_row (int): Row number of the fallback vector, or None if unknown types raise.
+    """
+
+    def __init__(self, feature_map, fallback=DEFAULT_FALLBACK):
+        if not feature_map:
+            raise ValueError("Feature map is empty")
+        self.task_types = tuple(feature_map)
+        self.index = {task_type: row for row, task_type in enumerate(self.task_types)}
+        known = np.asarray([feature_map[task_type] for task_type in self.task_types], dtype=np.float32)
+        if known.ndim != 2:
+            raise ValueError("Every task type must have the same number of features")
+
+        if fallback is None:
+            fallback_vector = np.full(known.shape[1], np.nan, dtype=np.float32)
+        elif isinstance(fallback, str):
+            if fallback == "mean":
+                fallback_vector = known.mean(axis=0)
+            elif fallback == "zeros":
+                fallback_vector = np.zeros(known.shape[1], dtype=np.float32)
+            else:
+                raise ValueError(f"Unsupported fallback: {fallback}")
+        else:
+            fallback_vector = np.asarray(fallback, dtype=np.float32)
+            if fallback_vector.shape != (known.shape[1],):
+                raise ValueError(f"Fallback vector must have {known.shape[1]} features")
+
+        self.matrix = np.ascontiguousarray(np.vstack([known, fallback_vector]), dtype=np.float32)
+        self.matrix.flags.writeable = False
+        self.fallback_row = None if fallback is None else len(self.task_types)
+
+    @property
+    def n_features(self):
+        return self.matrix.shape[1]
+
+    def codes(self, task_types):
+        """
+        Map task types to row numbers of ``matrix``.
+
+        Args:
+            task_types (iterable of str): The task types.
+
+        Returns:
+            numpy.ndarray: int32 row numbers; unknown types map to ``fallback_row``.
+
+        Raises:
+            KeyError: If a task type is unknown and there is no fallback.
+        """
+        if self.fallback_row is None:
+            return np.fromiter((self.index[task_type] for task_type in task_types), dtype=np.int32)
+        fallback_row = self.fallback_row
+        codes = np.fromiter((self.index.get(task_type, fallback_row) for task_type in task_types), dtype=np.int32)
+        unknown = np.count_nonzero(codes == fallback_row)
+        if unknown:
+            logger.debug("%d task(s) of unknown type got the fallback features", unknown)
+        return codes
+
+    def extract(self, task):
+        """Return one task's features as a read-only float32 row view of ``matrix``."""
+        return self.matrix[self.codes([task["Task Type"]])[0]]
+
+    def extract_batch(self, tasks, out=None):
+        """
+        Extract the features of many tasks in one gather.
+
+        Args:
+            tasks (iterable of dict): Tasks with a "Task Type" key.
+            out (numpy.ndarray, optional): A (len(tasks), n_features) float32 array
+                to fill instead of allocating one.
+
+        Returns:
+            numpy.ndarray: C-contiguous (len(tasks), n_features) float32 matrix.
+        """
+        return self.gather(self.codes(task["Task Type"] for task in tasks), out=out)
+
+    def gather(self, codes, out=None):
+        """Gather the rows of precomputed codes into a (len(codes), n_features) float32 matrix."""
+        return np.take(self.matrix, codes, axis=0, out=out)
@@ -0,0 +1,379 @@
+# quantum_firmware_optimization/scripts/hardware_catalog.py
+
+import argparse
+import glob
+import json
+import logging
+import os
+import threading
+import time
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# String columns with an equality (hash) index, in every table that has them
+HASH_INDEX_COLUMNS = ("Producer", "Socket", "Chipset", "Memory Type", "MPN", "EAN")
+# Quantity kinds (see normalization.QUANTITIES) whose columns get a sorted index:
+# prices, TDP and wattage, clocks and capacities
+SORTED_INDEX_KINDS = ("price", "power", "clock", "size")
+
+def index_key(value):
+    """Return the hash index key of a value: stripped and case-folded, so 'SAPPHIRE' finds 'Sapphire'."""
+    return str(value).strip().casefold()
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+class HashIndex:
+    """
+    Equality index of a dictionary-encoded string column.
+
+    Maps each distinct key to the ascending row numbers holding it, as read-only
+    int32 arrays, so a lookup is one dictionary access.
+    """
+
+    def __init__(self, codes, categories):
+        codes = np.asarray(codes)
+        order = np.argsort(codes, kind="stable")
+        # Start of every code's run in the sorted codes; missing values (-1) sort first and are skipped
+        bounds = np.searchsorted(codes[order], np.arange(len(categories) + 1))
+        buckets = {}
+        for code, category in enumerate(categories):
+            rows = order[bounds[code]:bounds[code + 1]]
+            key = index_key(category)
+            buckets[key] = np.union1d(buckets[key], rows) if key in buckets else rows
+        self._buckets = {key: _read_only(rows.astype(np.int32)) for key, rows in buckets.items()}
+        self._empty = _read_only(np.empty(0, dtype=np.int32))
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def keys(self):
+        """Return the indexed keys."""
+        return self._buckets.keys()
+
+    def get(self, value):
+        """
+        Return the rows equal to a value, or to any of a list, tuple or set of values.
+
+        Returns:
+            numpy.ndarray: Ascending int32 row numbers.
+        """
+        if isinstance(value, (list, tuple, set, frozenset)):
+            matches = [self._buckets.get(index_key(item), self._empty) for item in value]
+            return np.unique(np.concatenate(matches)) if matches else self._empty
+        return self._buckets.get(index_key(value), self._empty)
+
+class SortedIndex:
+    """
+    Range index of a numeric column: the row numbers ordered by value.
+
+    Missing values are left out, so they never match a range.
+    """
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        present = np.flatnonzero(~np.isnan(values))
+        order = present[np.argsort(values[present], kind="stable")]
+        self.rows = _read_only(order.astype(np.int32))
+        self.values = _read_only(values[order])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def range(self, low=None, high=None, inclusive=(True, True)):
+        """
+        Return the rows whose value lies between ``low`` and ``high``.
+
+        Args:
+            low (float, optional): Lower bound; unbounded if None.
+            high (float, optional): Upper bound; unbounded if None.
+            inclusive (tuple): Whether each bound is included.
+
+        Returns:
+            numpy.ndarray: Ascending int32 row numbers.
+        """
+        start = 0 if low is None else np.searchsorted(self.values, low, side="left" if inclusive[0] else "right")
+        stop = len(self.values) if high is None else np.searchsorted(self.values, high, side="right" if inclusive[1] else "left")
+        return np.sort(self.rows[start:stop])
+
+class IndexedTable:
+    """
+    One catalog table held as compact columns with its indexes.
+
+    Numeric columns are float64 arrays (quantities in the canonical units listed in
+    ``units``); string columns are int32 codes plus their distinct values. Every
+    array is read-only and the indexes are built once, so a table can be shared by
+    threads without locking.
+
+    Attributes:
+        name (str): Table name, the CSV file stem.
+        rows (int): Number of rows.
+        units (dict): Column -> canonical unit of its values.
+        hash_indexes (dict): Column -> HashIndex.
+        sorted_indexes (dict): Column -> SortedIndex.
+    """
+
+    def __init__(self, name, columns, units=None, hash_columns=HASH_INDEX_COLUMNS, sorted_columns=()):
+        """
+        Args:
+            name (str): Table name.
+            columns (dict): Column -> values. Numeric arrays are stored as float64;
+                anything else is dictionary-encoded, reusing the codes of
+                categorical input (pandas.Categorical or catalog_cache.CategoryColumn).
+            units (dict, optional): Column -> unit of its values.
+            hash_columns (iterable): String columns to hash-index, where present.
+            sorted_columns (iterable): Numeric columns to sort-index, where present.
+        """
+        self.name = name
+        self.units = dict(units or {})
+        self._numeric = {}
+        self._strings = {}
+        self.rows = None
+        for column, values in columns.items():
+            if hasattr(values, "codes") and hasattr(values, "categories"):
+                codes, categories = values.codes, values.categories
+                self._strings[column] = (_read_only(np.array(codes, dtype=np.int32)),
+                                         _read_only(np.asarray(categories, dtype=object)))
+            elif isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+                self._numeric[column] = _read_only(values.astype(np.float64))
+            else:
+                codes, categories = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+                self._strings[column] = (_read_only(codes.astype(np.int32)), _read_only(np.asarray(categories, dtype=object)))
+            length = len(self._numeric[column]) if column in self._numeric else len(self._strings[column][0])
+            if self.rows is None:
+                self.rows = length
+            elif length != self.rows:
+                raise ValueError(f"Column {column} of {name} has {length} rows, expected {self.rows}")
+        self.rows = self.rows or 0
+        self.hash_indexes = {column: HashIndex(*self._strings[column])
+                             for column in hash_columns if column in self._strings}
+        self.sorted_indexes = {column: SortedIndex(self._numeric[column])
+                               for column in sorted_columns if column in self._numeric}
+
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, column):
+        return column in self._numeric or column in self._strings
+
+    @property
+    def columns(self):
+        """list: Column names."""
+        return list(self._numeric) + list(self._strings)
+
+    def column(self, column, rows=None):
+        """
+        Return a column's values, optionally only at some rows.
+
+        Returns:
+            numpy.ndarray: float64 for numeric columns, objects (None where missing) otherwise.
+        """
+        if column in self._numeric:
+            values = self._numeric[column]
+            return values if rows is None else values[rows]
+        if column not in self._strings:
+            raise KeyError(f"No column {column} in {self.name}")
+        codes, categories = self._strings[column]
+        codes = codes if rows is None else codes[rows]
+        # Missing values have code -1, which picks the trailing None
+        return np.append(categories, None)[codes]
+
+    def equals(self, column, value):
+        """Return the ascending rows where a hash-indexed column equals a value or any of a list of values."""
+        if column not in self.hash_indexes:
+            raise ValueError(f"No hash index on {column} in {self.name}")
+        return self.hash_indexes[column].get(value)
+
+    def between(self, column, low=None, high=None, inclusive=(True, True)):
+        """Return the ascending rows where a sort-indexed column lies in [low, high], in its canonical unit."""
+        if column not in self.sorted_indexes:
+            raise ValueError(f"No sorted index on {column} in {self.name}")
+        return self.sorted_indexes[column].range(low, high, inclusive)
+
+    def query(self, equals=None, ranges=None, order_by=None, descending=False, limit=None):
+        """
+        Return the rows matching every condition.
+
+        Each condition is answered by its index and the row sets are intersected,
+        smallest first, so no column is scanned.
+
+        Args:
+            equals (dict, optional): Hash-indexed column -> value or list of values.
+            ranges (dict, optional): Sort-indexed column -> (low, high), either bound
+                None for unbounded, in the column's canonical unit (USD, W, Hz, B).
+            order_by (str, optional): Sort-indexed column to order the result by;
+                rows missing that value are dropped.
+            descending (bool): Order from the largest value.
+            limit (int, optional): Return at most this many rows.
+
+        Returns:
+            numpy.ndarray: int32 row numbers, ascending unless ordered.
+        """
+        matches = [self.equals(column, value) for column, value in (equals or {}).items()]
+        matches += [self.between(column, *bounds) for column, bounds in (ranges or {}).items()]
+        if matches:
+            matches.sort(key=len)
+            rows = matches[0]
+            for other in matches[1:]:
+                if not len(rows):
+                    break
+                rows = np.intersect1d(rows, other, assume_unique=True)
+        else:
+            rows = np.arange(self.rows, dtype=np.int32)
+
+        if order_by is not None:
+            if order_by not in self.sorted_indexes:
+                raise ValueError(f"No sorted index on {order_by} in {self.name}")
+            order = self.sorted_indexes[order_by].rows
+            selected = np.zeros(self.rows, dtype=bool)
+            selected[rows] = True
+            rows = order[selected[order]]
+            if descending:
+                rows = rows[::-1]
+        return rows if limit is None else rows[:limit]
+
+    def records(self, rows, columns=None):
+        """Return the given rows as a list of dicts, NaN and missing strings as None."""
+        columns = columns or self.columns
+        values = {}
+        for column in columns:
+            picked = self.column(column, rows)
+            if column in self._numeric:
+                picked = np.where(np.isnan(picked), None, picked.astype(object))
+            values[column] = picked.tolist()
+        return [dict(zip(columns, row)) for row in zip(*(values[column] for column in columns))]
+
+class HardwareCatalog:
+    """
+    The component datasets, loaded once into IndexedTables.
+
+    Attributes:
+        tables (dict): Table name -> IndexedTable.
+    """
+
+    def __init__(self, tables):
+        self.tables = {table.name: table for table in tables}
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+    def __contains__(self, name):
+        return name in self.tables
+
+    def query(self, table, equals=None, ranges=None, order_by=None, descending=False, limit=None):
+        """Query one table; see IndexedTable.query."""
+        return self.tables[table].query(equals, ranges, order_by, descending, limit)
+
+    def lookup(self, column, value):
+        """
+        Find a value of a hash-indexed column in every table that indexes it, e.g. an MPN or EAN.
+
+        Returns:
+            dict: Table name -> ascending row numbers, for tables with a match.
+        """
+        found = {}
+        for name, table in self.tables.items():
+            if column in table.hash_indexes:
+                rows = table.equals(column, value)
+                if len(rows):
+                    found[name] = rows
+        return found
+
+def load_catalog(data_dir=None, cache_dir=None, datasets=None):
+    """
+    Load the catalog CSVs through the columnar cache and index them.
+
+    Quantity columns of the normalization schema are converted to canonical SI
+    floats; those of SORTED_INDEX_KINDS get a sorted index. RAMData's 'Ram Type'
+    ("DDR4-3200") also yields a 'Memory Type' column ("DDR4"), so memory can be
+    matched against MotherboardData's 'Memory Type'.
+
+    Args:
+        data_dir (str, optional): Directory with the CSV files; defaults to the catalog's.
+        cache_dir (str, optional): The columnar cache root.
+        datasets (iterable, optional): CSV file stems to load; all by default.
+
+    Returns:
+        HardwareCatalog: The indexed catalog.
+    """
+    from catalog_cache import CACHE_DIR, DATA_DIR, load_table
+    from normalization import QUANTITIES, dataset_name, parse_quantity, schema_for
+
+    data_dir = data_dir or DATA_DIR
+    cache_dir = cache_dir or CACHE_DIR
+    try:
+        start = time.perf_counter()
+        tables = []
+        for csv_path in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+            name = dataset_name(csv_path)
+            if datasets is not None and name not in datasets:
+                continue
+            table = load_table(csv_path, cache_dir, mmap_mode=None)
+            schema = schema_for(name)
+            columns, units, sorted_columns = {}, {}, []
+            for column, values in table.columns.items():
+                if column not in schema:
+                    columns[column] = values
+                    continue
+                kind, bare_unit = schema[column]
+                if hasattr(values, "codes"):
+                    # Parse each distinct string once and gather by code; -1 picks the trailing NaN
+                    parsed = parse_quantity(pd.Series(values.categories, dtype=object), kind, bare_unit)
+                    columns[column] = np.append(parsed, np.nan)[values.codes]
+                else:
+                    columns[column] = parse_quantity(values, kind, table.units.get(column, bare_unit))
+                units[column] = QUANTITIES[kind][0]
+                if kind in SORTED_INDEX_KINDS:
+                    sorted_columns.append(column)
+            if "Ram Type" in columns and "Memory Type" not in columns:
+                ram_type = pd.Series(table["Ram Type"].to_pandas(), dtype=object)
+                columns["Memory Type"] = ram_type.str.split("-", n=1).str[0].to_numpy()
+            tables.append(IndexedTable(name, columns, units, sorted_columns=sorted_columns))
+        catalog = HardwareCatalog(tables)
+        logger.info(f"Indexed {len(tables)} catalog tables ({sum(len(t) for t in tables)} rows) in {time.perf_counter() - start:.3f}s")
+        return catalog
+    except Exception as e:
+        logger.error(f"Error loading the hardware catalog from {data_dir}: {e}")
+        raise
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+def get_catalog():
+    """Return the process-wide catalog of the default data directory, loading it on first use."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = load_catalog()
+        return _catalog
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="hardware_catalog.log")
+
+    parser = argparse.ArgumentParser(description="Query the indexed hardware catalog.")
+    parser.add_argument('--table', type=str, required=True, help='Table to query, e.g. CPUData')
+    parser.add_argument('--equals', type=str, nargs='*', default=[], help='Equality conditions as Column=value')
+    parser.add_argument('--range', type=str, nargs='*', default=[], help='Range conditions as Column=low:high in canonical units; either bound may be empty')
+    parser.add_argument('--order_by', type=str, default=None, help='Sort-indexed column to order by')
+    parser.add_argument('--descending', action='store_true', help='Order from the largest value')
+    parser.add_argument('--limit', type=int, default=10, help='Maximum number of rows to print')
+    parser.add_argument('--columns', type=str, nargs='*', default=None, help='Columns to print')
+    args = parser.parse_args()
+
+    equals = dict(condition.split("=", 1) for condition in args.equals)
+    ranges = {}
+    for condition in args.range:
+        column, bounds = condition.split("=", 1)
+        low, high = bounds.split(":", 1)
+        ranges[column] = (float(low) if low else None, float(high) if high else None)
+
+    catalog = load_catalog()
+    start = time.perf_counter()
+    rows = catalog.query(args.table, equals, ranges, args.order_by, args.descending, args.limit)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"query_ms": elapsed * 1e3,
+                      "rows": catalog[args.table].records(rows, args.columns)}, indent=4, default=str))
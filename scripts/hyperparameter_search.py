@@ -0,0 +1,235 @@
+# quantum_firmware_optimization/scripts/hyperparameter_search.py
+
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+import joblib
+import numpy as np
+import psutil
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import ParameterGrid, check_cv
+
+logger = logging.getLogger(__name__)
+
+SEARCH_STRATEGIES = ("grid", "halving")
+# Each successive-halving rung keeps 1/HALVING_FACTOR of the candidates and gives them HALVING_FACTOR times the budget
+DEFAULT_HALVING_FACTOR = 3
+CHECKPOINT_FORMAT = 1
+
+@dataclass
+class SearchResult:
+    """
+    Outcome of a hyperparameter search.
+
+    Attributes:
+        best_estimator: The best candidate refit on all training rows.
+        best_params (dict): Parameters of the best candidate.
+        best_score (float): Its mean cross-validation score on the last rung it ran.
+        stats (dict): Wall time, CPU time and utilization, fit counts and rungs.
+        history (list): One dict per evaluated (rung, candidate) with its mean score.
+    """
+    best_estimator: Any
+    best_params: Dict[str, Any]
+    best_score: float
+    stats: Dict[str, Any] = field(default_factory=dict)
+    history: List[Dict[str, Any]] = field(default_factory=list)
+
+class _Checkpoint:
+    """Fold scores of finished fits, rewritten atomically after every fit."""
+
+    def __init__(self, path, fingerprint):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.scores = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    state = json.load(f)
+                if state.get("format") == CHECKPOINT_FORMAT and state.get("fingerprint") == fingerprint:
+                    self.scores = state["scores"]
+                    logger.info("Resuming search from %s with %d finished fits", path, len(self.scores))
+                else:
+                    logger.warning(f"Checkpoint {path} belongs to a different search, starting over")
+            except Exception as e:
+                logger.warning(f"Error reading checkpoint {path}, starting over: {e}")
+
+    def record(self, key, score):
+        self.scores[key] = score
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".json.tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"format": CHECKPOINT_FORMAT, "fingerprint": self.fingerprint, "scores": self.scores}, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error writing checkpoint {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+def _take(data, indices):
+    return data.iloc[indices] if hasattr(data, "iloc") else data[indices]
+
+def _fit_and_score(estimator, params, X, y, train, test, scoring, key):
+    """Fit one candidate on one fold; a failing fit scores NaN, as in GridSearchCV."""
+    start = time.perf_counter()
+    try:
+        model = clone(estimator).set_params(**params)
+        model.fit(_take(X, train), _take(y, train))
+        score = float(get_scorer(scoring)(model, _take(X, test), _take(y, test)))
+    except Exception as e:
+        logger.warning(f"Fit {key} with {params} failed: {e}")
+        score = float("nan")
+    return key, score, time.perf_counter() - start
+
+def _cpu_seconds(process):
+    """User+system seconds of this process and each of its (worker) children, by pid."""
+    seconds = {}
+    for proc in [process] + process.children(recursive=True):
+        try:
+            times = proc.cpu_times()
+            seconds[proc.pid] = times.user + times.system
+        except psutil.Error:
+            pass
+    return seconds
+
+def rung_resources(n_candidates, n_samples, factor=DEFAULT_HALVING_FACTOR, min_resources=1):
+    """
+    Plan the budget (rows, or trees) of each successive-halving rung.
+
+    There are as many rungs as it takes to cut ``n_candidates`` down to at most
+    ``factor`` by keeping 1/``factor`` of them per rung; the last rung gets the
+    whole ``n_samples`` budget and each earlier one 1/``factor`` of the next.
+
+    Returns:
+        list: Budget per rung, in order.
+    """
+    rungs = 1
+    while factor ** rungs < n_candidates:
+        rungs += 1
+    return [max(min_resources, n_samples // factor ** (rungs - 1 - rung)) for rung in range(rungs)]
+
+def search(estimator, param_grid, X, y, strategy="grid", cv=3, scoring="accuracy", n_jobs=1,
+           factor=DEFAULT_HALVING_FACTOR, resource="n_samples", max_resources=None, checkpoint_path=None,
+           random_state=42):
+    """
+    Cross-validated hyperparameter search with parallel fits and a resumable checkpoint.
+
+    ``grid`` scores every candidate on all rows, like GridSearchCV. ``halving`` runs
+    successive halving: all candidates are scored on a small random subsample, the
+    best 1/``factor`` advance to a ``factor`` times larger one, and so on up to the
+    full training set. With ``resource`` set to an estimator parameter such as
+    'n_estimators', rungs grow that parameter up to ``max_resources`` on all rows
+    instead, which is the cheaper budget on small datasets.
+
+    Every (candidate, fold) fit of a rung is dispatched at once over ``n_jobs``
+    processes; each finished fit is written to ``checkpoint_path``,
+    so an interrupted search resumes with only the missing fits.
+
+    Args:
+        estimator: The unfitted estimator.
+        param_grid (dict or list): Parameter grid, as for GridSearchCV.
+        X (array-like): Training features.
+        y (array-like): Training labels.
+        strategy (str): 'grid' or 'halving'.
+        cv (int): Number of (stratified) folds.
+        scoring (str): A scikit-learn scorer name.
+        n_jobs (int): Parallel fits; -1 uses every core.
+        factor (int): Halving factor.
+        resource (str): 'n_samples', or the estimator parameter each halving rung grows.
+        max_resources (int, optional): Last-rung value of ``resource``; required
+            unless it is 'n_samples'.
+        checkpoint_path (str, optional): JSON file of finished fits.
+        random_state (int): Seed of the halving subsamples.
+
+    Returns:
+        SearchResult: The refit best estimator, its parameters and the search stats.
+    """
+    if strategy not in SEARCH_STRATEGIES:
+        raise ValueError(f"Unsupported search strategy: {strategy}")
+    candidates = list(ParameterGrid(param_grid))
+    n_samples = len(y)
+    if strategy == "grid":
+        resource = "n_samples"
+    by_samples = resource == "n_samples"
+    if by_samples:
+        n_classes = len(np.unique(np.asarray(y)))
+        resources = rung_resources(len(candidates) if strategy == "halving" else 1, n_samples, factor,
+                                   min_resources=min(n_samples, cv * n_classes))
+    else:
+        if max_resources is None:
+            raise ValueError(f"max_resources is required to halve over {resource}")
+        if any(resource in params for params in candidates):
+            raise ValueError(f"The halving resource {resource} cannot also be in the parameter grid")
+        resources = rung_resources(len(candidates), max_resources, factor)
+    order = np.random.RandomState(random_state).permutation(n_samples)
+    # Scores depend on the data, estimator, grid, folds and subsample seed; the strategy
+    # only decides which fits run, so full-data fits are shared between strategies
+    fingerprint = joblib.hash((repr(clone(estimator)), repr(candidates), cv, scoring, random_state, resource, X, y))
+    checkpoint = _Checkpoint(checkpoint_path, fingerprint)
+
+    process = psutil.Process()
+    cpu_before = _cpu_seconds(process)
+    start = time.perf_counter()
+    alive = list(range(len(candidates)))
+    history = []
+    fits = resumed = 0
+    final_params = {}
+    for rung, amount in enumerate(resources):
+        n_rows = amount if by_samples else n_samples
+        rows = np.sort(order[:n_rows]) if n_rows < n_samples else np.arange(n_samples)
+        X_rung, y_rung = _take(X, rows), _take(y, rows)
+        final_params = extra = {} if by_samples else {resource: amount}
+        folds = list(check_cv(cv, y_rung, classifier=True).split(X_rung, y_rung))
+        tasks = [(f"{amount}:{index}:{fold}", index, fold) for index in alive for fold in range(len(folds))]
+        pending = [task for task in tasks if task[0] not in checkpoint.scores]
+        resumed += len(tasks) - len(pending)
+        logger.info("Search rung %d: %d candidates with %s=%d, %d of %d fits to run",
+                    rung, len(alive), resource, amount, len(pending), len(tasks))
+        if pending:
+            results = Parallel(n_jobs=n_jobs, return_as="generator_unordered")(
+                delayed(_fit_and_score)(estimator, {**candidates[index], **extra}, X_rung, y_rung, *folds[fold],
+                                        scoring, key)
+                for key, index, fold in pending)
+            for key, score, _ in results:
+                checkpoint.record(key, score)
+                fits += 1
+        means = {}
+        for index in alive:
+            scores = [checkpoint.scores[f"{amount}:{index}:{fold}"] for fold in range(len(folds))]
+            means[index] = float(np.mean(scores))
+            history.append({"rung": rung, resource: amount, "params": candidates[index], "mean_score": means[index]})
+        # Best first; NaN scores last; ties keep grid order, as in GridSearchCV
+        alive.sort(key=lambda index: (-means[index] if not math.isnan(means[index]) else math.inf, index))
+        if rung < len(resources) - 1:
+            alive = alive[:max(1, math.ceil(len(alive) / factor))]
+    best = alive[0]
+    best_params = {**candidates[best], **final_params}
+    best_estimator = clone(estimator).set_params(**best_params).fit(X, y)
+    wall = time.perf_counter() - start
+    cpu_after = _cpu_seconds(process)
+    cpu = sum(seconds - cpu_before.get(pid, 0.0) for pid, seconds in cpu_after.items())
+    stats = {
+        "strategy": strategy,
+        "n_jobs": n_jobs,
+        "candidates": len(candidates),
+        "resource": resource,
+        "rungs": resources,
+        "fits": fits,
+        "resumed_fits": resumed,
+        "wall_seconds": wall,
+        "cpu_seconds": cpu,
+        # Share of all cores kept busy; CPU time of workers that exited mid-search is not counted
+        "cpu_utilization": cpu / (wall * (psutil.cpu_count() or 1)) if wall > 0 else 0.0,
+    }
+    return SearchResult(best_estimator, best_params, means[best], stats, history)
@@ -0,0 +1,273 @@
+# quantum_firmware_optimization/scripts/incremental_training.py
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import SGDClassifier
+from sklearn.naive_bayes import GaussianNB
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from model_registry import file_digest, publish_model
+from train_model import load_data, preprocess_data
+
+logger = logging.getLogger(__name__)
+
+STATE_FORMAT = 1
+# Estimators that can learn from new rows alone: partial_fit, or warm_start adding trees.
+# random_forest is an approximation: see incremental_update.
+INCREMENTAL_ALGORITHMS = ('sgd', 'naive_bayes', 'random_forest')
+# Trees a random forest update trains on the new rows
+TREES_PER_UPDATE = 10
+# A batch whose mean moved more than this many training standard deviations on any feature triggers a full retrain
+DRIFT_THRESHOLD = float(os.environ.get("QFO_DRIFT_THRESHOLD", 1.0))
+# Batches smaller than this are not checked for drift; their means are too noisy
+MIN_DRIFT_ROWS = 30
+
+def make_estimator(algorithm):
+    """Return an unfitted estimator of an incremental algorithm."""
+    if algorithm == 'sgd':
+        return SGDClassifier(loss='log_loss', random_state=42)
+    elif algorithm == 'naive_bayes':
+        return GaussianNB()
+    elif algorithm == 'random_forest':
+        return RandomForestClassifier(n_estimators=100, warm_start=True, random_state=42)
+    raise ValueError(f"Unsupported incremental algorithm: {algorithm}")
+
+def default_state_path(model_path):
+    """Return the consumed-rows state file kept next to a model."""
+    return f"{model_path}.state.json"
+
+def prefix_digests(path, n_bytes, chunk_size=1 << 20):
+    """
+    Hash a file in one pass.
+
+    Returns:
+        tuple: Hex SHA-256 digests of the first ``n_bytes`` bytes and of the whole file.
+    """
+    digest = hashlib.sha256()
+    prefix = None
+    offset = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            if prefix is None and offset + len(chunk) >= n_bytes:
+                digest.update(chunk[:n_bytes - offset])
+                prefix = digest.hexdigest()
+                digest.update(chunk[n_bytes - offset:])
+            else:
+                digest.update(chunk)
+            offset += len(chunk)
+    return prefix if prefix is not None else digest.hexdigest(), digest.hexdigest()
+
+def feature_schema(features):
+    """Map each feature column to 'numeric' or 'other'; a change in this map forces a full retrain."""
+    return {
+        column: "numeric" if pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype) else "other"
+        for column, dtype in features.dtypes.items()
+    }
+
+def load_state(state_path):
+    """Load the consumed-rows state, or None if there is none."""
+    if not os.path.exists(state_path):
+        return None
+    try:
+        with open(state_path) as f:
+            state = json.load(f)
+        return state if state.get("format") == STATE_FORMAT else None
+    except Exception as e:
+        logger.warning(f"Error reading training state {state_path}, retraining from scratch: {e}")
+        return None
+
+def save_state(state, state_path):
+    """Write the state atomically, so an interrupted run leaves the previous one intact."""
+    directory = os.path.dirname(os.path.abspath(state_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".json.tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, state_path)
+    except Exception as e:
+        logger.error(f"Error writing training state {state_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def drifted_features(pipeline, X_new):
+    """
+    Return the features whose batch mean moved more than DRIFT_THRESHOLD standard deviations.
+
+    The reference is the training distribution the pipeline's scaler was fitted on
+    at the last full retrain.
+    """
+    if len(X_new) < MIN_DRIFT_ROWS:
+        return []
+    scaler = pipeline.named_steps['scaler']
+    imputed = pipeline.named_steps['imputer'].transform(X_new)
+    shift = np.abs(imputed.mean(axis=0) - scaler.mean_) / scaler.scale_
+    return [column for column, value in zip(X_new.columns, shift) if value > DRIFT_THRESHOLD]
+
+def full_retrain(X, y, algorithm):
+    """Fit a fresh imputer, scaler and estimator on every row."""
+    pipeline = Pipeline([
+        ('imputer', SimpleImputer(strategy='median', keep_empty_features=True)),
+        ('scaler', StandardScaler()),
+        ('model', make_estimator(algorithm)),
+    ])
+    return pipeline.fit(X, y)
+
+def incremental_update(pipeline, X_new, y_new):
+    """
+    Train the pipeline's estimator on new rows only.
+
+    The imputer and scaler stay frozen at their last full-retrain fit, so earlier
+    updates remain valid; drift checks decide when they are refitted.
+
+    sgd and naive_bayes update every parameter with partial_fit. A random forest
+    cannot: each update appends TREES_PER_UPDATE trees fitted on the new rows only,
+    and the existing trees never see them. New rows therefore carry the weight of
+    their trees in the vote rather than of their share of the data, the forest
+    grows with every update, and a batch must contain every label. Until the next
+    full retrain resets it, use random_forest for catalogs that receive few, large
+    appends.
+    """
+    model = pipeline.named_steps['model']
+    X_scaled = pipeline[:-1].transform(X_new)
+    if hasattr(model, 'partial_fit'):
+        model.partial_fit(X_scaled, y_new)
+    else:
+        # warm_start forests keep their trees and grow new ones on the rows passed to fit
+        model.n_estimators += TREES_PER_UPDATE
+        model.fit(X_scaled, y_new)
+    return pipeline
+
+def update(data_path, model_path, algorithm='sgd', state_path=None, force_full=False, use_cache=True):
+    """
+    Bring a model up to date with the rows appended to a catalog CSV since its last run.
+
+    The state file records how many rows and bytes of the CSV the model has
+    consumed and a digest of those bytes. If the file only grew, the new rows are
+    scored with the current model (prequential accuracy) and then learned with
+    partial_fit or warm_start. A full retrain on every row runs instead when there
+    is no usable state, the consumed bytes were rewritten, the feature schema
+    changed, a label the model has never seen appears, the new rows cannot be
+    warm-started (a forest batch lacking some label), or a feature drifted.
+
+    Args:
+        data_path (str): The catalog CSV.
+        model_path (str): The model file, published atomically.
+        algorithm (str): One of INCREMENTAL_ALGORITHMS.
+        state_path (str, optional): The state file; defaults to next to the model.
+        force_full (bool): Retrain on every row regardless of the state.
+        use_cache (bool): Load the CSV through the columnar catalog cache.
+
+    Returns:
+        dict: The mode ('full', 'incremental' or 'unchanged'), the retrain reason,
+        row counts, prequential accuracy and elapsed seconds.
+    """
+    if algorithm not in INCREMENTAL_ALGORITHMS:
+        raise ValueError(f"Unsupported incremental algorithm: {algorithm}")
+    start = time.perf_counter()
+    state_path = state_path or default_state_path(model_path)
+    state = load_state(state_path)
+    size = os.path.getsize(data_path)
+    consumed_digest, data_digest = prefix_digests(data_path, state["bytes"] if state else 0)
+
+    reason = None
+    if force_full:
+        reason = "forced"
+    elif state is None:
+        reason = "no state"
+    elif state["algorithm"] != algorithm:
+        reason = f"algorithm changed from {state['algorithm']}"
+    elif not os.path.exists(model_path) or file_digest(model_path) != state["model_digest"]:
+        reason = "model file changed"
+    elif size < state["bytes"] or consumed_digest != state["data_digest"]:
+        reason = "consumed rows rewritten"
+    elif size == state["bytes"]:
+        logger.info(f"No new rows in {data_path}")
+        return {"mode": "unchanged", "reason": None, "rows": state["rows"], "new_rows": 0,
+                "prequential_accuracy": None, "seconds": time.perf_counter() - start}
+
+    features, labels = preprocess_data(load_data(data_path, use_cache=use_cache))
+    known = labels.notna().to_numpy()
+    schema = feature_schema(features)
+    if reason is None and schema != state["schema"]:
+        reason = "feature schema changed"
+
+    pipeline = None
+    new_rows = len(labels) - (state["rows"] if state else 0)
+    accuracy = None
+    if reason is None:
+        columns = state["feature_columns"]
+        new = np.zeros(len(labels), dtype=bool)
+        new[state["rows"]:] = True
+        X_new = features.loc[new & known, columns].astype(float)
+        y_new = labels[new & known].astype(str).to_numpy()
+        pipeline = joblib.load(model_path)
+        classes = set(pipeline.classes_)
+        if len(y_new) and not set(y_new) <= classes:
+            reason = f"new labels {sorted(set(y_new) - classes)}"
+        elif len(y_new) and not hasattr(pipeline.named_steps['model'], 'partial_fit') and set(y_new) != classes:
+            reason = "new rows do not cover every label"
+        else:
+            drifted = drifted_features(pipeline, X_new)
+            if drifted:
+                reason = f"drift in {', '.join(drifted)}"
+            elif len(y_new):
+                accuracy = float(np.mean(pipeline.predict(X_new) == y_new))
+                incremental_update(pipeline, X_new, y_new)
+
+    if reason is not None:
+        logger.info(f"Full retrain of {model_path} on {data_path}: {reason}")
+        columns = [column for column, kind in schema.items() if kind == "numeric"]
+        pipeline = full_retrain(features.loc[known, columns].astype(float), labels[known].astype(str).to_numpy(), algorithm)
+        new_rows = len(labels)
+    publish_model(pipeline, model_path)
+
+    previous = state or {}
+    save_state({
+        "format": STATE_FORMAT,
+        "algorithm": algorithm,
+        "data_path": os.path.abspath(data_path),
+        "rows": len(labels),
+        "bytes": size,
+        "data_digest": data_digest,
+        "model_digest": file_digest(model_path),
+        "schema": schema,
+        "feature_columns": columns,
+        "full_retrains": previous.get("full_retrains", 0) + (reason is not None),
+        "incremental_updates": previous.get("incremental_updates", 0) + (reason is None),
+        "rows_since_full_retrain": len(labels) if reason is not None else previous["rows_since_full_retrain"] + new_rows,
+    }, state_path)
+
+    mode = "full" if reason is not None else "incremental"
+    elapsed = time.perf_counter() - start
+    logger.info(f"{mode.capitalize()} training of {model_path} consumed {new_rows} rows in {elapsed:.3f}s"
+                + (f", prequential accuracy {accuracy:.3f}" if accuracy is not None else ""))
+    return {"mode": mode, "reason": reason, "rows": len(labels), "new_rows": new_rows,
+            "prequential_accuracy": accuracy, "seconds": elapsed}
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="incremental_training.log")
+
+    parser = argparse.ArgumentParser(description="Train a model only on catalog rows appended since its last run.")
+    parser.add_argument('--data_path', type=str, required=True, help='Path to the dataset CSV file')
+    parser.add_argument('--model_path', type=str, required=True, help='Path of the model to create or update')
+    parser.add_argument('--algorithm', type=str, default='sgd', choices=INCREMENTAL_ALGORITHMS, help='Incremental algorithm')
+    parser.add_argument('--state_path', type=str, default=None, help='Consumed-rows state file; defaults to next to the model')
+    parser.add_argument('--full', action='store_true', help='Retrain on every row regardless of the state')
+    parser.add_argument('--no_cache', action='store_true', help='Parse the CSV directly instead of using the columnar cache')
+    args = parser.parse_args()
+
+    print(json.dumps(update(args.data_path, args.model_path, args.algorithm, args.state_path, args.full,
+                            use_cache=not args.no_cache), indent=4))
@@ -0,0 +1,203 @@
+# quantum_firmware_optimization/scripts/model_registry.py
+
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+import joblib
+
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = os.environ.get(
+    "QFO_MODELS_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models"))
+DEFAULT_MODEL_PATH = os.path.join(MODELS_DIR, "combined_model.joblib")
+# The same model compiled to flat node arrays by tree_engine; preferred when present
+COMPILED_MODEL_PATH = os.path.join(MODELS_DIR, "combined_model.flat.joblib")
+# Memory-map the model's NumPy arrays read-only so processes share their pages
+DEFAULT_MMAP_MODE = "r"
+# Seconds between stat() calls that look for a new model file
+DEFAULT_CHECK_INTERVAL = 1.0
+
+def file_digest(path, chunk_size=1 << 20):
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def publish_model(model, path=DEFAULT_MODEL_PATH):
+    """
+    Write a model so running registries can pick it up safely.
+
+    The model is dumped uncompressed (memory mapping needs raw arrays) to a temporary
+    file next to ``path`` and moved into place with os.replace, so readers see either
+    the old file or the new one, never a partial write. Processes that still map the
+    old file keep reading its unlinked inode until they swap.
+
+    Args:
+        model: The model to publish.
+        path (str): Destination path.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Not mkstemp: its 0600 mode would hide the model from services running as other users
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+    try:
+        joblib.dump(model, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.error(f"Error publishing model to {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    logger.info("Published model to %s", path)
+
+class ModelRegistry:
+    """
+    Loads a joblib model on first use and hot-swaps it when the file changes.
+
+    The registry can be given several candidate files in order of preference, e.g.
+    the flat-array export from tree_engine before the scikit-learn model it was
+    compiled from. Every check serves the first candidate that exists, so a file
+    published (or removed) after the registry was created is picked up like any
+    other change.
+
+    Models are loaded with ``mmap_mode`` so the NumPy arrays inside them (e.g. tree
+    node tables) are memory-mapped instead of copied, and every process loading the
+    same file shares those pages through the page cache.
+
+    At most once per ``check_interval`` seconds, ``get`` stats the file. When the
+    file served, its inode, mtime or size changed, the file is hashed; if the
+    content differs from the loaded model's, the new model is loaded and swapped in
+    with a single reference assignment. Callers holding the previous model keep using it safely. If the new
+    file fails to load, the previous model stays in service.
+
+    Attributes:
+        paths (tuple): The candidate model files, most preferred first.
+        path (str): The candidate file last checked.
+        mmap_mode (str or None): The joblib mmap_mode, or None to load into memory.
+        check_interval (float): Minimum seconds between change checks.
+        reloads (int): Number of times a changed model was swapped in.
+    """
+
+    def __init__(self, path=DEFAULT_MODEL_PATH, mmap_mode=DEFAULT_MMAP_MODE, check_interval=DEFAULT_CHECK_INTERVAL):
+        candidates = [path] if isinstance(path, (str, os.PathLike)) else path
+        self.paths = tuple(os.path.abspath(candidate) for candidate in candidates)
+        if not self.paths:
+            raise ValueError("ModelRegistry needs at least one model path")
+        self.path = self.paths[0]
+        self.mmap_mode = mmap_mode
+        self.check_interval = check_interval
+        self.reloads = 0
+        # (model, sha256, (path, inode, mtime_ns, size)) of the model in service, swapped as a whole
+        self._current = None
+        self._next_check = 0.0
+        # Signature of a file that failed to load, so it is not retried until it changes again
+        self._failed_signature = None
+        self._load_lock = threading.Lock()
+
+    def _resolve(self):
+        """Return the most preferred candidate that exists, or the last one if none does."""
+        for path in self.paths[:-1]:
+            if os.path.exists(path):
+                return path
+        return self.paths[-1]
+
+    def _stat(self):
+        self.path = self._resolve()
+        stat = os.stat(self.path)
+        return self.path, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _load(self, signature):
+        digest = file_digest(self.path)
+        if self._current is not None and digest == self._current[1]:
+            # Touched but unchanged: remember the new signature without reloading
+            self._current = (self._current[0], digest, signature)
+            return
+        start = time.perf_counter()
+        model = joblib.load(self.path, mmap_mode=self.mmap_mode)
+        if self._current is not None:
+            self.reloads += 1
+        self._current = (model, digest, signature)
+        logger.info("Loaded model %s (sha256 %s) in %.3fs", self.path, digest[:12], time.perf_counter() - start)
+
+    def refresh(self, force=False, blocking=True):
+        """
+        Reload the model if its file changed.
+
+        Args:
+            force (bool): Check the file even if ``check_interval`` has not elapsed.
+            blocking (bool): Wait for a check already running in another thread
+                instead of returning straight away.
+
+        Returns:
+            bool: True if a different model was swapped in.
+        """
+        if not self._load_lock.acquire(blocking=blocking):
+            return False
+        try:
+            now = time.monotonic()
+            if not force and self._current is not None and now < self._next_check:
+                return False
+            self._next_check = now + self.check_interval
+            previous = self._current
+            signature = None
+            try:
+                signature = self._stat()
+                if previous is None or signature not in (previous[2], self._failed_signature):
+                    self._load(signature)
+            except Exception as e:
+                self._failed_signature = signature
+                if previous is None:
+                    logger.error(f"Error loading model from {self.path}: {e}")
+                    raise
+                logger.error(f"Error reloading model from {self.path}, keeping the previous one: {e}")
+                return False
+            return previous is not None and self._current[1] != previous[1]
+        finally:
+            self._load_lock.release()
+
+    def get(self):
+        """
+        Return the current model, loading it on first use.
+
+        Returns:
+            The loaded model.
+        """
+        current = self._current
+        if current is None or time.monotonic() >= self._next_check:
+            # Only the first load blocks; later checks are skipped while another thread runs one
+            self.refresh(blocking=current is None)
+            current = self._current
+        return current[0]
+
+    @property
+    def version(self):
+        """str or None: SHA-256 of the model in service, or None before the first load."""
+        current = self._current
+        return None if current is None else current[1]
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+def get_registry(path=DEFAULT_MODEL_PATH, **kwargs):
+    """
+    Return the process-wide registry for a model file, creating it on first use.
+
+    Args:
+        path (str or sequence of str): The model file, or candidate files in order of preference.
+        **kwargs: ModelRegistry options, used only when the registry is created.
+
+    Returns:
+        ModelRegistry: The registry for ``path``.
+    """
+    key = tuple(os.path.abspath(candidate) for candidate in ([path] if isinstance(path, (str, os.PathLike)) else path))
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = ModelRegistry(key, **kwargs)
+        return registry
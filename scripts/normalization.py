@@ -0,0 +1,207 @@
+# quantum_firmware_optimization/scripts/normalization.py
+
+import logging
+import os
+import re
+import threading
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Canonical unit and unit -> multiplier table of every quantity kind. Sizes use the
+# decimal prefixes the catalog's vendors use (1 GB = 1e9 bytes).
+QUANTITIES = {
+    "clock": ("Hz", {"hz": 1.0, "khz": 1e3, "mhz": 1e6, "ghz": 1e9}),
+    "size": ("B", {"b": 1.0, "kb": 1e3, "mb": 1e6, "gb": 1e9, "tb": 1e12}),
+    "power": ("W", {"mw": 1e-3, "w": 1.0, "kw": 1e3}),
+    "length": ("m", {"mm": 1e-3, "cm": 1e-2, "m": 1.0, '"': 0.0254, "in": 0.0254, "inch": 0.0254, 'zoll"': 0.0254}),
+    "price": ("USD", {"usd": 1.0, "$": 1.0}),
+}
+
+# An optional currency sign, a number and an optional unit: "3.7 GHz", "2044 MHz",
+# "$158.86 USD", "16GB", '23.8"', and decimal commas as in "154,5 mm"
+VALUE_PATTERN = r'^\s*(?P<currency>\$)?\s*(?P<value>[-+]?\d+(?:[.,]\d+)?)\s*(?P<unit>[A-Za-z]*"?)\s*$'
+_VALUE_RE = re.compile(VALUE_PATTERN)
+
+# Column -> quantity kind, or (kind, unit of bare numbers), for columns whose meaning
+# is the same in every dataset
+COMMON_SCHEMA = {
+    "Price": "price",
+    "STANDARD_COST": "price",
+    "LIST_PRICE": "price",
+    "TDP": "power",
+    "Watt": "power",
+    "Base Clock": "clock",
+    "Turbo Clock": "clock",
+    "Boost Clock": "clock",
+    "Memory Clock": "clock",
+    "Capacity": "size",
+    "Memory": "size",
+    "Memory Capacity": "size",
+    "Vram": "size",
+}
+
+# Per-dataset additions, keyed by CSV file stem
+DATASET_SCHEMAS = {
+    "CPUCoolerData": {"Height": "length"},
+    "CaseData": {
+        "Width": "length",
+        "Depth": "length",
+        "Height": "length",
+        "Supported GPU Length": "length",
+        "Supported CPU Cooler Height": "length",
+    },
+    "GPUData": {"Length": "length"},
+    "HDDData": {"Size": "size", "Form Factor": "length"},
+    "MonitorData": {"Size": "length", "Refresh Rate": "clock"},
+    "RAMData": {"Size": "size", "Clock": ("clock", "MHz")},
+    "SSDData": {"Size": "size"},
+    "hardware_specs": {"clock_speed": ("clock", "GHz"), "memory": "size", "total_storage": "size"},
+}
+
+# Parsed unique strings are kept per (kind, bare-number unit) up to this many entries
+PARSE_CACHE_SIZE = 100000
+
+_parse_cache = {}
+_parse_cache_lock = threading.Lock()
+
+def schema_for(dataset=None):
+    """
+    Return the normalization schema of a dataset.
+
+    Args:
+        dataset (str, optional): CSV file stem, e.g. 'CPUData'. Without it only the
+            common columns are normalized.
+
+    Returns:
+        dict: Column -> (kind, bare-number unit or None).
+    """
+    schema = dict(COMMON_SCHEMA)
+    schema.update(DATASET_SCHEMAS.get(dataset, {}))
+    return {column: spec if isinstance(spec, tuple) else (spec, None) for column, spec in schema.items()}
+
+def unit_factor(kind, unit):
+    """Return the multiplier taking ``unit`` to the canonical unit of ``kind``, or NaN if unknown."""
+    if not unit:
+        return 1.0
+    return QUANTITIES[kind][1].get(unit.lower(), np.nan)
+
+def _parse_strings(strings, kind, bare_unit):
+    """Parse distinct strings into canonical floats; unparseable ones become NaN."""
+    factors = QUANTITIES[kind][1]
+    bare_factor = unit_factor(kind, bare_unit)
+    parsed = np.full(len(strings), np.nan)
+    ambiguous = []
+    for i, string in enumerate(strings):
+        match = _VALUE_RE.match(string)
+        if match is None:
+            continue
+        value = match.group("value")
+        if "," in value:
+            # "1,500" could be a thousands separator or a decimal comma
+            if len(value) - value.index(",") - 1 == 3:
+                ambiguous.append(string)
+                continue
+            value = value.replace(",", ".")
+        # A leading "$" is the unit when no unit follows it
+        unit = match.group("unit").lower() or ("$" if match.group("currency") else "")
+        parsed[i] = float(value) * (factors.get(unit, np.nan) if unit else bare_factor)
+    if ambiguous:
+        logger.warning(f"{len(ambiguous)} {kind} value(s) with an ambiguous comma left unparsed, e.g. {ambiguous[0]!r}")
+    return parsed
+
+def parse_quantity(values, kind, bare_unit=None):
+    """
+    Parse a column of value+unit strings into canonical SI floats in one pass.
+
+    The column is factorized once, only distinct strings are parsed, and the parsed
+    values are gathered back to every row with one take. Parse results are memoized
+    across calls, so repeated values and re-runs on the same catalog cost a
+    dictionary lookup. Numeric input is scaled from ``bare_unit``. A comma is read as
+    a decimal mark ("154,5 mm"), except before exactly three digits ("1,500"), where
+    it could be a thousands separator; such values are logged and left as NaN.
+
+    Args:
+        values (array-like): The raw column.
+        kind (str): A key of QUANTITIES, e.g. 'clock' or 'size'.
+        bare_unit (str, optional): Unit of numbers without one, e.g. 'MHz'.
+            Defaults to the canonical unit.
+
+    Returns:
+        numpy.ndarray: float64 values in the kind's canonical unit; NaN where a
+        value is missing or cannot be parsed.
+    """
+    if kind not in QUANTITIES:
+        raise ValueError(f"Unsupported quantity kind: {kind}")
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if pd.api.types.is_bool_dtype(series.dtype):
+        raise ValueError(f"Cannot parse a boolean column as {kind}")
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64) * unit_factor(kind, bare_unit)
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    uniques = [str(value) for value in uniques]
+    with _parse_cache_lock:
+        cache = _parse_cache.setdefault((kind, bare_unit), {})
+        missing = [value for value in uniques if value not in cache]
+    if missing:
+        parsed = _parse_strings(missing, kind, bare_unit)
+        with _parse_cache_lock:
+            if len(cache) + len(missing) > PARSE_CACHE_SIZE:
+                cache.clear()
+            cache.update(zip(missing, parsed.tolist()))
+            table = np.array([cache.get(value, np.nan) for value in uniques] + [np.nan], dtype=np.float64)
+        unparsed = int(np.isnan(parsed).sum())
+        if unparsed:
+            logger.debug("%d distinct %s value(s) could not be parsed", unparsed, kind)
+    else:
+        with _parse_cache_lock:
+            table = np.array([cache[value] for value in uniques] + [np.nan], dtype=np.float64)
+    # Missing values have code -1, which picks the trailing NaN
+    return table[codes]
+
+def normalize_frame(frame, dataset=None, schema=None):
+    """
+    Normalize every schema column of a DataFrame to canonical SI floats.
+
+    Numeric columns that came from the catalog cache carry the unit the cache parsed
+    off them in ``frame.attrs["units"]`` and are scaled from it; string columns are
+    parsed with parse_quantity. Columns outside the schema are left alone.
+
+    Args:
+        frame (pandas.DataFrame): The raw or cached catalog table.
+        dataset (str, optional): CSV file stem selecting the per-dataset schema.
+            Defaults to ``frame.attrs["dataset"]`` when present.
+        schema (dict, optional): Column -> kind or (kind, bare-number unit),
+            overriding the dataset schema.
+
+    Returns:
+        pandas.DataFrame: A copy with normalized columns; ``attrs["units"]`` maps
+        each normalized column to its canonical unit.
+    """
+    dataset = dataset if dataset is not None else frame.attrs.get("dataset")
+    if schema is None:
+        schema = schema_for(dataset)
+    else:
+        schema = {column: spec if isinstance(spec, tuple) else (spec, None) for column, spec in schema.items()}
+    cached_units = frame.attrs.get("units", {})
+    normalized = frame.copy()
+    units = {}
+    for column, (kind, bare_unit) in schema.items():
+        if column not in frame.columns:
+            continue
+        unit = cached_units.get(column, bare_unit)
+        normalized[column] = parse_quantity(frame[column], kind, unit)
+        units[column] = QUANTITIES[kind][0]
+    normalized.attrs = {**frame.attrs, "dataset": dataset, "units": units}
+    return normalized
+
+def dataset_name(path):
+    """Return the schema key of a CSV path: its file stem."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+def clear_cache():
+    """Drop every memoized parse result."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
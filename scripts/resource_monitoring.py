@@ -1,35 +1,47 @@
 # resource_monitoring.py
 import psutil
-import GPUtil
-from qiskit import IBMQ
-import cirq
-import pennylane as qml
+from backend_registry import get_backend_registry
+from telemetry_sampler import get_sampler
+
+try:
+    import GPUtil
+except ImportError:  # GPU telemetry is optional
+    GPUtil = None
 
 # CPU Monitoring
+# Reads the background sampler instead of blocking for a 1-second psutil probe;
+# until its first sample, psutil's counter primed by the sampler's start is read
 def get_cpu_usage():
-    return psutil.cpu_percent(interval=1)
+    usage = get_sampler().latest("cpu")
+    if usage is None:
+        return psutil.cpu_percent(interval=None)
+    return usage
 
 # GPU Monitoring
 def get_gpu_usage():
+    # Both paths report GPUtil's gpu.id, so a GPU keeps its id whether or not the sampler is running
+    loads = get_sampler().latest_gpus()
+    if loads is not None:
+        return [(gpu_id, load / 100.0) for gpu_id, load in loads]
+    if GPUtil is None:
+        return None
     gpus = GPUtil.getGPUs()
     if not gpus:
         return None
     return [(gpu.id, gpu.load) for gpu in gpus]
 
+# Quantum backends are read from the background-refreshed registry snapshot
 # Qiskit Quantum Hardware Monitoring
 def get_qiskit_backends():
-    IBMQ.load_account()  # Load account from disk
-    provider = IBMQ.get_provider(hub='ibm-q')
-    backends = provider.backends()
-    return [(backend.name(), backend.status().pending_jobs) for backend in backends]
+    return [(status.name, status.pending_jobs) for status in get_backend_registry().snapshot().available("qiskit")]
 
 # Cirq Quantum Hardware Monitoring
 def get_cirq_backends():
-    return [device for device in cirq.google.SycamoreProcessor]
+    return [status.name for status in get_backend_registry().snapshot().available("cirq")]
 
 # Pennylane Quantum Hardware Monitoring
 def get_pennylane_devices():
-    return qml.device("default.qubit", wires=1)
+    return [status.name for status in get_backend_registry().snapshot().available("pennylane")]
 
 if __name__ == "__main__":
     print(f"CPU usage: {get_cpu_usage()}%")
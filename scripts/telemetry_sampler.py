@@ -0,0 +1,215 @@
+# quantum_firmware_optimization/scripts/telemetry_sampler.py
+
+import atexit
+import logging
+import threading
+import time
+import numpy as np
+import psutil
+
+try:
+    import GPUtil
+except ImportError:  # GPU telemetry is optional
+    GPUtil = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.5
+DEFAULT_CAPACITY = 600
+DEFAULT_ALPHA = 0.3
+
+class RingBuffer:
+    """Fixed-size NumPy ring buffer of timestamped samples."""
+
+    def __init__(self, capacity, width):
+        self.capacity = capacity
+        self.width = width
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._values = np.full((capacity, width), np.nan, dtype=np.float64)
+        self._ewma = np.full(width, np.nan, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def append(self, timestamp, values, alpha=DEFAULT_ALPHA):
+        """Store one sample, overwriting the oldest one once the buffer is full."""
+        values = np.asarray(values, dtype=np.float64)
+        with self._lock:
+            self._times[self._next] = timestamp
+            self._values[self._next] = values
+            self._ewma = values.copy() if self._count == 0 else alpha * values + (1 - alpha) * self._ewma
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def latest(self):
+        """Return a copy of the most recent sample, or None if the buffer is empty."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            return self._values[(self._next - 1) % self.capacity].copy()
+
+    def ewma(self):
+        """Return the exponentially weighted moving average, or None if the buffer is empty."""
+        with self._lock:
+            return None if self._count == 0 else self._ewma.copy()
+
+    def window(self, seconds=None):
+        """Return (times, values) in chronological order, limited to the last ``seconds``."""
+        with self._lock:
+            order = (np.arange(self._count) + self._next - self._count) % self.capacity
+            times = self._times[order]
+            values = self._values[order]
+        if seconds is not None:
+            keep = times >= time.time() - seconds
+            times, values = times[keep], values[keep]
+        return times, values
+
+class TelemetrySampler:
+    """
+    Background thread that samples CPU, per-core, memory and GPU load.
+
+    Samples land in per-metric ring buffers so routing decisions can read the latest
+    value, an EWMA or a windowed percentile without blocking on a probe.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, capacity=DEFAULT_CAPACITY, alpha=DEFAULT_ALPHA):
+        self.interval = interval
+        self.alpha = alpha
+        self._cores = psutil.cpu_count(logical=True) or 1
+        # GPUtil's own ids, in the order their loads are stored in the "gpu" buffer
+        self.gpu_ids = tuple(gpu_id for gpu_id, _ in self._get_gpus())
+        self.buffers = {
+            "cpu": RingBuffer(capacity, 1),
+            "per_core": RingBuffer(capacity, self._cores),
+            "memory": RingBuffer(capacity, 1),
+        }
+        if self.gpu_ids:
+            self.buffers["gpu"] = RingBuffer(capacity, len(self.gpu_ids))
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _get_gpus():
+        """Return (GPU id, load in percent) pairs, or an empty list when GPUtil is unavailable."""
+        if GPUtil is None:
+            return []
+        try:
+            return [(gpu.id, gpu.load * 100.0) for gpu in GPUtil.getGPUs()]
+        except Exception as e:
+            logger.debug(f"GPU telemetry unavailable: {e}")
+            return []
+
+    def sample(self):
+        """Take one sample of every metric and store it."""
+        now = time.time()
+        per_core = psutil.cpu_percent(interval=None, percpu=True)
+        self.buffers["per_core"].append(now, per_core, self.alpha)
+        self.buffers["cpu"].append(now, [float(np.mean(per_core))], self.alpha)
+        self.buffers["memory"].append(now, [psutil.virtual_memory().percent], self.alpha)
+        if "gpu" in self.buffers:
+            gpus = self._get_gpus()
+            # Skip the sample if GPUs appeared or disappeared, so columns keep matching gpu_ids
+            if tuple(gpu_id for gpu_id, _ in gpus) == self.gpu_ids:
+                self.buffers["gpu"].append(now, [load for _, load in gpus], self.alpha)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"Error sampling telemetry: {e}")
+
+    def start(self):
+        """Start the background sampling thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        # The first non-blocking cpu_percent call only primes psutil's counters; the
+        # system-wide counter is primed too for callers that read psutil until the first sample
+        psutil.cpu_percent(interval=None, percpu=True)
+        psutil.cpu_percent(interval=None)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="telemetry-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"Telemetry sampler started with a {self.interval}s interval")
+        return self
+
+    def stop(self):
+        """Stop the background sampling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _buffer(self, metric):
+        try:
+            return self.buffers[metric]
+        except KeyError:
+            raise ValueError(f"Unknown or unavailable metric: {metric}")
+
+    def has_metric(self, metric):
+        """Check whether a metric is being sampled on this host."""
+        return metric in self.buffers
+
+    def latest(self, metric):
+        """Latest sample of a metric: a float for cpu/memory, an array for per_core/gpu, or None."""
+        values = self._buffer(metric).latest()
+        if values is None:
+            return None
+        return float(values[0]) if metric in ("cpu", "memory") else values
+
+    def latest_gpus(self):
+        """Latest GPU loads as (GPU id, load in percent) pairs, or None without GPU samples."""
+        if "gpu" not in self.buffers:
+            return None
+        loads = self.buffers["gpu"].latest()
+        if loads is None:
+            return None
+        return [(gpu_id, float(load)) for gpu_id, load in zip(self.gpu_ids, loads)]
+
+    def ewma(self, metric):
+        """Exponentially weighted moving average of a metric, or None before the first sample."""
+        values = self._buffer(metric).ewma()
+        if values is None:
+            return None
+        return float(values[0]) if metric in ("cpu", "memory") else values
+
+    def percentile(self, metric, q, window=None):
+        """Percentile ``q`` of a metric over the last ``window`` seconds, or None without samples."""
+        _, values = self._buffer(metric).window(window)
+        if len(values) == 0:
+            return None
+        result = np.nanpercentile(values, q, axis=0)
+        return float(result[0]) if metric in ("cpu", "memory") else result
+
+_default_sampler = None
+_default_sampler_lock = threading.Lock()
+
+def get_sampler():
+    """Return the process-wide telemetry sampler, starting it on first use."""
+    global _default_sampler
+    if _default_sampler is None:
+        with _default_sampler_lock:
+            if _default_sampler is None:
+                _default_sampler = TelemetrySampler().start()
+                atexit.register(_default_sampler.stop)
+    return _default_sampler
+
+if __name__ == "__main__":
+    with TelemetrySampler(interval=0.25) as sampler:
+        time.sleep(2)
+        print(f"CPU latest: {sampler.latest('cpu')}%")
+        print(f"CPU EWMA: {sampler.ewma('cpu')}%")
+        print(f"CPU p95 (last 2s): {sampler.percentile('cpu', 95, window=2)}%")
+        print(f"Memory latest: {sampler.latest('memory')}%")
+        print(f"Per-core latest: {sampler.latest('per_core')}")
+        if sampler.has_metric("gpu"):
+            print(f"GPU latest: {sampler.latest('gpu')}%")
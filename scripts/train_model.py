@@ -1,26 +1,26 @@
 import pandas as pd
-from sklearn.model_selection import train_test_split, GridSearchCV
+from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.svm import SVC
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.metrics import accuracy_score, classification_report
-import joblib
 import logging
 import argparse
+import json
+from catalog_cache import load_frame
+from hyperparameter_search import SEARCH_STRATEGIES, search
+from model_registry import publish_model
+from normalization import dataset_name, normalize_frame
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("train_model.log"),
-                        logging.StreamHandler()
-                    ])
 logger = logging.getLogger(__name__)
 
-def load_data(data_path):
-    """Load the dataset from the specified CSV file."""
+ALGORITHMS = ('random_forest', 'gradient_boosting', 'svm', 'knn')
+
+def load_data(data_path, use_cache=True):
+    """Load the dataset from the specified CSV file, through the compiled columnar cache by default."""
     try:
-        data = pd.read_csv(data_path)
+        data = load_frame(data_path) if use_cache else pd.read_csv(data_path)
+        data.attrs["dataset"] = dataset_name(data_path)
         logger.info(f"Data loaded from {data_path}")
         return data
     except Exception as e:
@@ -28,18 +28,11 @@ def load_data(data_path):
         raise
 
 def preprocess_data(data):
-    """Preprocess the dataset and split it into features and labels."""
+    """Preprocess the dataset and split it into features and labels; the dataset schema comes from ``data.attrs``."""
     try:
-        # Identify columns that should be numeric
-        potential_numeric_columns = ['Price', 'TDP', 'Boost Clock', 'Base Clock', 'Turbo Clock', 'Watt', 'Capacity', 'Memory', 'Size']
-        
-        for column in data.columns:
-            if column in potential_numeric_columns:
-                # Remove non-numeric characters
-                data[column] = data[column].replace('[^0-9.]', '', regex=True)
-                # Convert to numeric
-                data[column] = pd.to_numeric(data[column], errors='coerce')
-        
+        # Parse value+unit columns (clock, size, power, length, price) into canonical SI floats
+        data = normalize_frame(data)
+
         features = data.drop(columns=['Producer'])
         labels = data['Producer']
         logger.info("Data preprocessing completed")
@@ -48,6 +41,24 @@ def preprocess_data(data):
         logger.error(f"Error preprocessing data: {e}")
         raise
 
+def numeric_features(features):
+    """
+    Keep the numeric columns, median-imputed and standardized, so every algorithm can fit them.
+
+    Canonical SI values span many orders of magnitude (clocks in Hz, prices in USD);
+    unscaled, the linear SVM does not converge in any reasonable time. String
+    columns (names, sockets, URLs) are dropped.
+    """
+    try:
+        numeric = features.select_dtypes(include=["number", "bool"]).astype(float)
+        numeric = numeric.fillna(numeric.median()).fillna(0.0)
+        numeric = (numeric - numeric.mean()) / numeric.std().replace(0.0, 1.0)
+        logger.info(f"Kept {numeric.shape[1]} of {features.shape[1]} feature columns as numeric features")
+        return numeric
+    except Exception as e:
+        logger.error(f"Error selecting numeric features: {e}")
+        raise
+
 def split_data(features, labels, test_size=0.2, random_state=42):
     """Split the data into training and testing sets."""
     try:
@@ -58,42 +69,69 @@ def split_data(features, labels, test_size=0.2, random_state=42):
         logger.error(f"Error splitting data: {e}")
         raise
 
-def train_model(X_train, y_train, algorithm='random_forest'):
+def get_model_and_grid(algorithm):
+    """Return the unfitted base estimator of an algorithm and its hyperparameter grid."""
+    if algorithm == 'random_forest':
+        model = RandomForestClassifier(random_state=42)
+        param_grid = {
+            'n_estimators': [50, 100],
+            'max_depth': [10, 20],
+            'min_samples_split': [5, 10]
+        }
+    elif algorithm == 'gradient_boosting':
+        model = GradientBoostingClassifier(random_state=42)
+        param_grid = {
+            'n_estimators': [50, 100],
+            'learning_rate': [0.01, 0.1],
+            'max_depth': [3, 4]
+        }
+    elif algorithm == 'svm':
+        model = SVC(kernel='linear', random_state=42)
+        param_grid = {
+            'C': [0.1, 1, 10]
+        }
+    elif algorithm == 'knn':
+        model = KNeighborsClassifier()
+        param_grid = {
+            'n_neighbors': [3, 5, 7]
+        }
+    else:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    return model, param_grid
+
+def search_model(X_train, y_train, algorithm='random_forest', search_strategy='grid', n_jobs=1, checkpoint_path=None):
+    """
+    Search the algorithm's hyperparameter grid and return the SearchResult.
+
+    ``search_strategy`` is 'grid' (every candidate on all rows) or 'halving'
+    (successive halving, over n_estimators for the ensembles); fits run on
+    ``n_jobs`` processes (-1 for all cores) and are checkpointed to
+    ``checkpoint_path`` so an interrupted search resumes.
+    """
+    try:
+        model, param_grid = get_model_and_grid(algorithm)
+        resource, max_resources = 'n_samples', None
+        if search_strategy == 'halving' and 'n_estimators' in param_grid:
+            # Ensembles halve over trees/boosting rounds: early rungs fit few of them on all rows
+            resource, max_resources = 'n_estimators', max(param_grid.pop('n_estimators'))
+
+        logger.info(f"Starting {search_strategy} search for {algorithm} on {n_jobs} job(s)...")
+        result = search(model, param_grid, X_train, y_train, strategy=search_strategy, cv=3, scoring='accuracy',
+                        n_jobs=n_jobs, resource=resource, max_resources=max_resources, checkpoint_path=checkpoint_path)
+        stats = result.stats
+        logger.info(f"Search for {algorithm} took {stats['wall_seconds']:.2f}s wall, {stats['cpu_seconds']:.2f}s CPU "
+                    f"({stats['cpu_utilization']:.0%} utilization), {stats['fits']} fits run, {stats['resumed_fits']} resumed")
+        return result
+    except Exception as e:
+        logger.error(f"Error searching hyperparameters with {algorithm}: {e}")
+        raise
+
+def train_model(X_train, y_train, algorithm='random_forest', search_strategy='grid', n_jobs=1, checkpoint_path=None):
     """Train the model with the training data using the specified algorithm."""
     try:
-        if algorithm == 'random_forest':
-            model = RandomForestClassifier(random_state=42)
-            param_grid = {
-                'n_estimators': [50, 100],
-                'max_depth': [10, 20],
-                'min_samples_split': [5, 10]
-            }
-        elif algorithm == 'gradient_boosting':
-            model = GradientBoostingClassifier(random_state=42)
-            param_grid = {
-                'n_estimators': [50, 100],
-                'learning_rate': [0.01, 0.1],
-                'max_depth': [3, 4]
-            }
-        elif algorithm == 'svm':
-            model = SVC(kernel='linear', random_state=42)
-            param_grid = {
-                'C': [0.1, 1, 10]
-            }
-        elif algorithm == 'knn':
-            model = KNeighborsClassifier()
-            param_grid = {
-                'n_neighbors': [3, 5, 7]
-            }
-        else:
-            raise ValueError(f"Unsupported algorithm: {algorithm}")
-        
-        logger.info("Starting grid search...")
-        grid_search = GridSearchCV(model, param_grid, cv=3, scoring='accuracy')
-        grid_search.fit(X_train, y_train)
-        
-        best_model = grid_search.best_estimator_
-        logger.info(f"Model training completed using {algorithm} with best parameters: {grid_search.best_params_}")
+        result = search_model(X_train, y_train, algorithm, search_strategy, n_jobs, checkpoint_path)
+        best_model = result.best_estimator
+        logger.info(f"Model training completed using {algorithm} with best parameters: {result.best_params}")
         return best_model
     except Exception as e:
         logger.error(f"Error training model with {algorithm}: {e}")
@@ -115,29 +153,48 @@ def evaluate_model(model, X_test, y_test):
         raise
 
 def save_model(model, model_path):
-    """Save the trained model to a file."""
+    """Save the trained model to a file, atomically so running registries never load a partial write."""
     try:
-        joblib.dump(model, model_path)
+        publish_model(model, model_path)
         logger.info(f"Model saved to {model_path}")
     except Exception as e:
         logger.error(f"Error saving model to {model_path}: {e}")
         raise
 
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="train_model.log")
+
     parser = argparse.ArgumentParser(description="Train a machine learning model with the given dataset.")
     parser.add_argument('--data_path', type=str, required=True, help='Path to the dataset CSV file')
     parser.add_argument('--model_path', type=str, default='../models/model.h5', help='Path to save the trained model')
-    parser.add_argument('--algorithm', type=str, default='random_forest', choices=['random_forest', 'gradient_boosting', 'svm', 'knn'], help='Algorithm to use for training the model')
+    parser.add_argument('--no_cache', action='store_true', help='Parse the CSV directly instead of using the columnar cache')
+    parser.add_argument('--algorithm', type=str, default='random_forest', choices=ALGORITHMS, help='Algorithm to use for training the model')
+    parser.add_argument('--search', type=str, default='grid', choices=SEARCH_STRATEGIES, help='Hyperparameter search strategy')
+    parser.add_argument('--n_jobs', type=int, default=1, help='Parallel fits during the search; -1 uses every core')
+    parser.add_argument('--checkpoint_path', type=str, default=None, help='JSON file of finished fits, to resume an interrupted search')
+    parser.add_argument('--report_path', type=str, default=None, help='Write the search timing and CPU utilization report to this JSON file')
+    parser.add_argument('--flat_model_path', type=str, default=None, help='Also export a tree model as flat node arrays to this file')
     args = parser.parse_args()
 
     logger.info("Starting model training...")
 
-    data = load_data(args.data_path)
+    data = load_data(args.data_path, use_cache=not args.no_cache)
     features, labels = preprocess_data(data)
-    X_train, X_test, y_train, y_test = split_data(features, labels)
-    model = train_model(X_train, y_train, algorithm=args.algorithm)
+    known = labels.notna()
+    X_train, X_test, y_train, y_test = split_data(numeric_features(features[known]), labels[known].astype(str))
+    result = search_model(X_train, y_train, algorithm=args.algorithm, search_strategy=args.search,
+                          n_jobs=args.n_jobs, checkpoint_path=args.checkpoint_path)
+    model = result.best_estimator
+    if args.report_path:
+        with open(args.report_path, 'w') as f:
+            json.dump({args.algorithm: {**result.stats, "best_params": result.best_params, "best_score": result.best_score}},
+                      f, indent=2, default=str)
     evaluate_model(model, X_test, y_test)
     save_model(model, args.model_path)
+    if args.flat_model_path:
+        from tree_engine import export_model
+        export_model(args.model_path, args.flat_model_path)
 
     logger.info("Model training and evaluation completed.")
 
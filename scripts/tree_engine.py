@@ -0,0 +1,213 @@
+# quantum_firmware_optimization/scripts/tree_engine.py
+
+import argparse
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FOREST = "forest"
+BOOSTING = "boosting"
+
+class FlatEnsemble:
+    """
+    A fitted tree ensemble compiled into flat NumPy node arrays.
+
+    Every tree's nodes are concatenated into one set of arrays, with child indices
+    rewritten to global node numbers and leaves pointing to themselves. A batch
+    walks all of its rows through all trees at once: each step gathers the split
+    feature and threshold of the current node of every (row, tree) pair and moves
+    it to a child, ``max_depth`` times; pairs that reached a leaf stay on it.
+    There is no per-tree or per-row Python loop and no scikit-learn dispatch, and the object holds only plain arrays, so
+    ``joblib.load(mmap_mode="r")`` (and the model registry) memory-maps it.
+
+    Inputs are compared as float32 against float64 thresholds and missing values
+    follow each node's ``missing_go_to_left``, as in scikit-learn's own trees.
+
+    Attributes:
+        kind (str): 'forest' (leaf class distributions averaged) or 'boosting'
+            (scaled leaf values summed onto an initial raw prediction).
+        classes_ (numpy.ndarray): Class labels, in scikit-learn's order.
+        n_features_in_ (int): Number of input features.
+        max_depth (int): Depth of the deepest tree.
+        roots (numpy.ndarray): (n_trees,) global node number of each tree's root.
+        feature (numpy.ndarray): (n_nodes,) split feature; 0 at leaves.
+        threshold (numpy.ndarray): (n_nodes,) split threshold.
+        children (numpy.ndarray): (2 * n_nodes,) right and left child of each node,
+            interleaved; both are the node itself at leaves.
+        missing_left (numpy.ndarray): (n_nodes,) whether missing values go left.
+        value (numpy.ndarray): Forest: (n_nodes, n_classes) class probabilities
+            divided by the tree count. Boosting: (n_nodes,) leaf value times the
+            learning rate.
+        tree_output (numpy.ndarray): Boosting only: (n_trees, n_outputs) one-hot
+            map of each tree to the raw prediction column it adds to.
+        init_raw (numpy.ndarray): Boosting only: (n_outputs,) initial raw prediction.
+    """
+
+    def __init__(self, kind, classes, n_features, trees, values, tree_output=None, init_raw=None):
+        self.kind = kind
+        self.classes_ = np.asarray(classes)
+        self.n_features_in_ = int(n_features)
+        self.tree_output = tree_output
+        self.init_raw = init_raw
+
+        sizes = [tree.node_count for tree in trees]
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.intp)
+        self.roots = offsets
+        self.max_depth = max(int(tree.max_depth) for tree in trees)
+        feature, threshold, children, missing_left = [], [], [], []
+        for tree, offset in zip(trees, offsets):
+            nodes = np.arange(tree.node_count, dtype=np.intp) + offset
+            leaf = tree.children_left < 0
+            feature.append(np.where(leaf, 0, tree.feature).astype(np.intp))
+            threshold.append(tree.threshold.astype(np.float64))
+            left = np.where(leaf, nodes, tree.children_left + offset)
+            right = np.where(leaf, nodes, tree.children_right + offset)
+            children.append(np.column_stack([right, left]).ravel())
+            missing_left.append(np.asarray(tree.missing_go_to_left, dtype=bool))
+        self.feature = np.concatenate(feature)
+        self.threshold = np.concatenate(threshold)
+        self.children = np.concatenate(children)
+        self.missing_left = np.concatenate(missing_left)
+        self.value = np.concatenate(values)
+
+    @property
+    def n_trees(self):
+        """int: Number of trees."""
+        return len(self.roots)
+
+    def _check_input(self, X):
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Expected input of shape (n, {self.n_features_in_}), got {X.shape}")
+        return X
+
+    def apply(self, X):
+        """
+        Return the leaf each row reaches in each tree.
+
+        Returns:
+            numpy.ndarray: (n_rows, n_trees) global leaf node numbers.
+        """
+        X = self._check_input(X)
+        flat = X.ravel()
+        nodes = np.broadcast_to(self.roots, (len(X), self.n_trees)).copy()
+        row_offsets = (np.arange(len(X), dtype=np.intp) * X.shape[1])[:, None]
+        has_missing = bool(np.isnan(flat).any())
+        for _ in range(self.max_depth):
+            values = np.take(flat, row_offsets + np.take(self.feature, nodes))
+            go_left = values <= np.take(self.threshold, nodes)
+            if has_missing:
+                go_left = np.where(np.isnan(values), np.take(self.missing_left, nodes), go_left)
+            # children holds (right, left) pairs, so 2 * node + go_left picks the child in one gather
+            nodes = np.take(self.children, 2 * nodes + go_left)
+        return nodes
+
+    def decision_function(self, X):
+        """Return the raw boosting prediction: (n_rows,) for binary, (n_rows, n_classes) otherwise."""
+        if self.kind != BOOSTING:
+            raise AttributeError("decision_function is only available for boosting ensembles")
+        raw = self.init_raw + self.value[self.apply(X)] @ self.tree_output
+        return raw[:, 0] if raw.shape[1] == 1 else raw
+
+    def predict_proba(self, X):
+        """Return (n_rows, n_classes) class probabilities."""
+        if self.kind == FOREST:
+            # Per-tree probabilities are pre-divided by the tree count, so the sum is the mean
+            return self.value[self.apply(X)].sum(axis=1)
+        raw = self.decision_function(X)
+        if raw.ndim == 1:
+            positive = 1.0 / (1.0 + np.exp(-raw))
+            return np.column_stack([1.0 - positive, positive])
+        exp = np.exp(raw - raw.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict(self, X):
+        """Return the predicted class label of each row."""
+        if self.kind == FOREST:
+            return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+        raw = self.decision_function(X)
+        encoded = (raw >= 0).astype(np.intp) if raw.ndim == 1 else np.argmax(raw, axis=1)
+        return self.classes_[encoded]
+
+def compile_ensemble(model):
+    """
+    Compile a fitted tree classifier into a FlatEnsemble.
+
+    Supports RandomForestClassifier, ExtraTreesClassifier, DecisionTreeClassifier and
+    GradientBoostingClassifier (with the default prior or 'zero' init), single-output.
+
+    Args:
+        model: The fitted scikit-learn classifier.
+
+    Returns:
+        FlatEnsemble: The compiled model.
+    """
+    from sklearn.dummy import DummyClassifier
+    from sklearn.ensemble import ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier
+    from sklearn.tree import DecisionTreeClassifier
+
+    if isinstance(model, GradientBoostingClassifier):
+        if not (model.init_ == "zero" or isinstance(model.init_, DummyClassifier)):
+            raise ValueError(f"Unsupported init estimator: {type(model.init_).__name__}")
+        n_stages, n_outputs = model.estimators_.shape
+        trees = [model.estimators_[stage, k].tree_ for stage in range(n_stages) for k in range(n_outputs)]
+        values = [tree.value[:, 0, 0] * model.learning_rate for tree in trees]
+        tree_output = np.tile(np.eye(n_outputs), (n_stages, 1))
+        # The default init predicts the training prior whatever the input, so its raw output is a constant
+        init_raw = model._raw_predict_init(np.zeros((1, model.n_features_in_), dtype=np.float32))[0]
+        return FlatEnsemble(BOOSTING, model.classes_, model.n_features_in_, trees, values,
+                            tree_output=tree_output, init_raw=init_raw.astype(np.float64))
+
+    if isinstance(model, (RandomForestClassifier, ExtraTreesClassifier)):
+        estimators = model.estimators_
+    elif isinstance(model, DecisionTreeClassifier):
+        estimators = [model]
+    else:
+        raise ValueError(f"Unsupported model type: {type(model).__name__}")
+    if np.ndim(model.classes_) != 1 or estimators[0].tree_.n_outputs != 1:
+        raise ValueError("Only single-output classifiers can be compiled")
+    trees = [estimator.tree_ for estimator in estimators]
+    values = []
+    for tree in trees:
+        value = tree.value[:, 0, :].astype(np.float64)
+        totals = value.sum(axis=1, keepdims=True)
+        totals[totals == 0.0] = 1.0
+        values.append(value / totals / len(trees))
+    return FlatEnsemble(FOREST, model.classes_, model.n_features_in_, trees, values)
+
+def export_model(model_path, output_path):
+    """
+    Compile a saved tree model and publish the FlatEnsemble next to it.
+
+    Args:
+        model_path (str): joblib file written by train_model.save_model.
+        output_path (str): Destination of the compiled model.
+
+    Returns:
+        FlatEnsemble: The compiled model.
+    """
+    import joblib
+    from model_registry import publish_model
+
+    try:
+        flat = compile_ensemble(joblib.load(model_path))
+        publish_model(flat, output_path)
+        logger.info(f"Compiled {model_path} into {flat.n_trees} trees, {len(flat.feature)} nodes at {output_path}")
+        return flat
+    except Exception as e:
+        logger.error(f"Error exporting {model_path} to flat arrays: {e}")
+        raise
+
+if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="tree_engine.log")
+
+    parser = argparse.ArgumentParser(description="Compile a trained tree ensemble into flat NumPy node arrays.")
+    parser.add_argument('--model_path', type=str, required=True, help='Path to the trained model file')
+    parser.add_argument('--output_path', type=str, required=True, help='Path to write the compiled model')
+    args = parser.parse_args()
+
+    # Compile through the importable module so the pickle references tree_engine.FlatEnsemble, not __main__
+    from tree_engine import export_model as export
+    export(args.model_path, args.output_path)
@@ -0,0 +1,378 @@
+# quantum_firmware_optimization/scripts/worker_pool.py
+
+import atexit
+import itertools
+import logging
+import multiprocessing as mp
+import queue
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CLASSICAL = "classical"
+QUANTUM = "quantum"
+DEFAULT_WORKERS = {CLASSICAL: 2, QUANTUM: 1}
+# Arrays at least this large travel through shared memory instead of the pickled queue
+DEFAULT_SHM_THRESHOLD = 1 << 20
+DEFAULT_HEALTH_INTERVAL = 0.5
+
+IDLE = -1.0
+
+SharedArray = namedtuple("SharedArray", ["name", "shape", "dtype"])
+
+class WorkerCrashedError(RuntimeError):
+    """Raised through a task's future when its worker died or was restarted mid-task."""
+
+def share_payload(value, threshold=DEFAULT_SHM_THRESHOLD, segments=None):
+    """
+    Move large NumPy arrays in a payload into shared memory.
+
+    Dicts, lists and tuples are walked recursively; arrays of at least ``threshold``
+    bytes are copied into a new shared memory segment and replaced by a SharedArray
+    descriptor. Everything else is left to be pickled.
+
+    Args:
+        value: The payload.
+        threshold (int): Minimum array size in bytes to share.
+        segments (list, optional): Receives the created SharedMemory objects, which
+            the caller must close and unlink once the receiver is done.
+
+    Returns:
+        The payload with large arrays replaced by SharedArray descriptors.
+    """
+    if isinstance(value, np.ndarray) and value.nbytes >= threshold and not value.dtype.hasobject:
+        segment = shared_memory.SharedMemory(create=True, size=max(value.nbytes, 1))
+        np.ndarray(value.shape, dtype=value.dtype, buffer=segment.buf)[...] = value
+        if segments is not None:
+            segments.append(segment)
+        else:
+            segment.close()
+        return SharedArray(segment.name, value.shape, value.dtype.str)
+    if isinstance(value, dict):
+        return {key: share_payload(item, threshold, segments) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and not isinstance(value, SharedArray):
+        return type(value)(share_payload(item, threshold, segments) for item in value)
+    return value
+
+def attach_payload(value, segments, copy=False):
+    """
+    Replace SharedArray descriptors in a payload with arrays backed by shared memory.
+
+    Args:
+        value: The payload produced by share_payload.
+        segments (list): Receives the attached SharedMemory objects.
+        copy (bool): Copy each array out of shared memory instead of returning a view.
+
+    Returns:
+        The payload with NumPy arrays in place of the descriptors.
+    """
+    if isinstance(value, SharedArray):
+        segment = shared_memory.SharedMemory(name=value.name)
+        segments.append(segment)
+        array = np.ndarray(value.shape, dtype=np.dtype(value.dtype), buffer=segment.buf)
+        return array.copy() if copy else array
+    if isinstance(value, dict):
+        return {key: attach_payload(item, segments, copy) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(attach_payload(item, segments, copy) for item in value)
+    return value
+
+def release_segments(segments, unlink=False):
+    """Close (and optionally unlink) shared memory segments, ignoring ones already gone."""
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            # A view into the segment is still alive; the mapping goes away with it
+            pass
+        if unlink:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+    segments.clear()
+
+def _worker_main(worker_id, function, tasks, results, threshold, current):
+    """
+    Worker process loop: run tasks from the backend queue until a None sentinel arrives.
+
+    ``current`` is a shared (task id, start time) pair the parent reads to find the
+    task a dead or hung worker was running; it is written before the task starts.
+    """
+    while True:
+        item = tasks.get()
+        if item is None:
+            break
+        task_id, payload = item
+        current[1] = time.monotonic()
+        current[0] = task_id
+        segments = []
+        try:
+            result = function(attach_payload(payload, segments))
+            out_segments = []
+            message = ("done", worker_id, task_id, share_payload(result, threshold, out_segments))
+            results.put(message)
+            # The parent unlinks result segments after copying them out
+            release_segments(out_segments)
+        except Exception as e:
+            try:
+                results.put(("error", worker_id, task_id, e))
+            except Exception:
+                results.put(("error", worker_id, task_id, RuntimeError(repr(e))))
+        finally:
+            payload = None
+            release_segments(segments)
+            current[0] = IDLE
+
+class WorkerPool:
+    """
+    Long-lived pool of classical and quantum worker processes.
+
+    Each backend has its own task queue and set of workers, so a queue of slow quantum
+    simulations never delays classical work. Large NumPy arrays in task payloads and
+    results travel through shared memory; everything else is pickled. Results come back
+    through concurrent.futures.Future objects resolved by a collector thread, and a
+    monitor thread restarts workers that die or exceed ``task_timeout``.
+
+    Functions must be importable top-level callables taking the payload as their only
+    argument, so they can be sent to the worker processes.
+
+    Attributes:
+        functions (dict): Maps each backend name to the function its workers run.
+        workers (dict): Maps each backend name to its number of workers.
+        restarts (int): Number of workers restarted so far.
+    """
+
+    def __init__(self, functions, workers=None, shm_threshold=DEFAULT_SHM_THRESHOLD,
+                 task_timeout=None, health_interval=DEFAULT_HEALTH_INTERVAL, context=None):
+        self.functions = dict(functions)
+        self.workers = {backend: (workers or DEFAULT_WORKERS).get(backend, 1) for backend in self.functions}
+        self.shm_threshold = shm_threshold
+        self.task_timeout = task_timeout
+        self.health_interval = health_interval
+        self.restarts = 0
+        self._context = context or mp.get_context()
+        self._tasks = {backend: self._context.Queue() for backend in self.functions}
+        self._results = self._context.Queue()
+        self._processes = {}
+        # worker_id -> shared (task id, start time) of the task the worker is running
+        self._current = {}
+        self._futures = {}
+        self._segments = {}
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stop = threading.Event()
+
+        # Workers must share the parent's tracker, or each would unlink the shared
+        # memory it attached to when it exits
+        resource_tracker.ensure_running()
+        for backend, count in self.workers.items():
+            for index in range(count):
+                self._start_worker((backend, index))
+        self._collector = threading.Thread(target=self._collect, name="worker-pool-collector", daemon=True)
+        self._monitor = threading.Thread(target=self._watch, name="worker-pool-monitor", daemon=True)
+        self._collector.start()
+        self._monitor.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def _start_worker(self, worker_id):
+        backend = worker_id[0]
+        current = self._context.RawArray('d', [IDLE, 0.0])
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_id, self.functions[backend], self._tasks[backend], self._results, self.shm_threshold, current),
+            name=f"{backend}-worker-{worker_id[1]}",
+            daemon=True,
+        )
+        process.start()
+        self._current[worker_id] = current
+        self._processes[worker_id] = process
+        logger.debug("Started %s (pid %s)", process.name, process.pid)
+
+    def submit(self, backend, payload):
+        """
+        Queue a task for a backend's workers.
+
+        Args:
+            backend (str): The backend to run the task on, e.g. 'classical' or 'quantum'.
+            payload: The task payload passed to the backend's function.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the function's return value.
+        """
+        if backend not in self._tasks:
+            raise ValueError(f"Unsupported backend: {backend}")
+        future = Future()
+        segments = []
+        shared = share_payload(payload, self.shm_threshold, segments)
+        with self._lock:
+            if self._closed:
+                release_segments(segments, unlink=True)
+                raise RuntimeError("Worker pool is shut down")
+            task_id = next(self._task_ids)
+            self._futures[task_id] = future
+            self._segments[task_id] = segments
+        self._tasks[backend].put((task_id, shared))
+        return future
+
+    def _finish(self, task_id, result=None, error=None):
+        with self._lock:
+            future = self._futures.pop(task_id, None)
+            segments = self._segments.pop(task_id, [])
+        release_segments(segments, unlink=True)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _collect(self):
+        """Collector thread: resolve futures from worker messages."""
+        while True:
+            try:
+                message = self._results.get(timeout=self.health_interval)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            if message is None:
+                return
+            kind, worker_id, task_id, value = message
+            if kind == "done":
+                segments = []
+                try:
+                    result = attach_payload(value, segments, copy=True)
+                except FileNotFoundError as e:
+                    self._finish(task_id, error=WorkerCrashedError(f"Result of task {task_id} was lost: {e}"))
+                else:
+                    self._finish(task_id, result=result)
+                finally:
+                    release_segments(segments, unlink=True)
+            else:
+                self._finish(task_id, error=value)
+
+    def _watch(self):
+        """Monitor thread: restart dead or hung workers and fail their in-flight tasks."""
+        while not self._stop.wait(self.health_interval):
+            self.check_health()
+
+    def check_health(self):
+        """
+        Restart workers that died or ran a task longer than ``task_timeout``.
+
+        Returns:
+            list: The ids of the restarted workers.
+        """
+        restarted = []
+        now = time.monotonic()
+        for worker_id, process in list(self._processes.items()):
+            if self._stop.is_set():
+                break
+            task_id = self._current_task(worker_id)
+            started_at = self._current[worker_id][1]
+            hung = self.task_timeout is not None and task_id is not None and now - started_at > self.task_timeout
+            if process.is_alive() and not hung:
+                continue
+            if hung:
+                logger.warning("%s exceeded the %.1fs task timeout; restarting it", process.name, self.task_timeout)
+                process.terminate()
+            else:
+                logger.warning("%s exited with code %s; restarting it", process.name, process.exitcode)
+            process.join(timeout=1.0)
+            task_id = self._current_task(worker_id)
+            if task_id is not None:
+                error = TimeoutError if hung else WorkerCrashedError
+                self._finish(task_id, error=error(f"Task {task_id} was lost when {process.name} was restarted"))
+            self.restarts += 1
+            self._start_worker(worker_id)
+            restarted.append(worker_id)
+        return restarted
+
+    def _current_task(self, worker_id):
+        task_id = self._current[worker_id][0]
+        return None if task_id == IDLE else int(task_id)
+
+    def health(self):
+        """
+        Report the state of every worker.
+
+        Returns:
+            dict: Maps each worker name to its pid, liveness and current task id.
+        """
+        return {
+            process.name: {
+                "pid": process.pid,
+                "alive": process.is_alive(),
+                "task": self._current_task(worker_id),
+            }
+            for worker_id, process in self._processes.items()
+        }
+
+    def shutdown(self, wait=True):
+        """
+        Stop the workers and fail any task that has not finished.
+
+        Args:
+            wait (bool): Let workers drain the tasks already queued before stopping.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._stop.set()
+        self._monitor.join()
+        for worker_id, process in self._processes.items():
+            self._tasks[worker_id[0]].put(None)
+        for process in self._processes.values():
+            if wait:
+                process.join()
+            else:
+                process.terminate()
+                process.join()
+        if wait:
+            # A terminated worker may die holding the results queue's write lock, which
+            # would block this put's feeder thread forever; the collector also stops on
+            # its own once _stop is set and the queue is empty
+            self._results.put(None)
+        self._collector.join()
+        with self._lock:
+            pending = list(self._futures)
+        for task_id in pending:
+            self._finish(task_id, error=WorkerCrashedError("Worker pool shut down before the task finished"))
+        for task_queue in list(self._tasks.values()) + [self._results]:
+            task_queue.close()
+        logger.info("Worker pool shut down after %d restart(s)", self.restarts)
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+def get_worker_pool(functions, workers=None):
+    """
+    Return the process-wide worker pool, creating it on first use.
+
+    Args:
+        functions (dict): Maps each backend name to the function its workers run.
+            Only used when the pool is created.
+        workers (dict, optional): Maps each backend name to its number of workers.
+
+    Returns:
+        WorkerPool: The shared pool.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = WorkerPool(functions, workers)
+            atexit.register(_default_pool.shutdown)
+        return _default_pool
@@ -2,13 +2,8 @@
 
 import logging
 
-# Configure package-level logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("quantum_firmware_optimization.log"),
-                        logging.StreamHandler()
-                    ])
-
+# Handlers are installed by entry points through logging_setup.configure_logging;
+# importing the package must not configure logging on its own
 logger = logging.getLogger(__name__)
-logger.info("Quantum Firmware Optimization package initialized.")
+logger.addHandler(logging.NullHandler())
+logger.debug("Quantum Firmware Optimization package initialized.")
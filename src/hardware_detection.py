@@ -4,16 +4,95 @@ import psutil
 import cpuinfo
 import logging
 import subprocess
+import concurrent.futures
+import json
+import os
+import tempfile
+import threading
+import time
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("hardware_detection.log"),
-                        logging.StreamHandler()
-                    ])
 logger = logging.getLogger(__name__)
 
+# Static facts (CPU model, arch, core counts, BIOS) are cached on disk per boot
+DEFAULT_CACHE_PATH = os.environ.get(
+    "QFO_HARDWARE_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "quantum_firmware_optimization", "hardware_snapshot.json"))
+DEFAULT_CACHE_TTL = float(os.environ.get("QFO_HARDWARE_CACHE_TTL", 24 * 60 * 60))
+# A failed firmware probe is remembered this long before dmidecode is tried again
+FIRMWARE_RETRY_TTL = float(os.environ.get("QFO_FIRMWARE_RETRY_TTL", 10 * 60))
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+
+_static_snapshot = None
+_static_snapshot_lock = threading.Lock()
+
+# Every probe runs against its own deadline so one hung probe cannot stall detection
+PROBE_TIMEOUTS = {
+    "cpu": 5.0,
+    "memory": 1.0,
+    "disk": 5.0,
+    "firmware": 5.0
+}
+DEFAULT_PARTITION_TIMEOUT = 2.0
+# dmidecode is killed at this share of the firmware probe's remaining budget, so the
+# child exits (and frees its pool slot) before the probe itself is given up on
+FIRMWARE_TIMEOUT_FRACTION = 0.8
+PROBE_DEFAULTS = {
+    "cpu": {},
+    "memory": {},
+    "disk": {},
+    "firmware": ""
+}
+
+class ProbePool:
+    """
+    Bounded pool of daemon threads for hardware probes.
+
+    Probes such as ``psutil.disk_usage`` on a stale NFS mount can block forever and
+    cannot be interrupted. Running them on daemon threads means a hung probe never
+    blocks interpreter exit, and the semaphore caps how many run at once.
+    """
+
+    def __init__(self, max_workers, name):
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._name = name
+
+    def submit(self, fn, *args, slot_timeout=None):
+        """
+        Schedule a probe and return a future for its result.
+
+        Args:
+            fn (callable): The probe to run.
+            *args: Positional arguments for the probe.
+            slot_timeout (float, optional): How long to wait for a free worker slot.
+
+        Returns:
+            concurrent.futures.Future: The future result of the probe.
+        """
+        future = concurrent.futures.Future()
+
+        def worker():
+            if not self._slots.acquire(timeout=slot_timeout):
+                future.set_exception(concurrent.futures.TimeoutError(f"No free {self._name} worker"))
+                return
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        result = fn(*args)
+                    except BaseException as e:
+                        future.set_exception(e)
+                    else:
+                        future.set_result(result)
+            finally:
+                self._slots.release()
+
+        threading.Thread(target=worker, name=f"{self._name}-{getattr(fn, '__name__', 'probe')}", daemon=True).start()
+        return future
+
+_probe_pool = ProbePool(max_workers=4, name="hardware-probe")
+_partition_pool = ProbePool(max_workers=8, name="partition-probe")
+# Mountpoints whose last usage probe is still hung; they are skipped until it returns
+_stalled_mountpoints = {}
+
 def get_cpu_info():
     """
     Get information about the CPU.
@@ -31,7 +110,7 @@ def get_cpu_info():
             "count": psutil.cpu_count(logical=False),
             "logical_count": psutil.cpu_count(logical=True)
         }
-        logger.info(f"CPU info: {cpu_info}")
+        logger.info("CPU info: %s", cpu_info)
         return cpu_info
     except Exception as e:
         logger.error(f"Error getting CPU info: {e}")
@@ -53,69 +132,358 @@ def get_memory_info():
             "used": mem.used,
             "free": mem.free
         }
-        logger.info(f"Memory info: {memory_info}")
+        logger.info("Memory info: %s", memory_info)
         return memory_info
     except Exception as e:
         logger.error(f"Error getting memory info: {e}")
         return {}
 
-def get_disk_info():
+def get_disk_info(partition_timeout=DEFAULT_PARTITION_TIMEOUT):
     """
     Get information about the disk partitions and usage.
 
+    Partitions are probed concurrently. A partition that does not answer within
+    ``partition_timeout`` seconds, or whose previous probe is still hung, is reported
+    as ``{"missing": True, "reason": ...}`` instead of blocking the others.
+
+    Args:
+        partition_timeout (float): Deadline in seconds for each partition's usage probe.
+
     Returns:
         dict: A dictionary containing disk information for each partition.
     """
     try:
         disk_info = {}
         partitions = psutil.disk_partitions()
+        futures = {}
         for partition in partitions:
-            usage = psutil.disk_usage(partition.mountpoint)
+            pending = _stalled_mountpoints.get(partition.mountpoint)
+            if pending is not None and not pending.done():
+                disk_info[partition.device] = {"missing": True, "reason": "stalled"}
+                continue
+            futures[partition] = _partition_pool.submit(psutil.disk_usage, partition.mountpoint,
+                                                        slot_timeout=partition_timeout)
+
+        deadline = time.monotonic() + partition_timeout
+        for partition, future in futures.items():
+            try:
+                usage = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except concurrent.futures.TimeoutError:
+                logger.warning(f"Disk usage probe for {partition.mountpoint} timed out after {partition_timeout}s")
+                _stalled_mountpoints[partition.mountpoint] = future
+                disk_info[partition.device] = {"missing": True, "reason": "timeout"}
+                continue
+            except OSError as e:
+                logger.warning(f"Disk usage probe for {partition.mountpoint} failed: {e}")
+                disk_info[partition.device] = {"missing": True, "reason": str(e)}
+                continue
+            _stalled_mountpoints.pop(partition.mountpoint, None)
             disk_info[partition.device] = {
                 "total": usage.total,
                 "used": usage.used,
                 "free": usage.free,
                 "percent": usage.percent
             }
-        logger.info(f"Disk info: {disk_info}")
+        logger.info("Disk info: %.1024s", disk_info)
         return disk_info
     except Exception as e:
         logger.error(f"Error getting disk info: {e}")
         return {}
 
-def get_firmware_version():
+def get_firmware_version(timeout=PROBE_TIMEOUTS["firmware"] * FIRMWARE_TIMEOUT_FRACTION):
     """
     Get the firmware version of the system.
 
+    Args:
+        timeout (float): Seconds to wait for dmidecode before killing it.
+
     Returns:
         str: The firmware version information.
+
+    Raises:
+        RuntimeError: If dmidecode exits with an error or prints nothing (e.g. without root).
+        OSError: If dmidecode is not installed.
+        subprocess.TimeoutExpired: If dmidecode does not finish within ``timeout``.
     """
     try:
-        result = subprocess.run(["dmidecode", "-t", "bios"], capture_output=True, text=True)
+        result = subprocess.run(["dmidecode", "-t", "bios"], capture_output=True, text=True, timeout=timeout)
         firmware_version = result.stdout.strip()
-        logger.info(f"Firmware version: {firmware_version}")
+        if result.returncode != 0 or not firmware_version:
+            raise RuntimeError(f"dmidecode exited with status {result.returncode}: {result.stderr.strip()[:256]}")
+        logger.info("Firmware version: %.512s", firmware_version)
         return firmware_version
     except Exception as e:
         logger.error(f"Error getting firmware version: {e}")
-        return str(e)
+        raise
+
+def _firmware_probe(timeouts=None):
+    """
+    Return a firmware probe whose dmidecode timeout ends before the probe's deadline.
+
+    The deadline starts now, like the one run_probes sets right after, and dmidecode
+    gets FIRMWARE_TIMEOUT_FRACTION of whatever is left of it when the probe starts.
+    """
+    deadline = time.monotonic() + {**PROBE_TIMEOUTS, **(timeouts or {})}["firmware"]
+    return lambda: get_firmware_version(timeout=max(0.0, deadline - time.monotonic()) * FIRMWARE_TIMEOUT_FRACTION)
+
+def run_probes(probes, timeouts=None):
+    """
+    Run hardware probes concurrently, each against its own deadline.
+
+    Args:
+        probes (dict): Mapping of probe name to a zero-argument callable.
+        timeouts (dict, optional): Mapping of probe name to its deadline in seconds.
+            Defaults to PROBE_TIMEOUTS.
+
+    Returns:
+        tuple: A dict of results and a sorted list of probes that timed out or failed.
+            Missing probes are filled in from PROBE_DEFAULTS.
+    """
+    timeouts = {**PROBE_TIMEOUTS, **(timeouts or {})}
+    start = time.monotonic()
+    futures = {name: _probe_pool.submit(probe, slot_timeout=timeouts[name]) for name, probe in probes.items()}
+    results = {}
+    missing = []
+    for name, future in futures.items():
+        try:
+            results[name] = future.result(timeout=max(0.0, start + timeouts[name] - time.monotonic()))
+        except concurrent.futures.TimeoutError:
+            logger.warning(f"Hardware probe '{name}' timed out after {timeouts[name]}s")
+            missing.append(name)
+        except Exception as e:
+            logger.error(f"Hardware probe '{name}' failed: {e}")
+            missing.append(name)
+    for name in missing:
+        results[name] = PROBE_DEFAULTS.get(name)
+    return results, sorted(missing)
+
+def get_boot_id():
+    """
+    Get an identifier for the current boot of the system.
+
+    Returns:
+        str: The kernel boot ID, or the boot timestamp where no boot ID is exposed.
+    """
+    try:
+        with open(BOOT_ID_PATH) as boot_id_file:
+            return boot_id_file.read().strip()
+    except OSError:
+        return str(psutil.boot_time())
+
+def _snapshot_is_valid(snapshot, boot_id, ttl):
+    """Check that a static snapshot belongs to this boot and has not expired."""
+    return (isinstance(snapshot, dict)
+            and snapshot.get("boot_id") == boot_id
+            and time.time() - snapshot.get("created_at", 0) < ttl)
+
+def load_static_snapshot(cache_path=DEFAULT_CACHE_PATH, ttl=DEFAULT_CACHE_TTL):
+    """
+    Load the cached static hardware snapshot from disk.
+
+    Args:
+        cache_path (str): The path to the snapshot cache file.
+        ttl (float): Maximum age of the snapshot in seconds.
+
+    Returns:
+        dict: The cached snapshot, or None if it is missing, stale or from another boot.
+    """
+    try:
+        with open(cache_path) as cache_file:
+            snapshot = json.load(cache_file)
+    except (OSError, ValueError) as e:
+        logger.debug(f"No usable hardware snapshot at {cache_path}: {e}")
+        return None
+    if not _snapshot_is_valid(snapshot, get_boot_id(), ttl):
+        logger.info(f"Hardware snapshot at {cache_path} is stale, ignoring it")
+        return None
+    return snapshot
 
-def get_hardware_info():
+def save_static_snapshot(snapshot, cache_path=DEFAULT_CACHE_PATH):
+    """
+    Atomically write the static hardware snapshot to disk.
+
+    Args:
+        snapshot (dict): The snapshot to save.
+        cache_path (str): The path to the snapshot cache file.
+
+    Returns:
+        bool: True if the snapshot was saved, False otherwise.
+    """
+    try:
+        cache_dir = os.path.dirname(cache_path) or "."
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".hardware_snapshot.")
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(snapshot, tmp_file)
+        os.replace(tmp_path, cache_path)
+        logger.info(f"Hardware snapshot saved to {cache_path}")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving hardware snapshot to {cache_path}: {e}")
+        return False
+
+def _cached_static_snapshot(ttl, cache_path):
+    """Return the valid in-memory or on-disk static snapshot, or None."""
+    global _static_snapshot
+    with _static_snapshot_lock:
+        snapshot = _static_snapshot
+        if snapshot is None or snapshot.get("cache_path") != cache_path \
+                or not _snapshot_is_valid(snapshot, get_boot_id(), ttl):
+            snapshot = load_static_snapshot(cache_path, ttl)
+        if snapshot is not None:
+            snapshot["cache_path"] = cache_path
+        _static_snapshot = snapshot
+        return snapshot
+
+def _store_static_snapshot(cpu_info, firmware_version, missing, use_cache, cache_path, created_at=None):
+    """
+    Cache freshly probed static facts.
+
+    Nothing is cached when the CPU probe failed. A failed firmware probe is cached as
+    a negative entry so the CPU facts are still reused, and only dmidecode is retried
+    once FIRMWARE_RETRY_TTL has passed.
+    """
+    global _static_snapshot
+    if not use_cache or "cpu" in missing or not cpu_info:
+        return
+    snapshot = {
+        "boot_id": get_boot_id(),
+        "created_at": time.time() if created_at is None else created_at,
+        "cpu": cpu_info,
+        "firmware": firmware_version
+    }
+    if "firmware" in missing:
+        snapshot["firmware_failed_at"] = time.time()
+    with _static_snapshot_lock:
+        save_static_snapshot(snapshot, cache_path)
+        snapshot["cache_path"] = cache_path
+        _static_snapshot = snapshot
+
+def _static_probes(snapshot, timeouts):
+    """Return the static probes a cached snapshot (or its absence) still calls for."""
+    if snapshot is None:
+        return {"cpu": get_cpu_info, "firmware": _firmware_probe(timeouts)}
+    failed_at = snapshot.get("firmware_failed_at")
+    if failed_at is not None and time.time() - failed_at >= FIRMWARE_RETRY_TTL:
+        return {"firmware": _firmware_probe(timeouts)}
+    return {}
+
+def _merge_static_results(results, missing, snapshot, use_cache, cache_path):
+    """
+    Fill cached static facts into probe results and cache the newly probed ones.
+
+    Returns:
+        list: The missing probes, including a firmware probe that failed recently.
+    """
+    if snapshot is None:
+        _store_static_snapshot(results["cpu"], results["firmware"], missing, use_cache, cache_path)
+        return missing
+    results["cpu"] = snapshot["cpu"]
+    if "firmware" in results:
+        _store_static_snapshot(snapshot["cpu"], results["firmware"], missing, use_cache, cache_path,
+                               created_at=snapshot["created_at"])
+        return missing
+    results["firmware"] = snapshot["firmware"]
+    if "firmware_failed_at" in snapshot:
+        return sorted(missing + ["firmware"])
+    return missing
+
+def get_static_hardware_info(use_cache=True, ttl=DEFAULT_CACHE_TTL, cache_path=DEFAULT_CACHE_PATH, timeouts=None):
+    """
+    Get hardware facts that do not change while the system is up.
+
+    The CPU and firmware probes are slow, so their results are kept in memory and
+    on disk, keyed by boot ID and invalidated after ``ttl`` seconds. A failed
+    firmware probe is retried after FIRMWARE_RETRY_TTL without re-probing the CPU.
+
+    Args:
+        use_cache (bool): Whether to read and write the snapshot cache.
+        ttl (float): Maximum age of a cached snapshot in seconds.
+        cache_path (str): The path to the snapshot cache file.
+        timeouts (dict, optional): Per-probe deadlines overriding PROBE_TIMEOUTS.
+
+    Returns:
+        dict: A dictionary with the "cpu", "firmware" and "missing" entries.
+    """
+    snapshot = _cached_static_snapshot(ttl, cache_path) if use_cache else None
+    results, missing = run_probes(_static_probes(snapshot, timeouts), timeouts)
+    missing = _merge_static_results(results, missing, snapshot, use_cache, cache_path)
+    return {"cpu": results["cpu"], "firmware": results["firmware"], "missing": missing}
+
+def get_volatile_hardware_info(partition_timeout=DEFAULT_PARTITION_TIMEOUT):
+    """
+    Get hardware facts that change at runtime and are probed on every call.
+
+    Args:
+        partition_timeout (float): Deadline in seconds for each disk partition.
+
+    Returns:
+        dict: A dictionary with the "memory", "disk" and "missing" entries.
+    """
+    results, missing = run_probes({
+        "memory": get_memory_info,
+        "disk": lambda: get_disk_info(partition_timeout=partition_timeout)
+    })
+    return {"memory": results["memory"], "disk": results["disk"], "missing": missing}
+
+def invalidate_hardware_cache(cache_path=DEFAULT_CACHE_PATH):
+    """
+    Drop the in-memory and on-disk static hardware snapshot.
+
+    Args:
+        cache_path (str): The path to the snapshot cache file.
+    """
+    global _static_snapshot
+    with _static_snapshot_lock:
+        _static_snapshot = None
+        try:
+            os.remove(cache_path)
+            logger.info(f"Hardware snapshot {cache_path} removed")
+        except FileNotFoundError:
+            pass
+
+def get_hardware_info(use_cache=True, ttl=DEFAULT_CACHE_TTL, cache_path=DEFAULT_CACHE_PATH,
+                      timeouts=None, partition_timeout=DEFAULT_PARTITION_TIMEOUT):
     """
     Get comprehensive hardware information of the system.
 
+    All probes run concurrently, so detection takes as long as the slowest healthy
+    probe. Probes that time out or fail are listed under "missing" and their entries
+    hold empty defaults.
+
+    Args:
+        use_cache (bool): Whether to serve static facts from the snapshot cache.
+        ttl (float): Maximum age of a cached static snapshot in seconds.
+        cache_path (str): The path to the snapshot cache file.
+        timeouts (dict, optional): Per-probe deadlines overriding PROBE_TIMEOUTS.
+        partition_timeout (float): Deadline in seconds for each disk partition.
+
     Returns:
         dict: A dictionary containing comprehensive hardware information.
     """
+    snapshot = _cached_static_snapshot(ttl, cache_path) if use_cache else None
+    probes = {
+        "memory": get_memory_info,
+        "disk": lambda: get_disk_info(partition_timeout=partition_timeout),
+        **_static_probes(snapshot, timeouts)
+    }
+    results, missing = run_probes(probes, timeouts)
+    missing = _merge_static_results(results, missing, snapshot, use_cache, cache_path)
+
     hardware_info = {
-        "cpu": get_cpu_info(),
-        "memory": get_memory_info(),
-        "disk": get_disk_info(),
-        "firmware": get_firmware_version()
+        "cpu": results["cpu"],
+        "memory": results["memory"],
+        "disk": results["disk"],
+        "firmware": results["firmware"],
+        "missing": missing
     }
-    logger.info(f"Hardware info: {hardware_info}")
+    logger.info("Hardware info: %.2048s", hardware_info)
     return hardware_info
 
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="hardware_detection.log")
+
     logger.info("Starting hardware detection...")
     hardware_info = get_hardware_info()
     logger.info(f"Detected hardware info: {hardware_info}")
@@ -1,36 +1,47 @@
 # quantum_firmware_optimization/src/hybrid_processing.py
 
-import cirq
-import tensorflow as tf
-import tensorflow_quantum as tfq
+import asyncio
 import logging
-from pennylane import qml
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from lazy_imports import lazy_import
 from quantum_assessment import assess_quantum_readiness
+from routing_plan import QUANTUM, CLASSICAL
+
+# Heavy backends are only imported on first use of the path that needs them
+cirq = lazy_import("cirq")
+tf = lazy_import("tensorflow")
+tfq = lazy_import("tensorflow_quantum")
+qml = lazy_import("pennylane")
+simulator_pool = lazy_import("simulator_pool")
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("hybrid_processing.log"),
-                        logging.StreamHandler()
-                    ])
 logger = logging.getLogger(__name__)
 
-def run_quantum_circuit(circuit, parameters):
+# "planned" runs the routed path only, "first" races both paths and keeps the first
+# successful result, "gather" runs both side by side and returns both results
+ASYNC_MODES = ("planned", "first", "gather")
+DEFAULT_QUANTUM_CONCURRENCY = 2
+DEFAULT_CLASSICAL_CONCURRENCY = 4
+
+def run_quantum_circuit(circuit, parameters, repetitions=1):
     """
     Run a quantum circuit simulation using Cirq.
 
+    The circuit is prepared once per structure and run on a pooled simulator, so
+    repeated runs of the same circuit with new parameters skip the setup work.
+
     Args:
         circuit (cirq.Circuit): The quantum circuit to simulate.
         parameters (dict): The parameters for the circuit.
+        repetitions (int): Number of times to sample the circuit.
 
     Returns:
         cirq.Result: The result of the quantum circuit simulation.
     """
     try:
-        simulator = cirq.Simulator()
-        result = simulator.run(circuit, param_resolver=cirq.ParamResolver(parameters))
-        logger.info(f"Quantum circuit simulation result: {result}")
+        result = simulator_pool.run_circuit(circuit, parameters, repetitions=repetitions)
+        logger.info("Quantum circuit simulation result: %.512s", result)
         return result
     except Exception as e:
         logger.error(f"Error running quantum circuit simulation: {e}")
@@ -49,13 +60,13 @@ def run_classical_model(model, data):
     """
     try:
         predictions = model.predict(data)
-        logger.info(f"Classical model predictions: {predictions}")
+        logger.info("Classical model predictions: %.512s", predictions)
         return predictions
     except Exception as e:
         logger.error(f"Error running classical model: {e}")
         raise
 
-def hybrid_processing(task_description, data, circuit=None, parameters=None, model=None):
+def hybrid_processing(task_description, data, circuit=None, parameters=None, model=None, plan=None):
     """
     Determine if a task requires quantum or classical processing and execute accordingly.
 
@@ -65,12 +76,19 @@ def hybrid_processing(task_description, data, circuit=None, parameters=None, mod
         circuit (cirq.Circuit, optional): The quantum circuit to run if needed.
         parameters (dict, optional): The parameters for the quantum circuit.
         model (tensorflow.keras.Model, optional): The classical model to run if needed.
+        plan (RoutingPlan, optional): The routing plan for the task. When given, the
+            task is not assessed again.
 
     Returns:
         The result of either the quantum or classical processing.
     """
     try:
-        if assess_quantum_readiness(task_description):
+        if plan is not None:
+            plan.check_task(task_description)
+            requires_quantum = plan.is_quantum
+        else:
+            requires_quantum = assess_quantum_readiness(task_description)
+        if requires_quantum:
             logger.info("Task requires quantum processing.")
             return run_quantum_circuit(circuit, parameters)
         else:
@@ -80,7 +98,158 @@ def hybrid_processing(task_description, data, circuit=None, parameters=None, mod
         logger.error(f"Error in hybrid processing: {e}")
         raise
 
+class AsyncHybridExecutor:
+    """
+    Runs the quantum and classical paths off the event loop.
+
+    Each backend has its own thread pool, and its own semaphore that bounds how many
+    calls may be queued or running at once, so a burst of quantum simulations cannot
+    starve classical predictions and vice versa. Semaphores are created lazily per
+    event loop, so one executor can serve loops that come and go.
+
+    Attributes:
+        quantum_concurrency (int): Maximum concurrent quantum simulations.
+        classical_concurrency (int): Maximum concurrent model predictions.
+    """
+
+    def __init__(self, quantum_concurrency=DEFAULT_QUANTUM_CONCURRENCY, classical_concurrency=DEFAULT_CLASSICAL_CONCURRENCY):
+        self.quantum_concurrency = quantum_concurrency
+        self.classical_concurrency = classical_concurrency
+        self._pools = {
+            QUANTUM: ThreadPoolExecutor(max_workers=quantum_concurrency, thread_name_prefix="hybrid-quantum"),
+            CLASSICAL: ThreadPoolExecutor(max_workers=classical_concurrency, thread_name_prefix="hybrid-classical"),
+        }
+        self._limits = {QUANTUM: quantum_concurrency, CLASSICAL: classical_concurrency}
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self, loop, backend):
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self._semaphores.setdefault(
+                loop, {name: asyncio.Semaphore(limit) for name, limit in self._limits.items()})
+        return semaphores[backend]
+
+    async def _submit(self, backend, fn, *args):
+        loop = asyncio.get_running_loop()
+        async with self._semaphore(loop, backend):
+            return await loop.run_in_executor(self._pools[backend], fn, *args)
+
+    async def run_quantum(self, circuit, parameters, repetitions=1):
+        """Run run_quantum_circuit on the quantum pool."""
+        return await self._submit(QUANTUM, run_quantum_circuit, circuit, parameters, repetitions)
+
+    async def run_classical(self, model, data):
+        """Run run_classical_model on the classical pool."""
+        return await self._submit(CLASSICAL, run_classical_model, model, data)
+
+    def shutdown(self, wait=True):
+        """Shut down both thread pools; queued calls that have not started are dropped."""
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+def get_async_executor():
+    """Return the process-wide AsyncHybridExecutor, creating it on first use."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = AsyncHybridExecutor()
+        return _default_executor
+
+async def _first_success(tasks):
+    """Return (backend, result) of the first task to succeed, cancelling the others."""
+    pending = set(tasks)
+    errors = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return tasks[task], task.result()
+                logger.warning("%s path failed while racing: %s", tasks[task], task.exception())
+                errors.append(task.exception())
+        raise errors[0]
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def _gather_all(tasks):
+    """Return {backend: result} for every task; if one fails, cancel the rest and raise."""
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return dict(zip(tasks.values(), results))
+
+async def hybrid_processing_async(task_description, data, circuit=None, parameters=None, model=None, plan=None,
+                                  mode="planned", timeout=None, executor=None):
+    """
+    Asynchronous variant of hybrid_processing.
+
+    Simulation and model prediction run in the executor's per-backend thread pools, so
+    the event loop stays free to serve other tasks. Cancelling the returned coroutine
+    cancels calls that have not started yet; a call that is already running finishes
+    in its worker thread and its result is discarded.
+
+    Args:
+        task_description (str): The description of the task.
+        data (numpy.ndarray): The input data for the model.
+        circuit (cirq.Circuit, optional): The quantum circuit to run if needed.
+        parameters (dict, optional): The parameters for the quantum circuit.
+        model (tensorflow.keras.Model, optional): The classical model to run if needed.
+        plan (RoutingPlan, optional): The routing plan for the task. Only used in
+            "planned" mode; when given, the task is not assessed again.
+        mode (str): "planned" to run the routed path, "first" to race both paths, or
+            "gather" to run both side by side.
+        timeout (float, optional): Seconds to wait for the result before cancelling.
+        executor (AsyncHybridExecutor, optional): Defaults to the shared executor.
+
+    Returns:
+        The routed path's result in "planned" mode, a (backend, result) tuple for the
+        winning path in "first" mode, or a {backend: result} dict in "gather" mode.
+
+    Raises:
+        TimeoutError: If the result is not ready within ``timeout`` seconds.
+    """
+    if mode not in ASYNC_MODES:
+        raise ValueError(f"Unsupported mode: {mode}")
+    executor = get_async_executor() if executor is None else executor
+    try:
+        if mode == "planned":
+            if plan is not None:
+                plan.check_task(task_description)
+                requires_quantum = plan.is_quantum
+            else:
+                requires_quantum = assess_quantum_readiness(task_description)
+            if requires_quantum:
+                logger.info("Task requires quantum processing.")
+                work = executor.run_quantum(circuit, parameters)
+            else:
+                logger.info("Task requires classical processing.")
+                work = executor.run_classical(model, data)
+        else:
+            tasks = {
+                asyncio.ensure_future(executor.run_quantum(circuit, parameters)): QUANTUM,
+                asyncio.ensure_future(executor.run_classical(model, data)): CLASSICAL,
+            }
+            logger.info("Running quantum and classical paths concurrently (%s).", mode)
+            work = _first_success(tasks) if mode == "first" else _gather_all(tasks)
+        return await asyncio.wait_for(work, timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"Hybrid processing timed out after {timeout} seconds")
+        raise
+    except Exception as e:
+        logger.error(f"Error in async hybrid processing: {e}")
+        raise
+
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="hybrid_processing.log")
+
     # Example usage
     task_description = "Optimize the portfolio using quantum methods"
     data = ...  # Load or generate data
@@ -0,0 +1,109 @@
+# quantum_firmware_optimization/src/lazy_imports.py
+
+import importlib
+import logging
+import sys
+import threading
+import time
+import types
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module proxy that defers the real import until an attribute is first accessed.
+
+    Heavy backends such as TensorFlow, TensorFlow Quantum, Cirq and PennyLane take
+    seconds and hundreds of MB to import. Binding them through a LazyModule keeps
+    module-level names like ``cirq`` or ``tf`` available while only paying the import
+    cost on the code path that actually uses them.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        """
+        Import the wrapped module on first use.
+
+        Returns:
+            module: The real module object.
+        """
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+        with self.__dict__["_lazy_lock"]:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                start = time.perf_counter()
+                module = importlib.import_module(self.__name__)
+                self.__dict__["_lazy_module"] = module
+                logger.debug("Imported %s in %.3fs", self.__name__, time.perf_counter() - start)
+        return module
+
+    @property
+    def is_loaded(self):
+        """bool: True once the wrapped module has been imported."""
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr):
+        delattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name):
+    """
+    Return a lazily imported module.
+
+    If the module has already been imported elsewhere it is returned directly,
+    otherwise a shared LazyModule proxy is returned for it.
+
+    Args:
+        name (str): The fully qualified module name, e.g. ``"tensorflow"``.
+
+    Returns:
+        module: The imported module or a LazyModule proxy for it.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _registry_lock:
+        proxy = _registry.get(name)
+        if proxy is None:
+            proxy = LazyModule(name)
+            _registry[name] = proxy
+        return proxy
+
+
+def is_imported(name):
+    """
+    Check whether a module has actually been imported.
+
+    Args:
+        name (str): The fully qualified module name.
+
+    Returns:
+        bool: True if the real module is loaded, False if it is still deferred.
+    """
+    proxy = _registry.get(name)
+    if proxy is not None and proxy.is_loaded:
+        return True
+    return name in sys.modules
@@ -1,19 +1,12 @@
 # quantum_firmware_optimization/src/main.py
 
 from hardware_detection import get_hardware_info
-from quantum_assessment import assess_quantum_readiness
+from routing_plan import plan_routing
 from resource_allocation import allocate_resources
 from hybrid_processing import hybrid_processing
 import logging
 import argparse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("main.log"),
-                        logging.StreamHandler()
-                    ])
 logger = logging.getLogger(__name__)
 
 def main(task_description, data, circuit=None, parameters=None, model=None):
@@ -32,12 +25,15 @@ def main(task_description, data, circuit=None, parameters=None, model=None):
         hardware_info = get_hardware_info()
         logger.info(f"Hardware Information: {hardware_info}")
 
+        # Assess the task once; every stage below follows the same plan
+        plan = plan_routing(task_description, hardware_info)
+
         logger.info("Allocating resources...")
-        resource_allocation = allocate_resources(task_description)
+        resource_allocation = allocate_resources(task_description, plan=plan)
         logger.info(f"Allocated resources: {resource_allocation}")
 
         logger.info("Starting hybrid processing...")
-        result = hybrid_processing(task_description, data, circuit=circuit, parameters=parameters, model=model)
+        result = hybrid_processing(task_description, data, circuit=circuit, parameters=parameters, model=model, plan=plan)
         logger.info(f"Processing result: {result}")
         print(f"Processing result: {result}")
 
@@ -46,6 +42,9 @@ def main(task_description, data, circuit=None, parameters=None, model=None):
         raise
 
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="main.log")
+
     parser = argparse.ArgumentParser(description="Quantum Firmware Optimization Main Script")
     parser.add_argument('--task_description', type=str, required=True, help='Description of the task')
     parser.add_argument('--data', type=str, required=True, help='Path to the input data file')
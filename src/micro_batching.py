@@ -0,0 +1,184 @@
+# quantum_firmware_optimization/src/micro_batching.py
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_DELAY = 0.005
+# Number of recent batches the latency and batch size metrics are computed over
+DEFAULT_METRICS_WINDOW = 1024
+
+class MicroBatcher:
+    """
+    Merges concurrent inference requests into single ``model.predict`` calls.
+
+    A background thread takes the first queued request, then keeps collecting
+    requests until the batch holds ``max_batch_size`` rows or ``max_delay`` seconds
+    have passed since that first request arrived. Requests whose rows have the same
+    shape and dtype are concatenated into one predict call and the predictions are
+    split back to each caller in order.
+
+    The batcher has a ``predict`` method of its own, so it can be passed anywhere a
+    model is expected, e.g. ``run_classical_model(batcher, data)``.
+
+    Attributes:
+        model: The wrapped model; anything with a ``predict(array)`` method.
+        max_batch_size (int): Maximum number of rows per predict call.
+        max_delay (float): Maximum seconds a request waits for others to join it.
+    """
+
+    def __init__(self, model, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_delay=DEFAULT_MAX_DELAY,
+                 metrics_window=DEFAULT_METRICS_WINDOW):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._requests = queue.Queue()
+        self._carry = None
+        self._metrics_lock = threading.Lock()
+        self._batch_sizes = deque(maxlen=metrics_window)
+        self._queue_latencies = deque(maxlen=metrics_window)
+        self._totals = {"requests": 0, "rows": 0, "batches": 0, "errors": 0}
+        # Held while checking _closed and queueing, so no request can land behind the stop sentinel
+        self._submit_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def submit(self, data):
+        """
+        Queue rows for inference.
+
+        Args:
+            data (numpy.ndarray): One or more input rows; the first axis is the batch axis.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the predictions for ``data``'s rows.
+        """
+        data = np.asarray(data)
+        if data.ndim == 0:
+            raise ValueError("Input must have a batch axis")
+        future = Future()
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._requests.put((data, future, time.monotonic()))
+        return future
+
+    def predict(self, data, timeout=None):
+        """Submit rows and block until their predictions are ready."""
+        return self.submit(data).result(timeout)
+
+    def _next_request(self, timeout):
+        if self._carry is not None:
+            request, self._carry = self._carry, None
+            return request
+        return self._requests.get(timeout=timeout) if timeout is None or timeout > 0 else self._requests.get_nowait()
+
+    def _collect_batch(self):
+        """Block for the first request, then gather more until the batch is full or the delay expires."""
+        first = self._next_request(None)
+        if first is None:
+            return None
+        batch = [first]
+        rows = len(first[0])
+        deadline = first[2] + self.max_delay
+        while rows < self.max_batch_size:
+            try:
+                request = self._next_request(deadline - time.monotonic())
+            except queue.Empty:
+                break
+            if request is None:
+                # Finish this batch first; the sentinel stops the next one
+                self._requests.put(None)
+                break
+            if rows + len(request[0]) > self.max_batch_size:
+                # Keep the request for the next batch rather than splitting it
+                self._carry = request
+                break
+            batch.append(request)
+            rows += len(request[0])
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                return
+            started = time.monotonic()
+            groups = {}
+            for request in batch:
+                data = request[0]
+                groups.setdefault((data.shape[1:], data.dtype.str), []).append(request)
+            for group in groups.values():
+                self._predict_group(group, started)
+
+    def _predict_group(self, group, started):
+        inputs = [data for data, _, _ in group]
+        try:
+            predictions = self.model.predict(inputs[0] if len(inputs) == 1 else np.concatenate(inputs))
+            offsets = np.cumsum([len(data) for data in inputs])[:-1]
+            outputs = np.split(np.asarray(predictions), offsets)
+        except Exception as e:
+            logger.error(f"Error running batched prediction: {e}")
+            with self._metrics_lock:
+                self._totals["errors"] += 1
+            for _, future, _ in group:
+                future.set_exception(e)
+            return
+        rows = int(sum(len(data) for data in inputs))
+        with self._metrics_lock:
+            self._totals["batches"] += 1
+            self._totals["requests"] += len(group)
+            self._totals["rows"] += rows
+            self._batch_sizes.append(rows)
+            self._queue_latencies.extend(started - enqueued for _, _, enqueued in group)
+        logger.debug("Predicted a batch of %d rows from %d requests", rows, len(group))
+        for (_, future, _), output in zip(group, outputs):
+            future.set_result(output)
+
+    def metrics(self):
+        """
+        Report batching metrics.
+
+        Returns:
+            dict: Lifetime totals, plus the mean batch size and the p50/p95/max queue
+            latency in milliseconds over the most recent batches.
+        """
+        with self._metrics_lock:
+            totals = dict(self._totals)
+            batch_sizes = np.array(self._batch_sizes, dtype=np.float64)
+            latencies = np.array(self._queue_latencies, dtype=np.float64) * 1e3
+        metrics = dict(totals)
+        metrics["mean_batch_size"] = float(batch_sizes.mean()) if batch_sizes.size else 0.0
+        metrics["max_batch_size"] = int(batch_sizes.max()) if batch_sizes.size else 0
+        if latencies.size:
+            p50, p95 = np.percentile(latencies, [50, 95])
+            metrics["queue_latency_ms"] = {"p50": float(p50), "p95": float(p95), "max": float(latencies.max())}
+        else:
+            metrics["queue_latency_ms"] = {"p50": 0.0, "p95": 0.0, "max": 0.0}
+        return metrics
+
+    def close(self, timeout=None):
+        """Stop accepting requests, finish the queued ones and stop the batching thread."""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._thread.join(timeout)
+        logger.info("Micro-batcher closed: %s", self.metrics())
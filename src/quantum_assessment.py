@@ -1,18 +1,99 @@
 # quantum_firmware_optimization/src/quantum_assessment.py
 
+import functools
+import json
 import logging
-import tensorflow as tf
-import tensorflow_quantum as tfq
-
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("quantum_assessment.log"),
-                        logging.StreamHandler()
-                    ])
+import os
+import re
+import threading
+
 logger = logging.getLogger(__name__)
 
+# Keywords and cache size can be changed in this file, or a replacement file can be
+# pointed to with QFO_ASSESSMENT_CONFIG, without touching the code
+ASSESSMENT_CONFIG_PATH = os.environ.get(
+    "QFO_ASSESSMENT_CONFIG", os.path.join(os.path.dirname(os.path.abspath(__file__)), "assessment_config.json"))
+DEFAULT_QUANTUM_KEYWORDS = ("optimization", "simulation", "factorization")
+DEFAULT_CACHE_SIZE = 65536
+
+_config_lock = threading.Lock()
+_cached_match = None
+
+def load_assessment_config(config_path=ASSESSMENT_CONFIG_PATH):
+    """
+    Load the quantum readiness keywords and cache size.
+
+    Args:
+        config_path (str): The path to the JSON assessment config.
+
+    Returns:
+        tuple: The keywords and the maximum number of memoized descriptions.
+    """
+    try:
+        with open(config_path) as config_file:
+            config = json.load(config_file)
+        keywords = tuple(config.get("quantum_keywords", DEFAULT_QUANTUM_KEYWORDS))
+        cache_size = int(config.get("cache_size", DEFAULT_CACHE_SIZE))
+        logger.info(f"Loaded {len(keywords)} quantum readiness keywords from {config_path}")
+        return keywords, cache_size
+    except FileNotFoundError:
+        logger.warning(f"Assessment config {config_path} not found, using default keywords")
+        return DEFAULT_QUANTUM_KEYWORDS, DEFAULT_CACHE_SIZE
+
+def configure_quantum_keywords(keywords=None, cache_size=None, config_path=ASSESSMENT_CONFIG_PATH):
+    """
+    Compile the keyword matcher and reset the memoized results.
+
+    Args:
+        keywords (iterable of str, optional): Keywords marking a task as quantum ready.
+            Loaded from the assessment config when omitted.
+        cache_size (int, optional): Maximum number of memoized descriptions.
+        config_path (str): The path to the JSON assessment config.
+    """
+    global _cached_match
+    config_keywords, config_cache_size = load_assessment_config(config_path)
+    keywords = config_keywords if keywords is None else tuple(keywords)
+    cache_size = config_cache_size if cache_size is None else cache_size
+
+    # Longest keywords first so overlapping keywords cannot shadow each other
+    alternatives = sorted({keyword.lower() for keyword in keywords if keyword}, key=len, reverse=True)
+    matcher = re.compile("|".join(map(re.escape, alternatives))) if alternatives else None
+
+    @functools.lru_cache(maxsize=cache_size)
+    def cached_match(task_description):
+        if matcher is None:
+            return None
+        match = matcher.search(task_description.lower())
+        return match.group(0) if match else None
+
+    with _config_lock:
+        _cached_match = cached_match
+
+def match_quantum_keyword(task_description):
+    """
+    Find the quantum readiness keyword contained in a task description.
+
+    Args:
+        task_description (str): The description of the task.
+
+    Returns:
+        str: The matched keyword, or None if the task is not quantum ready.
+    """
+    if _cached_match is None:
+        configure_quantum_keywords()
+    return _cached_match(task_description)
+
+def assessment_cache_info():
+    """
+    Report hit and miss statistics for the memoized assessments.
+
+    Returns:
+        functools._CacheInfo: The LRU cache statistics.
+    """
+    if _cached_match is None:
+        configure_quantum_keywords()
+    return _cached_match.cache_info()
+
 def assess_quantum_readiness(task_description):
     """
     Assess whether a given task is suitable for quantum processing.
@@ -25,19 +106,44 @@ def assess_quantum_readiness(task_description):
     """
     try:
         # Placeholder for actual machine learning model
-        # For demonstration, we will use a simple heuristic
-        quantum_ready_tasks = ["optimization", "simulation", "factorization"]
-        for keyword in quantum_ready_tasks:
-            if keyword in task_description.lower():
-                logger.info(f"Task '{task_description}' is suitable for quantum processing.")
-                return True
-        logger.info(f"Task '{task_description}' is not suitable for quantum processing.")
+        # For demonstration, we will use a simple keyword heuristic
+        keyword = match_quantum_keyword(task_description)
+        if keyword is not None:
+            logger.debug("Task '%s' is suitable for quantum processing (matched '%s').", task_description, keyword)
+            return True
+        logger.debug("Task '%s' is not suitable for quantum processing.", task_description)
         return False
     except Exception as e:
         logger.error(f"Error in assessing quantum readiness for task '{task_description}': {e}")
         raise
 
+def assess_quantum_readiness_batch(task_descriptions):
+    """
+    Assess a batch of task descriptions for quantum processing.
+
+    Repeated descriptions are only matched once, and previously seen descriptions
+    are served from the memoized results.
+
+    Args:
+        task_descriptions (iterable of str): The task descriptions, e.g. a list or a numpy array.
+
+    Returns:
+        list of bool: True for each task suitable for quantum processing, in input order.
+    """
+    try:
+        descriptions = [str(task_description) for task_description in task_descriptions]
+        verdicts = {description: match_quantum_keyword(description) is not None for description in set(descriptions)}
+        results = [verdicts[description] for description in descriptions]
+        logger.info("Assessed %d tasks (%d unique), %d suitable for quantum processing.", len(results), len(verdicts), sum(results))
+        return results
+    except Exception as e:
+        logger.error(f"Error in assessing quantum readiness for a batch of tasks: {e}")
+        raise
+
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="quantum_assessment.log")
+
     # Example usage
     task_description = "Optimize the portfolio using quantum methods"
     is_quantum_ready = assess_quantum_readiness(task_description)
@@ -3,37 +3,40 @@
 import logging
 from quantum_assessment import assess_quantum_readiness
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("resource_allocation.log"),
-                        logging.StreamHandler()
-                    ])
 logger = logging.getLogger(__name__)
 
-def allocate_resources(task_description):
+def allocate_resources(task_description, plan=None):
     """
     Allocate resources based on the task description.
 
     Args:
         task_description (str): The description of the task.
+        plan (RoutingPlan, optional): The routing plan for the task. When given, the
+            task is not assessed again.
 
     Returns:
         str: 'Quantum' if the task requires quantum resources, 'Classical' otherwise.
     """
     try:
-        if assess_quantum_readiness(task_description):
-            logger.info(f"Allocating quantum resources for task: {task_description}")
+        if plan is not None:
+            plan.check_task(task_description)
+            requires_quantum = plan.is_quantum
+        else:
+            requires_quantum = assess_quantum_readiness(task_description)
+        if requires_quantum:
+            logger.info("Allocating quantum resources for task: %s", task_description)
             return "Quantum"
         else:
-            logger.info(f"Allocating classical resources for task: {task_description}")
+            logger.info("Allocating classical resources for task: %s", task_description)
             return "Classical"
     except Exception as e:
         logger.error(f"Error allocating resources for task '{task_description}': {e}")
         raise
 
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="resource_allocation.log")
+
     # Example usage
     task_description = "Optimize the portfolio using quantum methods"
     allocated_resource = allocate_resources(task_description)
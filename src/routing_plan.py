@@ -0,0 +1,85 @@
+# quantum_firmware_optimization/src/routing_plan.py
+
+import logging
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+from quantum_assessment import match_quantum_keyword
+
+logger = logging.getLogger(__name__)
+
+QUANTUM = "Quantum"
+CLASSICAL = "Classical"
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+@dataclass(frozen=True)
+class RoutingPlan:
+    """
+    Immutable routing decision for a single request.
+
+    The plan is computed once per request and handed to every stage, so resource
+    allocation and hybrid processing never re-assess the task and always agree.
+
+    Attributes:
+        task_description (str): The description of the task the plan was made for.
+        backend (str): 'Quantum' or 'Classical'.
+        reason (str): Why the backend was chosen.
+        hardware (Mapping): Read-only hardware snapshot the decision was based on.
+    """
+    task_description: str
+    backend: str
+    reason: str
+    hardware: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}), repr=False)
+
+    def __post_init__(self):
+        if self.backend not in (QUANTUM, CLASSICAL):
+            raise ValueError(f"Unsupported backend: {self.backend}")
+        object.__setattr__(self, "hardware", _freeze(self.hardware))
+
+    @property
+    def is_quantum(self):
+        """bool: True if the task is routed to quantum processing."""
+        return self.backend == QUANTUM
+
+    def check_task(self, task_description):
+        """
+        Make sure the plan was made for the given task.
+
+        Args:
+            task_description (str): The description of the task about to be processed.
+
+        Raises:
+            ValueError: If the plan belongs to a different task.
+        """
+        if task_description != self.task_description:
+            raise ValueError(f"Routing plan for task '{self.task_description}' used for task '{task_description}'")
+
+def plan_routing(task_description, hardware_info=None):
+    """
+    Assess a task once and produce its routing plan.
+
+    Args:
+        task_description (str): The description of the task.
+        hardware_info (dict, optional): The hardware snapshot to base the plan on.
+
+    Returns:
+        RoutingPlan: The immutable routing plan for the task.
+    """
+    try:
+        keyword = match_quantum_keyword(task_description)
+        if keyword is not None:
+            plan = RoutingPlan(task_description, QUANTUM, f"matched quantum keyword '{keyword}'", hardware_info or {})
+        else:
+            plan = RoutingPlan(task_description, CLASSICAL, "no quantum keyword matched", hardware_info or {})
+        logger.info("Routing plan for task '%s': %s (%s)", task_description, plan.backend, plan.reason)
+        return plan
+    except Exception as e:
+        logger.error(f"Error planning routing for task '{task_description}': {e}")
+        raise
@@ -1 +1,6 @@
-# Init file for tests module
\ No newline at end of file
+# Init file for tests module
+
+# Modules under test import their siblings by bare name, as they do when started through run.py
+from quantum_firmware_optimization.run import add_source_dirs
+
+add_source_dirs()
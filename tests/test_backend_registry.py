@@ -0,0 +1,87 @@
+# quantum_firmware_optimization/tests/test_backend_registry.py
+
+import time
+import unittest
+from quantum_firmware_optimization.scripts.backend_registry import (
+    BackendRegistry, LocalProvider, providers_from_names
+)
+
+class TestBackendRegistry(unittest.TestCase):
+
+    def test_snapshot_reads_local_stand_ins(self):
+        """Test that local stand-in providers run the registry fully offline."""
+        local = LocalProvider(backends=(("sim_a", 3), ("sim_b", 1)))
+        registry = BackendRegistry({"local": local}, interval=60)
+
+        snapshot = registry.snapshot()
+        self.assertEqual([status.name for status in snapshot.available("local")], ["sim_a", "sim_b"])
+        self.assertEqual(snapshot.least_busy().name, "sim_b")
+        self.assertFalse(snapshot.errors)
+
+    def test_snapshot_is_cached_until_refresh(self):
+        """Test that decisions read the cached snapshot and only refreshes query providers."""
+        calls = []
+        local = LocalProvider()
+
+        def counting_provider():
+            calls.append(1)
+            return local()
+
+        registry = BackendRegistry({"local": counting_provider}, interval=60)
+        first = registry.snapshot()
+        local.set_status("local_simulator", available=False)
+        self.assertIs(registry.snapshot(), first)
+        self.assertEqual(len(calls), 1)
+
+        self.assertFalse(registry.refresh().has_available())
+        self.assertEqual(len(calls), 2)
+
+    def test_failed_provider_keeps_previous_statuses(self):
+        """Test that a provider failure is recorded without dropping its last known backends."""
+        local = LocalProvider()
+        failing = {"fail": False}
+
+        def flaky_provider():
+            if failing["fail"]:
+                raise ConnectionError("provider unreachable")
+            return local()
+
+        registry = BackendRegistry({"flaky": flaky_provider}, interval=60)
+        registry.refresh()
+        failing["fail"] = True
+        snapshot = registry.refresh()
+
+        self.assertTrue(snapshot.has_available())
+        self.assertIn("provider unreachable", snapshot.errors["flaky"])
+
+    def test_slow_provider_times_out(self):
+        """Test that a provider exceeding its timeout does not hold up the snapshot."""
+        registry = BackendRegistry({"slow": lambda: time.sleep(1.0) or [], "local": LocalProvider()},
+                                   interval=60, provider_timeout=0.1)
+        start = time.monotonic()
+        snapshot = registry.refresh()
+
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertIn("slow", snapshot.errors)
+        self.assertTrue(snapshot.has_available("local"))
+
+    def test_background_refresh(self):
+        """Test that the background thread publishes new snapshots on its interval."""
+        local = LocalProvider()
+        with BackendRegistry({"local": local}, interval=0.05) as registry:
+            first = registry.snapshot()
+            local.set_status("qpu_stand_in", pending_jobs=7)
+            time.sleep(0.3)
+            snapshot = registry.snapshot()
+
+        self.assertGreater(snapshot.refreshed_at, first.refreshed_at)
+        self.assertIn("qpu_stand_in", [status.name for status in snapshot.backends])
+
+    def test_unknown_provider_name(self):
+        """Test that unknown provider names are rejected."""
+        self.assertIn("local", providers_from_names("local"))
+        with self.assertRaises(ValueError):
+            providers_from_names("local,unknown")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# quantum_firmware_optimization/tests/test_catalog_cache.py
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from quantum_firmware_optimization.scripts.catalog_cache import (
+    CategoryColumn, compile_csv, load_frame, load_table, type_column
+)
+
+CSV = """Name,Cores,Clock,Price,Integrated,MPN,Socket
+Chip A,8,3.7 GHz,$199.99 USD,True,100100,AM4
+Chip B,6,4.2 GHz,$149.50 USD,False,100200,LGA1700
+Chip C,12,3.4 GHz,,True,100300,AM4
+"""
+
+class TestCatalogCache(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = os.path.join(tmp.name, "cache")
+        self.csv_path = os.path.join(tmp.name, "CPUData.csv")
+        self.write_csv(CSV)
+
+    def write_csv(self, text):
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def table_dirs(self):
+        return sorted(name for name in os.listdir(self.cache_dir) if os.path.isdir(os.path.join(self.cache_dir, name)))
+
+    def test_type_column_rules(self):
+        """Test the typing of identifier, bool, int, float, unit and category columns."""
+        cases = [
+            ("MPN", ["100100", "100200"], "category", None),
+            ("Integrated", ["True", "False"], "bool", None),
+            ("Cores", ["8", "6"], "int", None),
+            # Missing values force floats even for whole numbers
+            ("Cores", ["8", None], "float", None),
+            ("TDP", ["65.5", "105"], "float", None),
+            ("Clock", ["3.7 GHz", "4.2 GHz", None], "float", "GHz"),
+            # A value without digits is stored as missing rather than turning the column into strings
+            ("Clock", ["3.7 GHz", "GHz", "4.2 GHz"], "float", "GHz"),
+            # Mixed units are not comparable, so the column stays categorical
+            ("Capacity", ["512 GB", "1 TB"], "category", None),
+            ("Socket", ["AM4", "LGA1700", "AM4"], "category", None),
+            ("Empty", [None, None], "float", None),
+        ]
+        for name, values, kind, unit in cases:
+            with self.subTest(name=name, values=values):
+                result = type_column(name, pd.Series(values, dtype=object))
+                self.assertEqual((result[0], result[2]), (kind, unit))
+
+        _, values, _ = type_column("Clock", pd.Series(["3.7 GHz", "GHz", "4.2 GHz"], dtype=object))
+        np.testing.assert_array_equal(values, [3.7, np.nan, 4.2])
+        _, (codes, categories), _ = type_column("Socket", pd.Series(["AM4", None, "LGA1700", "AM4"], dtype=object))
+        np.testing.assert_array_equal(codes, [0, -1, 1, 0])
+        self.assertEqual(categories, ["AM4", "LGA1700"])
+
+    def test_cached_frame_matches_read_csv(self):
+        """Test that the cached frame holds the same values as pandas' own parse, units stripped."""
+        frame = load_frame(self.csv_path, self.cache_dir)
+        expected = pd.read_csv(self.csv_path)
+        self.assertEqual(list(frame.columns), list(expected.columns))
+        np.testing.assert_array_equal(frame["Cores"], expected["Cores"])
+        np.testing.assert_array_equal(frame["Integrated"], expected["Integrated"])
+        np.testing.assert_array_equal(frame["Clock"], [3.7, 4.2, 3.4])
+        np.testing.assert_array_equal(frame["Price"], [199.99, 149.5, np.nan])
+        self.assertEqual(list(frame["Name"].astype(str)), list(expected["Name"]))
+        self.assertEqual(list(frame["MPN"].astype(str)), list(expected["MPN"].astype(str)))
+        self.assertEqual(frame.attrs["units"], {"Clock": "GHz", "Price": "USD"})
+        self.assertEqual(frame.attrs["dataset"], "CPUData")
+
+        table = load_table(self.csv_path, self.cache_dir)
+        self.assertIsInstance(table["Name"], CategoryColumn)
+        self.assertIsInstance(table["Cores"], np.memmap)
+
+    def test_content_change_recompiles(self):
+        """Test that editing the CSV builds a new table and removes the old one."""
+        first = compile_csv(self.csv_path, self.cache_dir)
+        self.write_csv(CSV + "Chip D,4,2.9 GHz,$59.00 USD,False,100400,AM4\n")
+        second = compile_csv(self.csv_path, self.cache_dir)
+        self.assertNotEqual(second["table_dir"], first["table_dir"])
+        self.assertEqual(second["rows"], 4)
+        self.assertEqual(self.table_dirs(), [second["table_dir"]])
+        np.testing.assert_array_equal(load_frame(self.csv_path, self.cache_dir)["Cores"], [8, 6, 12, 4])
+
+    def test_mtime_only_change_does_not_recompile(self):
+        """Test that touching the CSV only refreshes the manifest's mtime."""
+        first = compile_csv(self.csv_path, self.cache_dir)
+        stat = os.stat(self.csv_path)
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with patch("quantum_firmware_optimization.scripts.catalog_cache.pd.read_csv") as mock_read:
+            second = compile_csv(self.csv_path, self.cache_dir)
+            mock_read.assert_not_called()
+        self.assertEqual(second["table_dir"], first["table_dir"])
+        self.assertEqual(second["source_mtime_ns"], stat.st_mtime_ns + 10**9)
+
+    def test_format_bump_recompiles(self):
+        """Test that a manifest written under another CACHE_FORMAT is ignored."""
+        first = compile_csv(self.csv_path, self.cache_dir)
+        with patch("quantum_firmware_optimization.scripts.catalog_cache.CACHE_FORMAT", first["format"] + 1):
+            second = compile_csv(self.csv_path, self.cache_dir)
+        self.assertEqual(second["format"], first["format"] + 1)
+        self.assertNotEqual(second["table_dir"], first["table_dir"])
+
+    def test_rebuild_of_same_content_uses_a_new_directory(self):
+        """Test that a forced rebuild never writes into the directory the current manifest points at."""
+        first = compile_csv(self.csv_path, self.cache_dir)
+        reader = load_table(self.csv_path, self.cache_dir)
+        second = compile_csv(self.csv_path, self.cache_dir, force=True)
+        self.assertNotEqual(second["table_dir"], first["table_dir"])
+        self.assertEqual(second["source_sha256"], first["source_sha256"])
+        # The open memory maps keep reading the replaced files
+        np.testing.assert_array_equal(reader["Cores"], [8, 6, 12])
+
+    def test_corrupt_or_missing_table_is_rebuilt(self):
+        """Test that damaged or deleted column files are rebuilt on load."""
+        manifest = compile_csv(self.csv_path, self.cache_dir)
+        table_dir = os.path.join(self.cache_dir, manifest["table_dir"])
+        for filename in os.listdir(table_dir):
+            with open(os.path.join(table_dir, filename), "wb") as f:
+                f.write(b"garbage")
+        frame = load_frame(self.csv_path, self.cache_dir)
+        np.testing.assert_array_equal(frame["Cores"], [8, 6, 12])
+
+        manifest = compile_csv(self.csv_path, self.cache_dir)
+        for filename in os.listdir(os.path.join(self.cache_dir, manifest["table_dir"])):
+            os.remove(os.path.join(self.cache_dir, manifest["table_dir"], filename))
+        os.rmdir(os.path.join(self.cache_dir, manifest["table_dir"]))
+        rebuilt = compile_csv(self.csv_path, self.cache_dir)
+        self.assertNotEqual(rebuilt["table_dir"], manifest["table_dir"])
+        np.testing.assert_array_equal(load_frame(self.csv_path, self.cache_dir)["Cores"], [8, 6, 12])
+
+if __name__ == '__main__':
+    unittest.main()
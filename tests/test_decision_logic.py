@@ -0,0 +1,104 @@
+# quantum_firmware_optimization/tests/test_decision_logic.py
+
+import unittest
+from unittest.mock import MagicMock, patch
+import numpy as np
+from quantum_firmware_optimization.scripts.decision_logic import (
+    decide_computation_method, decide_computation_methods, get_system_snapshot
+)
+
+ALL_AVAILABLE = {"cpu_available": True, "gpu_available": True, "qpu_available": True}
+
+class StubModel:
+    """Predicts the label stored in each row's first column, and counts predict calls."""
+
+    LABELS = np.array(['CPU', 'GPU', 'QPU', 'Hybrid'])
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return self.LABELS[np.asarray(X)[:, 0].astype(int)]
+
+class TestDecisionLogic(unittest.TestCase):
+
+    def setUp(self):
+        self.model = StubModel()
+        registry = MagicMock()
+        registry.get.return_value = self.model
+        patcher = patch('quantum_firmware_optimization.scripts.decision_logic.registry', registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_empty_matrix(self):
+        """Test that no tasks give no decisions without calling the model."""
+        decisions = decide_computation_methods(np.empty((0, 3)), ALL_AVAILABLE)
+        self.assertEqual(decisions.shape, (0,))
+        self.assertEqual(self.model.calls, 0)
+
+    def test_wrong_rank_raises(self):
+        """Test that a 1-D or 3-D input is rejected rather than silently reshaped."""
+        for features in (np.zeros(3), np.zeros((2, 3, 1))):
+            with self.assertRaises(ValueError):
+                decide_computation_methods(features, ALL_AVAILABLE)
+
+    def test_each_branch(self):
+        """Test that each prediction is kept when its processor is available and falls back to Hybrid otherwise."""
+        features = np.array([[0], [1], [2], [3]])
+        np.testing.assert_array_equal(decide_computation_methods(features, ALL_AVAILABLE),
+                                      ['CPU', 'GPU', 'QPU', 'Hybrid'])
+        for busy, label in (("cpu_available", 'CPU'), ("gpu_available", 'GPU'), ("qpu_available", 'QPU')):
+            with self.subTest(busy=busy):
+                snapshot = dict(ALL_AVAILABLE, **{busy: False})
+                decisions = decide_computation_methods(features, snapshot)
+                expected = ['Hybrid' if name == label else name for name in ['CPU', 'GPU', 'QPU', 'Hybrid']]
+                np.testing.assert_array_equal(decisions, expected)
+        self.assertEqual(self.model.calls, 4)
+
+    def test_batch_uses_one_predict_call_and_one_snapshot(self):
+        """Test that a batch without a snapshot reads the system state once."""
+        features = np.arange(40).reshape(-1, 1) % 4
+        with patch('quantum_firmware_optimization.scripts.decision_logic.get_system_snapshot',
+                   return_value=ALL_AVAILABLE) as mock_snapshot:
+            decisions = decide_computation_methods(features)
+        mock_snapshot.assert_called_once_with()
+        self.assertEqual(self.model.calls, 1)
+        self.assertEqual(len(decisions), 40)
+
+    def test_single_row_matches_batch(self):
+        """Test that decide_computation_method agrees with the batch path row by row."""
+        features = np.array([[0], [1], [2], [3], [1], [0]])
+        snapshot = {"cpu_available": False, "gpu_available": True, "qpu_available": False}
+        with patch('quantum_firmware_optimization.scripts.decision_logic.get_system_snapshot',
+                   return_value=snapshot):
+            batch = decide_computation_methods(features)
+            singles = [decide_computation_method(row) for row in features]
+        self.assertEqual(singles, list(batch))
+        self.assertTrue(all(type(decision) is str for decision in singles))
+
+    @patch('quantum_firmware_optimization.scripts.decision_logic.get_backend_registry')
+    @patch('quantum_firmware_optimization.scripts.decision_logic.get_gpu_usage')
+    @patch('quantum_firmware_optimization.scripts.decision_logic.get_cpu_usage')
+    def test_get_system_snapshot(self, mock_cpu, mock_gpu, mock_backends):
+        """Test that CPU load is compared in percent and GPU loads as fractions of 1."""
+        mock_backends.return_value.snapshot.return_value.has_available.return_value = True
+        mock_cpu.return_value = 10.0
+        mock_gpu.return_value = [(0, 0.5), (1, 0.2)]
+        self.assertEqual(get_system_snapshot(), ALL_AVAILABLE)
+
+        mock_cpu.return_value = 95.0
+        mock_gpu.return_value = [(0, 0.5), (1, 0.9)]
+        mock_backends.return_value.snapshot.return_value.has_available.return_value = False
+        self.assertEqual(get_system_snapshot(),
+                         {"cpu_available": False, "gpu_available": False, "qpu_available": False})
+
+        # Unknown CPU load and no GPUs count as unavailable
+        mock_cpu.return_value = None
+        mock_gpu.return_value = None
+        snapshot = get_system_snapshot()
+        self.assertFalse(snapshot["cpu_available"])
+        self.assertFalse(snapshot["gpu_available"])
+
+if __name__ == '__main__':
+    unittest.main()
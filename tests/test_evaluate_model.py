@@ -0,0 +1,53 @@
+# quantum_firmware_optimization/tests/test_evaluate_model.py
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from sklearn.metrics import classification_report, confusion_matrix
+from sklearn.tree import DecisionTreeClassifier
+from quantum_firmware_optimization.scripts.evaluate_model import (
+    FEATURE_COLUMNS, LABEL_COLUMN, RunningConfusion, evaluate_model, evaluate_model_streaming
+)
+
+class TestEvaluateModel(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        n = 1000
+        data = pd.DataFrame(rng.rand(n, len(FEATURE_COLUMNS)), columns=FEATURE_COLUMNS)
+        data[LABEL_COLUMN] = np.where(data['cores'] > 0.6, 'AMD', np.where(data['memory'] > 0.5, 'Intel', 'Apple'))
+        # Labels the model never predicts, and a shallow tree that gets some rows wrong
+        data.loc[::97, LABEL_COLUMN] = 'ARM'
+        self.data = data
+        self.model = DecisionTreeClassifier(max_depth=2, random_state=0).fit(data[FEATURE_COLUMNS][:500], data[LABEL_COLUMN][:500])
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.tmpdir.name, "test.csv")
+        data.to_csv(self.data_path, index=False)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_streaming_matches_full_evaluation(self):
+        """Test that chunked evaluation gives the same accuracy, report and confusion matrix as one pass."""
+        expected = evaluate_model(self.model, self.data)
+        for n_jobs in (1, 3):
+            with self.subTest(n_jobs=n_jobs):
+                accuracy, report, confusion = evaluate_model_streaming(self.model, self.data_path, chunk_size=64, n_jobs=n_jobs)
+                self.assertAlmostEqual(accuracy, expected[0])
+                self.assertEqual(report, expected[1])
+                np.testing.assert_array_equal(confusion, expected[2])
+
+    def test_running_confusion_grows_with_new_labels(self):
+        """Test that labels first seen in later chunks extend the matrix in sorted order."""
+        running = RunningConfusion()
+        running.update(['b', 'b'], ['b', 'a'])
+        running.update(['c', 'a'], ['c', 'c'])
+        y_true, y_pred = ['b', 'b', 'c', 'a'], ['b', 'a', 'c', 'c']
+        self.assertEqual(running.labels, ['a', 'b', 'c'])
+        np.testing.assert_array_equal(running.matrix(), confusion_matrix(y_true, y_pred))
+        self.assertEqual(running.report(digits=3), classification_report(y_true, y_pred, digits=3, zero_division=0))
+
+if __name__ == '__main__':
+    unittest.main()
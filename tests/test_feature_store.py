@@ -0,0 +1,82 @@
+# quantum_firmware_optimization/tests/test_feature_store.py
+
+import unittest
+import numpy as np
+from quantum_firmware_optimization.scripts.feature_store import FeatureStore
+from quantum_firmware_optimization.scripts.feature_extraction import (
+    FEATURE_MAP, extract_features, extract_features_batch
+)
+
+FEATURES = {
+    "a": [1, 2, 3],
+    "b": [3, 4, 5],
+}
+TASKS = [{"Task Type": "b"}, {"Task Type": "unknown"}, {"Task Type": "a"}, {"Task Type": "b"}]
+
+class TestFeatureStore(unittest.TestCase):
+
+    def test_fallback_modes(self):
+        """Test the mean, zeros and explicit-vector fallbacks for unknown task types."""
+        for fallback, expected in (("mean", [2, 3, 4]), ("zeros", [0, 0, 0]), ([7, 8, 9], [7, 8, 9])):
+            with self.subTest(fallback=fallback):
+                store = FeatureStore(FEATURES, fallback=fallback)
+                np.testing.assert_array_equal(store.extract({"Task Type": "unknown"}), expected)
+                np.testing.assert_array_equal(store.extract_batch(TASKS), [[3, 4, 5], expected, [1, 2, 3], [3, 4, 5]])
+
+    def test_no_fallback_raises_key_error(self):
+        """Test that without a fallback unknown task types raise KeyError like the original dict lookup."""
+        store = FeatureStore(FEATURES, fallback=None)
+        self.assertIsNone(store.fallback_row)
+        with self.assertRaises(KeyError):
+            store.extract({"Task Type": "unknown"})
+        with self.assertRaises(KeyError):
+            store.extract_batch(TASKS)
+        np.testing.assert_array_equal(store.extract_batch(TASKS[2:]), [[1, 2, 3], [3, 4, 5]])
+
+    def test_invalid_fallbacks_raise_value_error(self):
+        """Test that a fallback vector of the wrong length or an unknown mode is rejected."""
+        for fallback in ([1, 2], [1, 2, 3, 4], "median"):
+            with self.subTest(fallback=fallback), self.assertRaises(ValueError):
+                FeatureStore(FEATURES, fallback=fallback)
+        with self.assertRaises(ValueError):
+            FeatureStore({})
+        with self.assertRaises(ValueError):
+            FeatureStore({"a": [1, 2, 3], "b": [1, 2]})
+
+    def test_output_layout(self):
+        """Test that rows and batches are float32, C-contiguous and the table is read-only."""
+        store = FeatureStore(FEATURES)
+        self.assertFalse(store.matrix.flags.writeable)
+
+        row = store.extract({"Task Type": "a"})
+        self.assertEqual(row.dtype, np.float32)
+        self.assertFalse(row.flags.writeable)
+        with self.assertRaises(ValueError):
+            row[0] = 0
+
+        batch = store.extract_batch(TASKS)
+        self.assertEqual(batch.dtype, np.float32)
+        self.assertEqual(batch.shape, (4, 3))
+        self.assertTrue(batch.flags.c_contiguous)
+        # The gathered batch is a copy the caller may modify without touching the table
+        batch[0, 0] = -1
+        self.assertEqual(store.matrix[store.index["b"], 0], 3)
+
+    def test_out_argument(self):
+        """Test that extract_batch fills and returns a caller-provided array."""
+        store = FeatureStore(FEATURES)
+        out = np.empty((len(TASKS), store.n_features), dtype=np.float32)
+        result = store.extract_batch(TASKS, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, store.extract_batch(TASKS))
+
+    def test_store_matches_feature_map(self):
+        """Test that store-backed extraction returns the FEATURE_MAP values for every known task type."""
+        tasks = [{"Task Type": task_type} for task_type in FEATURE_MAP]
+        for task in tasks:
+            np.testing.assert_array_equal(extract_features(task), FEATURE_MAP[task["Task Type"]])
+        np.testing.assert_array_equal(extract_features_batch(tasks),
+                                      np.array(list(FEATURE_MAP.values()), dtype=np.float32))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# quantum_firmware_optimization/tests/test_hardware_catalog.py
+
+import unittest
+import numpy as np
+import pandas as pd
+from quantum_firmware_optimization.scripts.hardware_catalog import HardwareCatalog, IndexedTable
+
+class TestHardwareCatalog(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        n = 500
+        self.frame = pd.DataFrame({
+            "Name": [f"Board {i}" for i in range(n)],
+            "Producer": rng.choice(["ASUS", "MSI", "Gigabyte", None], n),
+            "Socket": rng.choice(["AM4", "AM5", "LGA1700"], n),
+            "MPN": [f"MPN-{i:04d}" for i in range(n)],
+            "Price": np.where(rng.rand(n) < 0.1, np.nan, np.round(rng.uniform(50, 500, n), 2)),
+            "TDP": rng.choice([35.0, 65.0, 105.0, 125.0], n),
+        })
+        columns = {column: self.frame[column].to_numpy() for column in self.frame.columns}
+        self.table = IndexedTable("MotherboardData", columns, units={"Price": "USD", "TDP": "W"},
+                                  sorted_columns=("Price", "TDP"))
+
+    def expected(self, mask):
+        return np.flatnonzero(mask.to_numpy())
+
+    def test_query_matches_pandas_filter(self):
+        """Test that combined equality and range queries return the rows a pandas filter selects."""
+        frame = self.frame
+        rows = self.table.query(equals={"Socket": "AM4", "Producer": "MSI"}, ranges={"Price": (100, 300)})
+        mask = (frame.Socket == "AM4") & (frame.Producer == "MSI") & frame.Price.between(100, 300)
+        np.testing.assert_array_equal(rows, self.expected(mask))
+
+        rows = self.table.query(ranges={"TDP": (None, 65), "Price": (200, None)})
+        np.testing.assert_array_equal(rows, self.expected((frame.TDP <= 65) & (frame.Price >= 200)))
+
+        rows = self.table.between("TDP", 65, 125, inclusive=(False, False))
+        np.testing.assert_array_equal(rows, self.expected(frame.TDP == 105))
+
+    def test_equality_is_case_insensitive_and_accepts_lists(self):
+        """Test that keys are matched case-insensitively and a list matches any of its values."""
+        frame = self.frame
+        np.testing.assert_array_equal(self.table.equals("Producer", " gigabyte"), self.expected(frame.Producer == "Gigabyte"))
+        np.testing.assert_array_equal(self.table.equals("Socket", ["AM4", "AM5"]), self.expected(frame.Socket.isin(["AM4", "AM5"])))
+        self.assertEqual(len(self.table.equals("Socket", "LGA1200")), 0)
+
+    def test_order_by_and_limit(self):
+        """Test that results can be ordered by a sorted column, dropping rows missing it."""
+        frame = self.frame
+        rows = self.table.query(equals={"Socket": "AM5"}, order_by="Price", limit=5)
+        expected = frame[(frame.Socket == "AM5") & frame.Price.notna()].sort_values("Price", kind="stable").index[:5]
+        np.testing.assert_array_equal(rows, expected)
+        cheapest = self.table.records(rows[:1], ["Name", "Price"])[0]
+        self.assertEqual(cheapest["Price"], frame.Price[expected[0]])
+
+        rows = self.table.query(order_by="Price", descending=True, limit=1)
+        self.assertEqual(self.table.column("Price", rows)[0], frame.Price.max())
+
+    def test_missing_values_and_unindexed_columns(self):
+        """Test that missing values never match and unindexed columns are rejected."""
+        self.assertEqual(len(self.table.query(ranges={"Price": (None, None)})), self.frame.Price.notna().sum())
+        self.assertIsNone(self.table.records([int(np.flatnonzero(self.frame.Producer.isna())[0])], ["Producer"])[0]["Producer"])
+        with self.assertRaises(ValueError):
+            self.table.equals("Name", "Board 1")
+        with self.assertRaises(ValueError):
+            self.table.between("Socket", 1, 2)
+        with self.assertRaises(ValueError):
+            IndexedTable("Broken", {"Producer": np.array(["MSI"]), "Price": np.array([1.0, 2.0])})
+
+    def test_lookup_across_tables(self):
+        """Test that an MPN is found in every table that indexes it."""
+        other = IndexedTable("CPUData", {"MPN": np.array(["MPN-0007", "X"]), "Price": np.array([1.0, 2.0])})
+        catalog = HardwareCatalog([self.table, other])
+        found = catalog.lookup("MPN", "mpn-0007")
+        self.assertEqual(sorted(found), ["CPUData", "MotherboardData"])
+        np.testing.assert_array_equal(found["MotherboardData"], [7])
+        np.testing.assert_array_equal(catalog.query("CPUData", equals={"MPN": "X"}), [1])
+
+if __name__ == '__main__':
+    unittest.main()
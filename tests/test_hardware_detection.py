@@ -1,10 +1,21 @@
 # quantum_firmware_optimization/tests/test_hardware_detection.py
 
+import os
+import subprocess
+import tempfile
+import threading
+import time
 import unittest
+from collections import namedtuple
+from unittest.mock import patch
 from quantum_firmware_optimization.src.hardware_detection import (
-    get_cpu_info, get_memory_info, get_disk_info, get_firmware_version, get_hardware_info
+    get_cpu_info, get_memory_info, get_disk_info, get_firmware_version, get_hardware_info,
+    get_static_hardware_info, invalidate_hardware_cache, load_static_snapshot, run_probes
 )
 
+Partition = namedtuple("Partition", ["device", "mountpoint"])
+Usage = namedtuple("Usage", ["total", "used", "free", "percent"])
+
 class TestHardwareDetection(unittest.TestCase):
 
     def test_get_cpu_info(self):
@@ -39,20 +50,208 @@ class TestHardwareDetection(unittest.TestCase):
             self.assertIn("free", info)
             self.assertIn("percent", info)
 
-    def test_get_firmware_version(self):
+    @patch('quantum_firmware_optimization.src.hardware_detection.subprocess.run')
+    def test_get_firmware_version(self, mock_run):
         """Test the get_firmware_version function."""
+        mock_run.return_value = subprocess.CompletedProcess([], 0, stdout="BIOS Information\n\tVersion: 1.0\n", stderr="")
         firmware_version = get_firmware_version()
         self.assertIsInstance(firmware_version, str)
         self.assertTrue(len(firmware_version) > 0)  # Ensure firmware version is not empty
 
+    @patch('quantum_firmware_optimization.src.hardware_detection.subprocess.run')
+    def test_get_firmware_version_raises_on_failure(self, mock_run):
+        """Test that a failed dmidecode run raises instead of returning its error text."""
+        for outcome in (subprocess.TimeoutExpired(["dmidecode"], 4.0),
+                        FileNotFoundError(2, "No such file or directory", "dmidecode"),
+                        subprocess.CompletedProcess([], 1, stdout="", stderr="Permission denied")):
+            with self.subTest(outcome=type(outcome).__name__):
+                mock_run.side_effect = outcome if isinstance(outcome, BaseException) else None
+                mock_run.return_value = outcome
+                with self.assertRaises((subprocess.TimeoutExpired, OSError, RuntimeError)):
+                    get_firmware_version()
+
     def test_get_hardware_info(self):
         """Test the get_hardware_info function."""
-        hardware_info = get_hardware_info()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "hardware_snapshot.json")
+            self.addCleanup(invalidate_hardware_cache, cache_path)
+            hardware_info = get_hardware_info(cache_path=cache_path)
         self.assertIsInstance(hardware_info, dict)
         self.assertIn("cpu", hardware_info)
         self.assertIn("memory", hardware_info)
         self.assertIn("disk", hardware_info)
         self.assertIn("firmware", hardware_info)
 
+class TestHardwareSnapshotCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, "hardware_snapshot.json")
+        invalidate_hardware_cache(self.cache_path)
+
+    def tearDown(self):
+        invalidate_hardware_cache(self.cache_path)
+        self.tmp_dir.cleanup()
+
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_firmware_version')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_cpu_info')
+    def test_static_info_is_probed_once(self, mock_get_cpu_info, mock_get_firmware_version):
+        """Test that repeated calls reuse the cached static snapshot."""
+        mock_get_cpu_info.return_value = {"brand": "Test CPU"}
+        mock_get_firmware_version.return_value = "BIOS 1.0"
+
+        first = get_static_hardware_info(cache_path=self.cache_path)
+        second = get_static_hardware_info(cache_path=self.cache_path)
+
+        self.assertEqual(first, second)
+        self.assertEqual(second["cpu"], {"brand": "Test CPU"})
+        mock_get_cpu_info.assert_called_once()
+        mock_get_firmware_version.assert_called_once()
+        self.assertTrue(os.path.exists(self.cache_path))
+
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_firmware_version')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_cpu_info')
+    def test_snapshot_is_invalidated_by_ttl(self, mock_get_cpu_info, mock_get_firmware_version):
+        """Test that an expired snapshot is re-probed."""
+        mock_get_cpu_info.return_value = {"brand": "Test CPU"}
+        mock_get_firmware_version.return_value = "BIOS 1.0"
+
+        get_static_hardware_info(cache_path=self.cache_path)
+        get_static_hardware_info(cache_path=self.cache_path, ttl=0)
+        self.assertEqual(mock_get_cpu_info.call_count, 2)
+
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_boot_id')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_firmware_version')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_cpu_info')
+    def test_snapshot_is_keyed_by_boot_id(self, mock_get_cpu_info, mock_get_firmware_version, mock_get_boot_id):
+        """Test that a snapshot from a previous boot is ignored."""
+        mock_get_cpu_info.return_value = {"brand": "Test CPU"}
+        mock_get_firmware_version.return_value = "BIOS 1.0"
+        mock_get_boot_id.return_value = "boot-1"
+
+        get_static_hardware_info(cache_path=self.cache_path)
+        self.assertIsNotNone(load_static_snapshot(self.cache_path))
+
+        mock_get_boot_id.return_value = "boot-2"
+        self.assertIsNone(load_static_snapshot(self.cache_path))
+        get_static_hardware_info(cache_path=self.cache_path)
+        self.assertEqual(mock_get_cpu_info.call_count, 2)
+
+    @patch('quantum_firmware_optimization.src.hardware_detection.subprocess.run')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_cpu_info')
+    def test_failed_firmware_probe_keeps_cpu_cached(self, mock_get_cpu_info, mock_run):
+        """Test that a timed out or failing dmidecode is reported missing without re-probing the CPU."""
+        mock_get_cpu_info.return_value = {"brand": "Test CPU"}
+        for outcome in (subprocess.TimeoutExpired(["dmidecode", "-t", "bios"], 4.0),
+                        subprocess.CompletedProcess([], 1, stdout="", stderr="/dev/mem: Permission denied")):
+            with self.subTest(outcome=type(outcome).__name__):
+                invalidate_hardware_cache(self.cache_path)
+                mock_get_cpu_info.reset_mock()
+                mock_run.reset_mock()
+                mock_run.side_effect = outcome if isinstance(outcome, BaseException) else None
+                mock_run.return_value = outcome
+
+                first = get_static_hardware_info(cache_path=self.cache_path)
+                second = get_static_hardware_info(cache_path=self.cache_path)
+                for info in (first, second):
+                    self.assertEqual(info["missing"], ["firmware"])
+                    self.assertEqual(info["firmware"], "")
+                    self.assertEqual(info["cpu"], {"brand": "Test CPU"})
+                mock_get_cpu_info.assert_called_once()
+                mock_run.assert_called_once()
+                self.assertEqual(load_static_snapshot(self.cache_path)["firmware"], "")
+
+    @patch('quantum_firmware_optimization.src.hardware_detection.FIRMWARE_RETRY_TTL', 0)
+    @patch('quantum_firmware_optimization.src.hardware_detection.subprocess.run')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_cpu_info')
+    def test_failed_firmware_probe_is_retried(self, mock_get_cpu_info, mock_run):
+        """Test that dmidecode alone is retried once the negative firmware entry expires."""
+        mock_get_cpu_info.return_value = {"brand": "Test CPU"}
+        mock_run.side_effect = subprocess.TimeoutExpired(["dmidecode", "-t", "bios"], 4.0)
+        self.assertEqual(get_static_hardware_info(cache_path=self.cache_path)["missing"], ["firmware"])
+
+        mock_run.side_effect = None
+        mock_run.return_value = subprocess.CompletedProcess([], 0, stdout="BIOS 1.0", stderr="")
+        info = get_static_hardware_info(cache_path=self.cache_path)
+        self.assertEqual(info, {"cpu": {"brand": "Test CPU"}, "firmware": "BIOS 1.0", "missing": []})
+        mock_get_cpu_info.assert_called_once()
+        self.assertNotIn("firmware_failed_at", load_static_snapshot(self.cache_path))
+
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_disk_info')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_memory_info')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_firmware_version')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_cpu_info')
+    def test_volatile_info_is_refreshed(self, mock_get_cpu_info, mock_get_firmware_version,
+                                        mock_get_memory_info, mock_get_disk_info):
+        """Test that memory and disk usage are probed on every call."""
+        mock_get_cpu_info.return_value = {"brand": "Test CPU"}
+        mock_get_firmware_version.return_value = "BIOS 1.0"
+        mock_get_memory_info.return_value = {"percent": 10.0}
+        mock_get_disk_info.return_value = {}
+
+        get_hardware_info(cache_path=self.cache_path)
+        get_hardware_info(cache_path=self.cache_path)
+        mock_get_cpu_info.assert_called_once()
+        self.assertEqual(mock_get_memory_info.call_count, 2)
+        self.assertEqual(mock_get_disk_info.call_count, 2)
+
+class TestConcurrentProbing(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+
+    def test_run_probes_flags_timed_out_probes(self):
+        """Test that a hung probe is reported missing without blocking the others."""
+        start = time.monotonic()
+        results, missing = run_probes(
+            {"memory": lambda: self.release.wait(), "cpu": lambda: {"brand": "Test CPU"}},
+            timeouts={"memory": 0.2, "cpu": 1.0}
+        )
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(missing, ["memory"])
+        self.assertEqual(results["memory"], {})
+        self.assertEqual(results["cpu"], {"brand": "Test CPU"})
+
+    def test_run_probes_flags_failed_probes(self):
+        """Test that a probe raising an exception is reported missing."""
+        def broken_probe():
+            raise RuntimeError("probe failed")
+
+        results, missing = run_probes({"firmware": broken_probe})
+        self.assertEqual(missing, ["firmware"])
+        self.assertEqual(results["firmware"], "")
+
+    @patch('quantum_firmware_optimization.src.hardware_detection.subprocess.run')
+    @patch('quantum_firmware_optimization.src.hardware_detection.get_cpu_info')
+    def test_dmidecode_is_killed_before_the_probe_deadline(self, mock_get_cpu_info, mock_run):
+        """Test that dmidecode's timeout is strictly shorter than the firmware probe's deadline."""
+        mock_get_cpu_info.return_value = {"brand": "Test CPU"}
+        mock_run.return_value = subprocess.CompletedProcess([], 0, stdout="BIOS 1.0", stderr="")
+        get_static_hardware_info(use_cache=False, timeouts={"firmware": 1.0})
+        self.assertLess(mock_run.call_args.kwargs["timeout"], 1.0)
+
+    @patch('quantum_firmware_optimization.src.hardware_detection.psutil.disk_usage')
+    @patch('quantum_firmware_optimization.src.hardware_detection.psutil.disk_partitions')
+    def test_get_disk_info_flags_hung_partition(self, mock_disk_partitions, mock_disk_usage):
+        """Test that a hung partition is flagged while healthy partitions are reported."""
+        mock_disk_partitions.return_value = [Partition("/dev/sda1", "/"), Partition("nfs:/export", "/mnt/stale")]
+
+        def disk_usage(mountpoint):
+            if mountpoint == "/mnt/stale":
+                self.release.wait()
+            return Usage(100, 40, 60, 40.0)
+        mock_disk_usage.side_effect = disk_usage
+
+        disk_info = get_disk_info(partition_timeout=0.2)
+        self.assertEqual(disk_info["/dev/sda1"]["percent"], 40.0)
+        self.assertEqual(disk_info["nfs:/export"], {"missing": True, "reason": "timeout"})
+
+        # The stalled mount is skipped until its previous probe returns
+        disk_info = get_disk_info(partition_timeout=0.2)
+        self.assertEqual(disk_info["nfs:/export"], {"missing": True, "reason": "stalled"})
+
 if __name__ == "__main__":
     unittest.main()
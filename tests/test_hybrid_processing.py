@@ -1,26 +1,49 @@
 # quantum_firmware_optimization/tests/test_hybrid_processing.py
 
+import asyncio
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 from quantum_firmware_optimization.src.hybrid_processing import (
-    run_quantum_circuit, run_classical_model, hybrid_processing
+    run_quantum_circuit, run_classical_model, hybrid_processing,
+    AsyncHybridExecutor, hybrid_processing_async
 )
+from quantum_firmware_optimization.src.routing_plan import RoutingPlan
 
 class TestHybridProcessing(unittest.TestCase):
 
-    @patch('quantum_firmware_optimization.src.hybrid_processing.cirq.Simulator')
-    def test_run_quantum_circuit(self, mock_simulator):
+    @patch('quantum_firmware_optimization.src.hybrid_processing.simulator_pool')
+    def test_run_quantum_circuit(self, mock_simulator_pool):
         """Test the run_quantum_circuit function."""
-        mock_simulator_instance = mock_simulator.return_value
-        mock_simulator_instance.run.return_value = "Quantum Result"
+        mock_simulator_pool.run_circuit.return_value = "Quantum Result"
 
         circuit = MagicMock()
         parameters = {"param": 1}
 
         result = run_quantum_circuit(circuit, parameters)
-        mock_simulator_instance.run.assert_called_once_with(circuit, param_resolver=MagicMock())
+        mock_simulator_pool.run_circuit.assert_called_once_with(circuit, parameters, repetitions=1)
         self.assertEqual(result, "Quantum Result")
 
+    def test_run_quantum_circuit_reuses_prepared_circuit(self):
+        """Test that repeated runs with new parameters reuse the prepared circuit."""
+        import cirq
+        import sympy
+        from quantum_firmware_optimization.src.hybrid_processing import simulator_pool
+
+        qubit = cirq.GridQubit(0, 0)
+        circuit = cirq.Circuit(cirq.ry(sympy.Symbol('theta')).on(qubit), cirq.measure(qubit, key='result'))
+        cache = simulator_pool.get_default_cache()
+        cache.clear()
+
+        zero = run_quantum_circuit(circuit, {'theta': 0.0}, repetitions=20)
+        pi = run_quantum_circuit(circuit, {'theta': 3.141592653589793}, repetitions=20)
+
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertTrue((zero.measurements['result'] == 0).all())
+        self.assertTrue((pi.measurements['result'] == 1).all())
+
     @patch('quantum_firmware_optimization.src.hybrid_processing.tf.keras.Model')
     def test_run_classical_model(self, mock_model):
         """Test the run_classical_model function."""
@@ -74,5 +97,111 @@ class TestHybridProcessing(unittest.TestCase):
         mock_run_quantum_circuit.assert_not_called()
         self.assertEqual(result, "Classical Result")
 
+    @patch('quantum_firmware_optimization.src.hybrid_processing.assess_quantum_readiness')
+    @patch('quantum_firmware_optimization.src.hybrid_processing.run_quantum_circuit')
+    @patch('quantum_firmware_optimization.src.hybrid_processing.run_classical_model')
+    def test_hybrid_processing_follows_plan(self, mock_run_classical_model, mock_run_quantum_circuit, mock_assess_quantum_readiness):
+        """Test that hybrid_processing follows the routing plan without re-assessing the task."""
+        mock_run_classical_model.return_value = "Classical Result"
+
+        task_description = "Optimization task"
+        plan = RoutingPlan(task_description, "Classical", "forced for test")
+        data = MagicMock()
+        model = MagicMock()
+
+        result = hybrid_processing(task_description, data, model=model, plan=plan)
+        mock_assess_quantum_readiness.assert_not_called()
+        mock_run_classical_model.assert_called_once_with(model, data)
+        mock_run_quantum_circuit.assert_not_called()
+        self.assertEqual(result, "Classical Result")
+
+def sleeping(seconds, result):
+    """Return a side effect that blocks its worker thread before returning ``result``."""
+    def side_effect(*args):
+        time.sleep(seconds)
+        return result
+    return side_effect
+
+@patch('quantum_firmware_optimization.src.hybrid_processing.run_classical_model')
+@patch('quantum_firmware_optimization.src.hybrid_processing.run_quantum_circuit')
+class TestHybridProcessingAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = AsyncHybridExecutor(quantum_concurrency=1, classical_concurrency=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def run_async(self, **kwargs):
+        return asyncio.run(hybrid_processing_async("Optimization task", "data", circuit="circuit",
+                                                   parameters={"param": 1}, model="model",
+                                                   executor=self.executor, **kwargs))
+
+    def test_planned_mode_follows_plan(self, mock_run_quantum_circuit, mock_run_classical_model):
+        """Test that planned mode runs only the routed path."""
+        mock_run_classical_model.return_value = "Classical Result"
+        plan = RoutingPlan("Optimization task", "Classical", "forced for test")
+
+        self.assertEqual(self.run_async(plan=plan), "Classical Result")
+        mock_run_classical_model.assert_called_once_with("model", "data")
+        mock_run_quantum_circuit.assert_not_called()
+
+    def test_first_mode_returns_fastest_path(self, mock_run_quantum_circuit, mock_run_classical_model):
+        """Test that first mode returns whichever path finishes first."""
+        mock_run_quantum_circuit.side_effect = sleeping(0.5, "Quantum Result")
+        mock_run_classical_model.side_effect = sleeping(0.01, "Classical Result")
+
+        self.assertEqual(self.run_async(mode="first"), ("Classical", "Classical Result"))
+
+    def test_first_mode_skips_failed_path(self, mock_run_quantum_circuit, mock_run_classical_model):
+        """Test that first mode falls back to the other path when one fails."""
+        mock_run_quantum_circuit.side_effect = RuntimeError("simulator crashed")
+        mock_run_classical_model.side_effect = sleeping(0.05, "Classical Result")
+
+        self.assertEqual(self.run_async(mode="first"), ("Classical", "Classical Result"))
+
+    def test_gather_mode_returns_both_paths(self, mock_run_quantum_circuit, mock_run_classical_model):
+        """Test that gather mode runs both paths and returns both results."""
+        mock_run_quantum_circuit.return_value = "Quantum Result"
+        mock_run_classical_model.return_value = "Classical Result"
+
+        self.assertEqual(self.run_async(mode="gather"), {"Quantum": "Quantum Result", "Classical": "Classical Result"})
+        mock_run_quantum_circuit.assert_called_once_with("circuit", {"param": 1}, 1)
+
+    def test_timeout_raises(self, mock_run_quantum_circuit, mock_run_classical_model):
+        """Test that a path exceeding the timeout raises TimeoutError."""
+        mock_run_quantum_circuit.side_effect = sleeping(0.5, "Quantum Result")
+        mock_run_classical_model.side_effect = sleeping(0.5, "Classical Result")
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.run_async(mode="gather", timeout=0.05)
+
+    def test_concurrency_is_bounded_per_backend(self, mock_run_quantum_circuit, mock_run_classical_model):
+        """Test that no more quantum calls run at once than the executor allows."""
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def simulate(*args):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.pop()
+            return "Quantum Result"
+
+        mock_run_quantum_circuit.side_effect = simulate
+        plan = RoutingPlan("Optimization task", "Quantum", "forced for test")
+
+        async def burst():
+            return await asyncio.gather(*(
+                hybrid_processing_async("Optimization task", None, circuit="circuit", plan=plan, executor=self.executor)
+                for _ in range(4)
+            ))
+
+        self.assertEqual(asyncio.run(burst()), ["Quantum Result"] * 4)
+        self.assertEqual(max(peak), 1)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+# quantum_firmware_optimization/tests/test_hyperparameter_search.py
+
+import json
+import os
+import tempfile
+import unittest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import GridSearchCV
+from sklearn.neighbors import KNeighborsClassifier
+from quantum_firmware_optimization.scripts.hyperparameter_search import rung_resources, search
+
+class TestHyperparameterSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = make_classification(n_samples=300, n_features=8, random_state=0)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.tmpdir.name, "search.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_grid_matches_grid_search_cv(self):
+        """Test that the grid strategy picks the same candidate and score as GridSearchCV."""
+        param_grid = {'n_neighbors': [1, 3, 5, 7, 9]}
+        reference = GridSearchCV(KNeighborsClassifier(), param_grid, cv=3, scoring='accuracy').fit(self.X, self.y)
+
+        result = search(KNeighborsClassifier(), param_grid, self.X, self.y, strategy="grid", n_jobs=2)
+        self.assertEqual(result.best_params, reference.best_params_)
+        self.assertAlmostEqual(result.best_score, reference.best_score_)
+        self.assertEqual(result.stats["fits"], 15)
+
+    def test_resume_runs_only_missing_fits(self):
+        """Test that a search resumed from its checkpoint skips the fits already recorded."""
+        param_grid = {'n_neighbors': [1, 3, 5, 7]}
+        first = search(KNeighborsClassifier(), param_grid, self.X, self.y, checkpoint_path=self.checkpoint_path)
+
+        # Simulate an interruption after all but two fits
+        with open(self.checkpoint_path) as f:
+            state = json.load(f)
+        for key in sorted(state["scores"])[:2]:
+            del state["scores"][key]
+        with open(self.checkpoint_path, "w") as f:
+            json.dump(state, f)
+
+        resumed = search(KNeighborsClassifier(), param_grid, self.X, self.y, checkpoint_path=self.checkpoint_path)
+        self.assertEqual(resumed.stats["fits"], 2)
+        self.assertEqual(resumed.stats["resumed_fits"], 10)
+        self.assertEqual(resumed.best_params, first.best_params)
+
+    def test_checkpoint_of_another_search_is_ignored(self):
+        """Test that a checkpoint written for different data is not reused."""
+        search(KNeighborsClassifier(), {'n_neighbors': [1, 3]}, self.X, self.y, checkpoint_path=self.checkpoint_path)
+        result = search(KNeighborsClassifier(), {'n_neighbors': [1, 3]}, self.X[:200], self.y[:200],
+                        checkpoint_path=self.checkpoint_path)
+        self.assertEqual(result.stats["resumed_fits"], 0)
+
+    def test_halving_over_n_estimators(self):
+        """Test that halving over n_estimators runs fewer fits and refits the survivor with all trees."""
+        param_grid = {'max_depth': [2, 4, 8], 'min_samples_split': [2, 5, 10]}
+        result = search(RandomForestClassifier(random_state=0), param_grid, self.X, self.y, strategy="halving",
+                        resource="n_estimators", max_resources=27)
+        self.assertEqual(result.stats["rungs"], [9, 27])
+        self.assertEqual(result.stats["fits"], 9 * 3 + 3 * 3)
+        self.assertEqual(result.best_params["n_estimators"], 27)
+        self.assertEqual(result.best_estimator.n_estimators, 27)
+
+    def test_rung_resources(self):
+        """Test that rungs grow by the halving factor up to the full budget."""
+        self.assertEqual(rung_resources(27, 270, factor=3), [30, 90, 270])
+        self.assertEqual(rung_resources(3, 270, factor=3), [270])
+
+if __name__ == '__main__':
+    unittest.main()
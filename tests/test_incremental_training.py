@@ -0,0 +1,152 @@
+# quantum_firmware_optimization/tests/test_incremental_training.py
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import joblib
+import numpy as np
+import pandas as pd
+from quantum_firmware_optimization.scripts.incremental_training import (
+    MIN_DRIFT_ROWS, TREES_PER_UPDATE, drifted_features, load_state, update
+)
+
+LABELS = ("Alpha", "Beta", "Gamma")
+MODULE = 'quantum_firmware_optimization.scripts.incremental_training'
+
+def make_rows(n, seed, shift=0.0, labels=LABELS):
+    """Rows whose features cluster by label, optionally shifted to simulate drift."""
+    rng = np.random.default_rng(seed)
+    producers = rng.choice(labels, size=n)
+    centers = np.array([LABELS.index(label) for label in producers], dtype=float)
+    return pd.DataFrame({
+        "Cores": np.round(4 + 4 * centers + rng.normal(0, 0.5, n) + shift, 3),
+        "Threads": np.round(8 + 8 * centers + rng.normal(0, 1.0, n) + shift, 3),
+        "Producer": producers,
+    })
+
+class TestIncrementalTraining(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_path = os.path.join(tmp.name, "catalog.csv")
+        self.model_path = os.path.join(tmp.name, "model.joblib")
+        make_rows(200, seed=0).to_csv(self.data_path, index=False)
+
+    def append(self, rows):
+        rows.to_csv(self.data_path, mode="a", header=False, index=False)
+
+    def update(self, **kwargs):
+        return update(self.data_path, self.model_path, use_cache=False, **kwargs)
+
+    def test_no_state_trains_from_scratch(self):
+        """Test that the first run is a full retrain that records every consumed row."""
+        result = self.update()
+        self.assertEqual((result["mode"], result["reason"]), ("full", "no state"))
+        self.assertEqual((result["rows"], result["new_rows"]), (200, 200))
+        state = load_state(self.model_path + ".state.json")
+        self.assertEqual(state["rows"], 200)
+        self.assertEqual(state["bytes"], os.path.getsize(self.data_path))
+        self.assertEqual(state["feature_columns"], ["Cores", "Threads"])
+        self.assertEqual(set(joblib.load(self.model_path).classes_), set(LABELS))
+
+    def test_unchanged_data_is_a_no_op(self):
+        """Test that a run with no new rows neither loads the data nor republishes the model."""
+        self.update()
+        mtime = os.stat(self.model_path).st_mtime_ns
+        with patch(f'{MODULE}.load_data') as mock_load, patch(f'{MODULE}.publish_model') as mock_publish:
+            result = self.update()
+        self.assertEqual((result["mode"], result["new_rows"]), ("unchanged", 0))
+        mock_load.assert_not_called()
+        mock_publish.assert_not_called()
+        self.assertEqual(os.stat(self.model_path).st_mtime_ns, mtime)
+
+    def test_appended_rows_are_learned_incrementally(self):
+        """Test that appended rows are scored and learned without refitting from scratch."""
+        self.update()
+        self.append(make_rows(40, seed=1))
+        with patch(f'{MODULE}.full_retrain') as mock_full, \
+                patch(f'{MODULE}.drifted_features', wraps=drifted_features) as mock_drift:
+            result = self.update()
+        mock_full.assert_not_called()
+        mock_drift.assert_called_once()
+        self.assertEqual((result["mode"], result["reason"]), ("incremental", None))
+        self.assertEqual((result["rows"], result["new_rows"]), (240, 40))
+        self.assertGreater(result["prequential_accuracy"], 0.8)
+        state = load_state(self.model_path + ".state.json")
+        self.assertEqual((state["rows"], state["incremental_updates"], state["rows_since_full_retrain"]),
+                         (240, 1, 240))
+
+    def test_rewritten_prefix_triggers_full_retrain(self):
+        """Test that editing already consumed rows retrains on every row."""
+        self.update()
+        with open(self.data_path) as f:
+            lines = f.readlines()
+        lines[1] = lines[1].replace(lines[1].split(",")[0], "99.0", 1)
+        with open(self.data_path, "w") as f:
+            f.writelines(lines)
+        result = self.update()
+        self.assertEqual((result["mode"], result["reason"]), ("full", "consumed rows rewritten"))
+
+    def test_schema_change_triggers_full_retrain(self):
+        """Test that appended rows turning a numeric column into text retrain on the numeric columns left."""
+        self.update()
+        rows = make_rows(5, seed=2)
+        rows["Threads"] = "unknown"
+        self.append(rows)
+        result = self.update()
+        self.assertEqual((result["mode"], result["reason"]), ("full", "feature schema changed"))
+        self.assertEqual(load_state(self.model_path + ".state.json")["feature_columns"], ["Cores"])
+
+    def test_new_label_triggers_full_retrain(self):
+        """Test that a label the model has never seen retrains, so the model learns the new class."""
+        self.update()
+        rows = make_rows(5, seed=3)
+        rows["Producer"] = "Delta"
+        self.append(rows)
+        result = self.update()
+        self.assertEqual((result["mode"], result["reason"]), ("full", "new labels ['Delta']"))
+        self.assertIn("Delta", joblib.load(self.model_path).classes_)
+
+    def test_drift_triggers_full_retrain(self):
+        """Test that a batch whose feature means moved far from the training data retrains."""
+        self.update()
+        self.append(make_rows(MIN_DRIFT_ROWS, seed=4, shift=50.0))
+        with patch(f'{MODULE}.drifted_features', wraps=drifted_features) as mock_drift:
+            result = self.update()
+        mock_drift.assert_called_once()
+        self.assertEqual((result["mode"], result["reason"]), ("full", "drift in Cores, Threads"))
+
+        # Small batches are not checked for drift
+        self.append(make_rows(MIN_DRIFT_ROWS - 1, seed=5, shift=500.0))
+        self.assertEqual(self.update()["mode"], "incremental")
+
+    def test_other_full_retrain_triggers(self):
+        """Test that forcing, switching algorithm or replacing the model file retrains."""
+        self.update()
+        self.append(make_rows(5, seed=6))
+        self.assertEqual(self.update(force_full=True)["reason"], "forced")
+        self.append(make_rows(5, seed=7))
+        self.assertEqual(self.update(algorithm="naive_bayes")["reason"], "algorithm changed from sgd")
+        joblib.dump(joblib.load(self.model_path), self.model_path, compress=3)
+        self.append(make_rows(5, seed=8))
+        self.assertEqual(self.update(algorithm="naive_bayes")["reason"], "model file changed")
+        with self.assertRaises(ValueError):
+            self.update(algorithm="svm")
+
+    def test_random_forest_grows_trees_per_update(self):
+        """Test that a forest update adds TREES_PER_UPDATE trees and needs every label in the batch."""
+        self.update(algorithm="random_forest")
+        trees = joblib.load(self.model_path).named_steps['model'].n_estimators
+        self.append(make_rows(30, seed=9))
+        self.assertEqual(self.update(algorithm="random_forest")["mode"], "incremental")
+        self.assertEqual(joblib.load(self.model_path).named_steps['model'].n_estimators, trees + TREES_PER_UPDATE)
+
+        self.append(make_rows(10, seed=10, labels=LABELS[:1]))
+        result = self.update(algorithm="random_forest")
+        self.assertEqual((result["mode"], result["reason"]), ("full", "new rows do not cover every label"))
+        self.assertEqual(joblib.load(self.model_path).named_steps['model'].n_estimators, trees)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+# quantum_firmware_optimization/tests/test_lazy_imports.py
+
+import sys
+import unittest
+from quantum_firmware_optimization.src.lazy_imports import LazyModule, lazy_import, is_imported
+
+class TestLazyImports(unittest.TestCase):
+
+    def setUp(self):
+        sys.modules.pop("colorsys", None)
+
+    def test_import_is_deferred_until_attribute_access(self):
+        """Test that a lazy module is not imported until it is used."""
+        module = LazyModule("colorsys")
+        self.assertFalse(module.is_loaded)
+        self.assertNotIn("colorsys", sys.modules)
+
+        self.assertEqual(module.rgb_to_hsv(0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+        self.assertTrue(module.is_loaded)
+        self.assertIn("colorsys", sys.modules)
+
+    def test_lazy_import_returns_shared_proxy(self):
+        """Test that lazy_import hands out one proxy per module name."""
+        first = lazy_import("quantum_firmware_optimization_missing_backend")
+        second = lazy_import("quantum_firmware_optimization_missing_backend")
+        self.assertIs(first, second)
+        self.assertFalse(is_imported("quantum_firmware_optimization_missing_backend"))
+
+    def test_lazy_import_returns_loaded_module_directly(self):
+        """Test that lazy_import skips the proxy for modules that are already imported."""
+        self.assertIs(lazy_import("json"), sys.modules["json"])
+        self.assertTrue(is_imported("json"))
+
+    def test_missing_module_raises_on_first_use(self):
+        """Test that import errors surface when the backend is first used."""
+        module = LazyModule("quantum_firmware_optimization_missing_backend")
+        with self.assertRaises(ImportError):
+            module.anything
+
+if __name__ == "__main__":
+    unittest.main()
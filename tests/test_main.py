@@ -7,12 +7,15 @@ from quantum_firmware_optimization.src.main import main
 class TestMain(unittest.TestCase):
 
     @patch('quantum_firmware_optimization.src.main.get_hardware_info')
+    @patch('quantum_firmware_optimization.src.main.plan_routing')
     @patch('quantum_firmware_optimization.src.main.allocate_resources')
     @patch('quantum_firmware_optimization.src.main.hybrid_processing')
-    def test_main(self, mock_hybrid_processing, mock_allocate_resources, mock_get_hardware_info):
+    def test_main(self, mock_hybrid_processing, mock_allocate_resources, mock_plan_routing, mock_get_hardware_info):
         """Test the main function."""
         # Mock return values
         mock_get_hardware_info.return_value = {"cpu": "Intel", "memory": "16GB"}
+        plan = MagicMock()
+        mock_plan_routing.return_value = plan
         mock_allocate_resources.return_value = "Quantum"
         mock_hybrid_processing.return_value = "Quantum Result"
 
@@ -29,8 +32,9 @@ class TestMain(unittest.TestCase):
         
             # Assert calls
             mock_get_hardware_info.assert_called_once()
-            mock_allocate_resources.assert_called_once_with(task_description)
-            mock_hybrid_processing.assert_called_once_with(task_description, data, circuit=circuit, parameters=parameters, model=model)
+            mock_plan_routing.assert_called_once_with(task_description, mock_get_hardware_info.return_value)
+            mock_allocate_resources.assert_called_once_with(task_description, plan=plan)
+            mock_hybrid_processing.assert_called_once_with(task_description, data, circuit=circuit, parameters=parameters, model=model, plan=plan)
             mocked_print.assert_called_once_with("Processing result: Quantum Result")
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+# quantum_firmware_optimization/tests/test_micro_batching.py
+
+import threading
+import time
+import unittest
+import numpy as np
+from quantum_firmware_optimization.src.micro_batching import MicroBatcher
+
+class RecordingModel:
+    """Model stand-in that doubles its input and records every batch it sees."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.batches = []
+
+    def predict(self, data):
+        self.batches.append(len(data))
+        time.sleep(self.delay)
+        return data * 2
+
+class TestMicroBatcher(unittest.TestCase):
+
+    def test_concurrent_requests_share_one_predict_call(self):
+        """Test that concurrent requests are merged and each caller gets its own rows back."""
+        model = RecordingModel()
+        with MicroBatcher(model, max_batch_size=64, max_delay=0.2) as batcher:
+            futures = [batcher.submit(np.full((2, 3), i, dtype=np.float32)) for i in range(8)]
+            results = [future.result(5) for future in futures]
+
+        self.assertEqual(model.batches, [16])
+        for i, result in enumerate(results):
+            np.testing.assert_array_equal(result, np.full((2, 3), 2 * i, dtype=np.float32))
+
+    def test_batches_respect_max_batch_size(self):
+        """Test that no predict call receives more rows than max_batch_size."""
+        model = RecordingModel()
+        with MicroBatcher(model, max_batch_size=4, max_delay=0.05) as batcher:
+            futures = [batcher.submit(np.ones((3, 2))) for _ in range(5)]
+            for future in futures:
+                self.assertEqual(future.result(5).shape, (3, 2))
+
+        self.assertEqual(sum(model.batches), 15)
+        self.assertTrue(all(size <= 4 for size in model.batches))
+
+    def test_lone_request_waits_at_most_max_delay(self):
+        """Test that a single request is not held back longer than the queueing delay."""
+        with MicroBatcher(RecordingModel(), max_batch_size=64, max_delay=0.01) as batcher:
+            start = time.monotonic()
+            batcher.predict(np.ones((1, 2)), timeout=5)
+            self.assertLess(time.monotonic() - start, 1.0)
+            self.assertLess(batcher.metrics()["queue_latency_ms"]["max"], 500)
+
+    def test_predict_errors_reach_every_caller(self):
+        """Test that a failing predict call fails every request in the batch."""
+        model = RecordingModel()
+        model.predict = lambda data: (_ for _ in ()).throw(RuntimeError("model failed"))
+        with MicroBatcher(model, max_delay=0.05) as batcher:
+            futures = [batcher.submit(np.ones((1, 2))) for _ in range(3)]
+            for future in futures:
+                with self.assertRaises(RuntimeError):
+                    future.result(5)
+            self.assertEqual(batcher.metrics()["errors"], 1)
+
+    def test_metrics_report_batch_sizes(self):
+        """Test that metrics count requests, rows and batches."""
+        with MicroBatcher(RecordingModel(delay=0.05), max_batch_size=8, max_delay=0.01) as batcher:
+            threads = [threading.Thread(target=batcher.predict, args=(np.ones((1, 2)),)) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            metrics = batcher.metrics()
+
+        self.assertEqual(metrics["requests"], 16)
+        self.assertEqual(metrics["rows"], 16)
+        self.assertLess(metrics["batches"], 16)
+        self.assertLessEqual(metrics["max_batch_size"], 8)
+        self.assertGreater(metrics["mean_batch_size"], 1)
+
+    def test_close_racing_submitters_leaves_no_request_behind(self):
+        """Test that every request accepted while close runs is answered, and later ones are refused."""
+        for _ in range(10):
+            batcher = MicroBatcher(RecordingModel(), max_batch_size=8, max_delay=0.001)
+            futures = []
+            refused = []
+
+            def submit_until_closed():
+                while True:
+                    try:
+                        futures.append(batcher.submit(np.ones((1, 2))))
+                    except RuntimeError:
+                        refused.append(True)
+                        return
+
+            threads = [threading.Thread(target=submit_until_closed) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.002)
+            batcher.close(timeout=5)
+            for thread in threads:
+                thread.join(5)
+
+            self.assertEqual(len(refused), 4)
+            for future in futures:
+                np.testing.assert_array_equal(future.result(5), np.full((1, 2), 2.0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# quantum_firmware_optimization/tests/test_model_registry.py
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import joblib
+from quantum_firmware_optimization.scripts.model_registry import ModelRegistry, get_registry, publish_model
+from quantum_firmware_optimization.scripts.train_model import save_model
+
+class TestModelRegistry(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.path = os.path.join(self.dir, "model.joblib")
+        self.compiled_path = os.path.join(self.dir, "model.flat.joblib")
+
+    def test_model_is_loaded_lazily(self):
+        """Test that nothing is read until the first get, even if the file does not exist yet."""
+        registry = ModelRegistry(self.path)
+        self.assertIsNone(registry.version)
+        publish_model({"name": "first"}, self.path)
+        self.assertIsNone(registry.version)
+        self.assertEqual(registry.get(), {"name": "first"})
+        self.assertIsNotNone(registry.version)
+        self.assertEqual(registry.reloads, 0)
+
+    def test_missing_model_raises_on_first_get(self):
+        """Test that a registry with no model file fails loudly instead of serving None."""
+        with self.assertRaises(FileNotFoundError):
+            ModelRegistry(self.path).get()
+
+    def test_changed_file_is_swapped_in(self):
+        """Test that publishing a new model swaps it in on the next check."""
+        publish_model({"name": "first"}, self.path)
+        registry = ModelRegistry(self.path, check_interval=3600)
+        registry.get()
+        first_version = registry.version
+        publish_model({"name": "second"}, self.path)
+        # Within check_interval the previous model is still served
+        self.assertEqual(registry.get(), {"name": "first"})
+        self.assertTrue(registry.refresh(force=True))
+        self.assertEqual(registry.get(), {"name": "second"})
+        self.assertNotEqual(registry.version, first_version)
+        self.assertEqual(registry.reloads, 1)
+
+    def test_unchanged_content_is_not_reloaded(self):
+        """Test that republishing identical content only updates the signature."""
+        publish_model({"name": "first"}, self.path)
+        registry = ModelRegistry(self.path)
+        model = registry.get()
+        publish_model({"name": "first"}, self.path)
+        with patch("quantum_firmware_optimization.scripts.model_registry.joblib.load") as mock_load:
+            self.assertFalse(registry.refresh(force=True))
+            mock_load.assert_not_called()
+        self.assertIs(registry.get(), model)
+        self.assertEqual(registry.reloads, 0)
+
+    def test_failed_reload_keeps_previous_model(self):
+        """Test that a corrupt model file leaves the previous model in service and is not retried."""
+        publish_model({"name": "first"}, self.path)
+        registry = ModelRegistry(self.path)
+        registry.get()
+        version = registry.version
+        with open(self.path, "wb") as f:
+            f.write(b"not a joblib file")
+        self.assertFalse(registry.refresh(force=True))
+        self.assertEqual(registry.get(), {"name": "first"})
+        self.assertEqual(registry.version, version)
+        with patch("quantum_firmware_optimization.scripts.model_registry.joblib.load") as mock_load:
+            self.assertFalse(registry.refresh(force=True))
+            mock_load.assert_not_called()
+
+        # A good file published afterwards is picked up again
+        publish_model({"name": "second"}, self.path)
+        self.assertTrue(registry.refresh(force=True))
+        self.assertEqual(registry.get(), {"name": "second"})
+
+    def test_preferred_candidate_is_resolved_on_every_check(self):
+        """Test that a compiled model published or removed after startup switches the file served."""
+        publish_model({"name": "sklearn"}, self.path)
+        registry = ModelRegistry((self.compiled_path, self.path))
+        self.assertEqual(registry.get(), {"name": "sklearn"})
+        self.assertEqual(registry.path, self.path)
+
+        publish_model({"name": "compiled"}, self.compiled_path)
+        self.assertTrue(registry.refresh(force=True))
+        self.assertEqual(registry.get(), {"name": "compiled"})
+        self.assertEqual(registry.path, self.compiled_path)
+
+        os.remove(self.compiled_path)
+        self.assertTrue(registry.refresh(force=True))
+        self.assertEqual(registry.get(), {"name": "sklearn"})
+        self.assertEqual(registry.path, self.path)
+
+    def test_get_registry_is_shared_per_candidate_list(self):
+        """Test that the same paths give the same registry and different orders do not."""
+        first = get_registry((self.compiled_path, self.path))
+        self.assertIs(get_registry([self.compiled_path, self.path]), first)
+        self.assertIsNot(get_registry((self.path, self.compiled_path)), first)
+        self.assertIs(get_registry(self.path), get_registry((self.path,)))
+
+    def test_save_model_publishes_atomically(self):
+        """Test that train_model.save_model goes through publish_model and leaves no partial files."""
+        with patch("quantum_firmware_optimization.scripts.train_model.publish_model",
+                   wraps=publish_model) as mock_publish:
+            save_model({"name": "trained"}, self.path)
+        mock_publish.assert_called_once_with({"name": "trained"}, self.path)
+        self.assertEqual(joblib.load(self.path), {"name": "trained"})
+        self.assertEqual(os.listdir(self.dir), ["model.joblib"])
+
+    def test_published_model_follows_umask(self):
+        """Test that a published model gets the usual umask-derived mode, not a private temp-file mode."""
+        previous = os.umask(0o022)
+        try:
+            publish_model({"name": "shared"}, self.path)
+        finally:
+            os.umask(previous)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+if __name__ == '__main__':
+    unittest.main()
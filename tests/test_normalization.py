@@ -0,0 +1,109 @@
+# quantum_firmware_optimization/tests/test_normalization.py
+
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from quantum_firmware_optimization.scripts import normalization
+from quantum_firmware_optimization.scripts.normalization import clear_cache, normalize_frame, parse_quantity
+
+class TestNormalization(unittest.TestCase):
+
+    def setUp(self):
+        clear_cache()
+        self.addCleanup(clear_cache)
+
+    def assert_parsed(self, cases, bare_unit=None):
+        for kind, raw, expected in cases:
+            with self.subTest(kind=kind, raw=raw):
+                result = parse_quantity(pd.Series([raw], dtype=object), kind, bare_unit)
+                np.testing.assert_allclose(result, [expected], rtol=1e-12)
+
+    def test_unit_scaling_per_kind(self):
+        """Test that each kind's units are scaled to its canonical unit."""
+        self.assert_parsed([
+            ("clock", "3.7 GHz", 3.7e9),
+            ("clock", "2044 MHz", 2.044e9),
+            ("clock", "144 Hz", 144.0),
+            ("size", "16GB", 16e9),
+            ("size", "2 TB", 2e12),
+            ("size", "512 kb", 512e3),
+            ("power", "200 W", 200.0),
+            ("power", "500 mW", 0.5),
+            ("length", "159 mm", 0.159),
+            ("length", "30 cm", 0.3),
+            ("length", '23.8"', 23.8 * 0.0254),
+            ("length", '3.5 Zoll"', 3.5 * 0.0254),
+            ("price", "$64.54 USD", 64.54),
+            ("price", "-5 USD", -5.0),
+        ])
+
+    def test_bare_numbers(self):
+        """Test that numbers without a unit take the bare-number unit, or the canonical one."""
+        self.assert_parsed([("clock", "1708", 1708e6), ("clock", " 3200 ", 3200e6)], bare_unit="MHz")
+        self.assert_parsed([("clock", "1708", 1708.0), ("size", "2", 2.0)])
+        np.testing.assert_allclose(parse_quantity(pd.Series([2.4, 3.0]), "clock", "GHz"), [2.4e9, 3e9])
+        np.testing.assert_allclose(parse_quantity(np.array([1, 2]), "size"), [1.0, 2.0])
+
+    def test_currency_sign_only(self):
+        """Test that a "$" with no unit after it counts as the price unit, and only for prices."""
+        self.assert_parsed([("price", "$30", 30.0), ("price", "$ 12.5", 12.5)])
+        self.assert_parsed([("clock", "$30", np.nan), ("price", "$", np.nan)])
+
+    def test_decimal_commas(self):
+        """Test that decimal commas parse and thousands-like commas are left unparsed with a warning."""
+        self.assert_parsed([("length", "154,5 mm", 0.1545), ("length", "26,92 mm", 0.02692)])
+        with self.assertLogs(normalization.logger, level="WARNING") as logs:
+            result = parse_quantity(pd.Series(["1,500 MHz", "1.5 GHz"], dtype=object), "clock")
+        np.testing.assert_array_equal(np.isnan(result), [True, False])
+        self.assertIn("1,500 MHz", logs.output[0])
+
+    def test_unparseable_values_are_nan(self):
+        """Test that missing, unit-less, unknown-unit and free-text values become NaN."""
+        values = pd.Series(["GHz", "", None, "fast", "5 parsecs", "Top Slots: 414 Lower Slots: 275 mm", "3 GHz"],
+                           dtype=object)
+        result = parse_quantity(values, "clock")
+        np.testing.assert_array_equal(np.isnan(result), [True] * 6 + [False])
+        with self.assertRaises(ValueError):
+            parse_quantity(values, "temperature")
+        with self.assertRaises(ValueError):
+            parse_quantity(pd.Series([True, False]), "clock")
+
+    def test_distinct_strings_are_parsed_once(self):
+        """Test that repeated values and repeated calls reuse the memoized parse."""
+        values = pd.Series(["3.7 GHz", "4.2 GHz", "3.7 GHz"] * 10, dtype=object)
+        with patch.object(normalization, "_parse_strings", wraps=normalization._parse_strings) as mock_parse:
+            first = parse_quantity(values, "clock")
+            second = parse_quantity(values, "clock")
+        mock_parse.assert_called_once()
+        self.assertEqual(sorted(mock_parse.call_args[0][0]), ["3.7 GHz", "4.2 GHz"])
+        np.testing.assert_array_equal(first, second)
+
+    def test_cached_units_match_raw_parsing(self):
+        """Test that a cached numeric column scaled from attrs["units"] equals parsing the raw strings."""
+        raw = pd.DataFrame({"Height": ["159 mm", "157 mm", None], "Price": ["$64.54 USD", "$30.72 USD", "$1 USD"],
+                            "Name": ["a", "b", "c"]})
+        cached = pd.DataFrame({"Height": [159.0, 157.0, np.nan], "Price": [64.54, 30.72, 1.0], "Name": ["a", "b", "c"]})
+        cached.attrs = {"dataset": "CPUCoolerData", "units": {"Height": "mm", "Price": "USD"}}
+
+        from_raw = normalize_frame(raw, dataset="CPUCoolerData")
+        from_cache = normalize_frame(cached)
+        for column in ("Height", "Price"):
+            np.testing.assert_allclose(from_cache[column], from_raw[column])
+        self.assertEqual(from_cache.attrs["units"], {"Height": "m", "Price": "USD"})
+        self.assertEqual(from_cache.attrs["dataset"], "CPUCoolerData")
+        # Columns outside the schema are left alone
+        self.assertEqual(list(from_cache["Name"]), ["a", "b", "c"])
+
+    def test_schema_override_and_dataset_schemas(self):
+        """Test that bare-number units come from the dataset schema or an explicit override."""
+        frame = pd.DataFrame({"Clock": ["3200", "DDR4-3600"], "Size": ["16 GB", "32 GB"]})
+        ram = normalize_frame(frame, dataset="RAMData")
+        np.testing.assert_allclose(ram["Clock"], [3.2e9, np.nan])
+        np.testing.assert_allclose(ram["Size"], [16e9, 32e9])
+        self.assertEqual(list(normalize_frame(frame)["Clock"]), ["3200", "DDR4-3600"])
+        np.testing.assert_allclose(normalize_frame(frame, schema={"Clock": ("clock", "GHz")})["Clock"],
+                                   [3.2e12, np.nan])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,13 @@
 # quantum_firmware_optimization/tests/test_quantum_assessment.py
 
+import json
+import os
+import tempfile
 import unittest
-from quantum_firmware_optimization.src.quantum_assessment import assess_quantum_readiness
+from quantum_firmware_optimization.src.quantum_assessment import (
+    assess_quantum_readiness, assess_quantum_readiness_batch, assessment_cache_info,
+    configure_quantum_keywords, match_quantum_keyword
+)
 
 class TestQuantumAssessment(unittest.TestCase):
 
@@ -29,5 +35,48 @@ class TestQuantumAssessment(unittest.TestCase):
         result = assess_quantum_readiness(task_description)
         self.assertFalse(result)
 
+class TestQuantumAssessmentBatch(unittest.TestCase):
+
+    def setUp(self):
+        configure_quantum_keywords()
+
+    def tearDown(self):
+        configure_quantum_keywords()
+
+    def test_batch_matches_single_assessment(self):
+        """Test that the batch API agrees with assess_quantum_readiness."""
+        descriptions = [
+            "Run a portfolio OPTIMIZATION",
+            "Sort a list of numbers",
+            "Molecular simulation of caffeine",
+            "Sort a list of numbers"
+        ]
+        results = assess_quantum_readiness_batch(descriptions)
+        self.assertEqual(results, [assess_quantum_readiness(d) for d in descriptions])
+        self.assertEqual(results, [True, False, True, False])
+
+    def test_assessments_are_memoized(self):
+        """Test that repeated descriptions are served from the LRU cache."""
+        assess_quantum_readiness_batch(["Integer factorization"] * 3)
+        assess_quantum_readiness("Integer factorization")
+        info = assessment_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_keywords_are_configurable(self):
+        """Test that keywords can be replaced without code edits."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = os.path.join(tmp_dir, "assessment_config.json")
+            with open(config_path, "w") as config_file:
+                json.dump({"quantum_keywords": ["annealing"], "cache_size": 8}, config_file)
+            configure_quantum_keywords(config_path=config_path)
+
+        self.assertEqual(match_quantum_keyword("Simulated annealing schedule"), "annealing")
+        self.assertFalse(assess_quantum_readiness("Molecular simulation"))
+        self.assertEqual(assessment_cache_info().maxsize, 8)
+
+        configure_quantum_keywords(keywords=["sampling"])
+        self.assertTrue(assess_quantum_readiness("Boson sampling"))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+# quantum_firmware_optimization/tests/test_quantum_circuit.py
+
+import unittest
+import numpy as np
+import cirq
+import sympy
+from quantum_firmware_optimization.quantum.quantum_circuit import (
+    build_sweep, create_parametric_and_simulate, sweep_circuit, sweep_parametric
+)
+
+# Thetas whose Ry(theta) + H measurement is deterministic: P(1) = (1 - sin(theta)) / 2
+DETERMINISTIC_THETAS = np.array([np.pi / 2, -np.pi / 2, 3 * np.pi / 2, 5 * np.pi / 2])
+EXPECTED_BITS = np.array([0, 1, 1, 0])
+
+def two_qubit_circuit():
+    """Ry(alpha) and Ry(beta) on separate qubits, so alpha, beta in {0, pi} fix each bit."""
+    q0, q1 = cirq.LineQubit.range(2)
+    return cirq.Circuit(cirq.ry(sympy.Symbol('alpha')).on(q0), cirq.ry(sympy.Symbol('beta')).on(q1),
+                        cirq.measure(q0, q1, key='result'))
+
+class TestParameterSweeps(unittest.TestCase):
+
+    def test_build_sweep_grid_order(self):
+        """Test that several symbols form a grid in which the last symbol varies fastest."""
+        sweep = build_sweep({'alpha': [1.0, 2.0], 'beta': np.array([[10.0, 20.0, 30.0]])})
+        self.assertEqual(len(sweep), 6)
+        points = [(resolver.value_of('alpha'), resolver.value_of('beta')) for resolver in sweep]
+        self.assertEqual(points, [(1.0, 10.0), (1.0, 20.0), (1.0, 30.0), (2.0, 10.0), (2.0, 20.0), (2.0, 30.0)])
+
+        linspace = cirq.Linspace('theta', 0, 1, 5)
+        self.assertIs(build_sweep({'theta': linspace}), linspace)
+
+    def test_sweep_circuit_points_follow_sweep_order(self):
+        """Test that each row of measured bits belongs to the sweep point in the same row."""
+        points, bits = sweep_circuit(two_qubit_circuit(), {'alpha': [0.0, np.pi], 'beta': [np.pi, 0.0, np.pi]},
+                                     repetitions=5)
+        np.testing.assert_allclose(points, [[0, np.pi], [0, 0], [0, np.pi], [np.pi, np.pi], [np.pi, 0], [np.pi, np.pi]])
+        self.assertEqual(points.dtype, np.float64)
+        self.assertEqual(bits.shape, (6, 5, 2))
+        self.assertEqual(bits.dtype, np.int8)
+        expected = np.isclose(points, np.pi).astype(np.int8)
+        np.testing.assert_array_equal(bits, np.broadcast_to(expected[:, None, :], bits.shape))
+
+    def test_sweep_circuit_returns_none_on_failure(self):
+        """Test that a sweep collecting an unknown measurement key fails softly."""
+        self.assertIsNone(sweep_circuit(two_qubit_circuit(), {'alpha': [0.0], 'beta': [0.0]}, key='missing'))
+
+    def test_sweep_parametric_shape_and_dtype(self):
+        """Test that one row of bits comes back per theta, for arrays and cirq sweeps alike."""
+        bits = sweep_parametric(np.linspace(0, np.pi, 7), repetitions=11)
+        self.assertEqual(bits.shape, (7, 11))
+        self.assertEqual(bits.dtype, np.int8)
+        self.assertTrue(np.isin(bits, (0, 1)).all())
+        self.assertEqual(sweep_parametric(cirq.Linspace('theta', 0, np.pi, 4), repetitions=3).shape, (4, 3))
+
+    def test_sweep_parametric_matches_separate_runs(self):
+        """Test that a batched sweep agrees with running each theta on its own."""
+        bits = sweep_parametric(DETERMINISTIC_THETAS, repetitions=20)
+        for i, theta in enumerate(DETERMINISTIC_THETAS):
+            single = create_parametric_and_simulate(theta).measurements['result'][:, 0]
+            np.testing.assert_array_equal(single, np.full(single.shape, EXPECTED_BITS[i]))
+            np.testing.assert_array_equal(bits[i], np.full(20, EXPECTED_BITS[i]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 import unittest
 from unittest.mock import patch
 from quantum_firmware_optimization.src.resource_allocation import allocate_resources
+from quantum_firmware_optimization.src.routing_plan import RoutingPlan
 
 class TestResourceAllocation(unittest.TestCase):
 
@@ -26,5 +27,21 @@ class TestResourceAllocation(unittest.TestCase):
         mock_assess_quantum_readiness.assert_called_once_with(task_description)
         self.assertEqual(result, "Classical")
 
+    @patch('quantum_firmware_optimization.src.resource_allocation.assess_quantum_readiness')
+    def test_allocate_resources_follows_plan(self, mock_assess_quantum_readiness):
+        """Test that a routing plan is followed without re-assessing the task."""
+        task_description = "Sort a list of numbers"
+        plan = RoutingPlan(task_description, "Quantum", "forced for test")
+
+        result = allocate_resources(task_description, plan=plan)
+        mock_assess_quantum_readiness.assert_not_called()
+        self.assertEqual(result, "Quantum")
+
+    def test_allocate_resources_rejects_foreign_plan(self):
+        """Test that a plan made for another task is rejected."""
+        plan = RoutingPlan("Molecular simulation", "Quantum", "forced for test")
+        with self.assertRaises(ValueError):
+            allocate_resources("Sort a list of numbers", plan=plan)
+
 if __name__ == "__main__":
     unittest.main()
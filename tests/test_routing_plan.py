@@ -0,0 +1,43 @@
+# quantum_firmware_optimization/tests/test_routing_plan.py
+
+import dataclasses
+import unittest
+from quantum_firmware_optimization.src.routing_plan import RoutingPlan, plan_routing
+
+class TestRoutingPlan(unittest.TestCase):
+
+    def test_plan_routing_quantum(self):
+        """Test that a quantum task is routed to the quantum backend."""
+        plan = plan_routing("Portfolio optimization", {"cpu": {"brand": "Test CPU"}})
+        self.assertEqual(plan.backend, "Quantum")
+        self.assertTrue(plan.is_quantum)
+        self.assertIn("optimization", plan.reason)
+        self.assertEqual(plan.hardware["cpu"]["brand"], "Test CPU")
+
+    def test_plan_routing_classical(self):
+        """Test that a non-quantum task is routed to the classical backend."""
+        plan = plan_routing("Sort a list of numbers")
+        self.assertEqual(plan.backend, "Classical")
+        self.assertFalse(plan.is_quantum)
+
+    def test_plan_is_immutable(self):
+        """Test that neither the plan nor its hardware snapshot can be modified."""
+        hardware_info = {"cpu": {"brand": "Test CPU"}, "missing": ["disk"]}
+        plan = plan_routing("Portfolio optimization", hardware_info)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            plan.backend = "Classical"
+        with self.assertRaises(TypeError):
+            plan.hardware["cpu"]["brand"] = "Other CPU"
+        self.assertEqual(plan.hardware["missing"], ("disk",))
+
+        hardware_info["cpu"]["brand"] = "Other CPU"
+        self.assertEqual(plan.hardware["cpu"]["brand"], "Test CPU")
+
+    def test_unsupported_backend(self):
+        """Test that only known backends can be planned."""
+        with self.assertRaises(ValueError):
+            RoutingPlan("Sort a list of numbers", "Analog", "invalid")
+
+if __name__ == "__main__":
+    unittest.main()
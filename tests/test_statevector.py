@@ -0,0 +1,72 @@
+# quantum_firmware_optimization/tests/test_statevector.py
+
+import unittest
+import numpy as np
+import cirq
+import sympy
+from quantum_firmware_optimization.quantum.statevector import (
+    UnsupportedCircuitError, compile_circuit, cross_check, is_supported
+)
+from quantum_firmware_optimization.quantum import simulator_pool
+
+class TestStatevector(unittest.TestCase):
+
+    def test_matches_cirq_on_random_circuits(self):
+        """Test that the NumPy engine agrees with cirq on random supported circuits."""
+        rng = np.random.default_rng(7)
+        qubits = cirq.LineQubit.range(4)
+        gates = [cirq.H, cirq.X, cirq.Y, cirq.Z]
+        for _ in range(10):
+            circuit = cirq.Circuit()
+            for _ in range(12):
+                a, b = rng.choice(4, size=2, replace=False)
+                kind = rng.integers(4)
+                if kind == 0:
+                    circuit.append(gates[rng.integers(4)](qubits[a]))
+                elif kind == 1:
+                    axis = [cirq.rx, cirq.ry, cirq.rz][rng.integers(3)]
+                    circuit.append(axis(rng.uniform(0, 2 * np.pi)).on(qubits[a]))
+                elif kind == 2:
+                    circuit.append(cirq.CNOT(qubits[a], qubits[b]))
+                else:
+                    circuit.append(cirq.CZ(qubits[a], qubits[b]))
+            self.assertTrue(cross_check(circuit))
+
+    def test_symbolic_rotation_resolves_per_run(self):
+        """Test that one compiled circuit serves every parameter value."""
+        qubit = cirq.GridQubit(0, 0)
+        circuit = cirq.Circuit(cirq.ry(sympy.Symbol('theta')).on(qubit), cirq.H(qubit))
+        for theta in (0.0, 0.5, np.pi):
+            self.assertTrue(cross_check(circuit, {'theta': theta}))
+
+    def test_sampling_follows_probabilities(self):
+        """Test that measurements are sampled from the final state with the invert mask applied."""
+        a, b = cirq.LineQubit.range(2)
+        circuit = cirq.Circuit(cirq.X(a), cirq.H(b), cirq.measure(a, b, key='result', invert_mask=(True,)))
+        bits = compile_circuit(circuit).sample(repetitions=2000, seed=1)['result']
+        self.assertEqual(bits.shape, (2000, 2))
+        self.assertEqual(bits.dtype, np.int8)
+        self.assertTrue(np.all(bits[:, 0] == 0))
+        self.assertAlmostEqual(bits[:, 1].mean(), 0.5, delta=0.05)
+
+    def test_unsupported_circuits_are_rejected(self):
+        """Test that unsupported gates and mid-circuit measurements are rejected."""
+        a, b, c = cirq.LineQubit.range(3)
+        self.assertFalse(is_supported(cirq.Circuit(cirq.CCX(a, b, c))))
+        with self.assertRaises(UnsupportedCircuitError):
+            compile_circuit(cirq.Circuit(cirq.measure(a, key='m'), cirq.H(a)))
+        with self.assertRaises(UnsupportedCircuitError):
+            compile_circuit(cirq.Circuit(cirq.H.on_each(*cirq.LineQubit.range(3))), max_qubits=2)
+
+    def test_run_circuit_falls_back_to_cirq(self):
+        """Test that the auto engine runs unsupported circuits on cirq and the numpy engine refuses them."""
+        a, b, c = cirq.LineQubit.range(3)
+        circuit = cirq.Circuit(cirq.X(a), cirq.X(b), cirq.CCX(a, b, c), cirq.measure(c, key='result'))
+        cache = simulator_pool.CircuitCache()
+        result = simulator_pool.run_circuit(circuit, repetitions=5, cache=cache)
+        self.assertTrue(np.all(result.measurements['result'] == 1))
+        with self.assertRaises(simulator_pool.statevector.UnsupportedCircuitError):
+            simulator_pool.run_circuit(circuit, engine="numpy", cache=cache)
+
+if __name__ == "__main__":
+    unittest.main()
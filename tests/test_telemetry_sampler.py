@@ -0,0 +1,89 @@
+# quantum_firmware_optimization/tests/test_telemetry_sampler.py
+
+import time
+import unittest
+from unittest.mock import call, patch
+import numpy as np
+from quantum_firmware_optimization.scripts.telemetry_sampler import RingBuffer, TelemetrySampler
+
+class TestRingBuffer(unittest.TestCase):
+
+    def test_wrap_around_keeps_the_newest_samples_in_order(self):
+        """Test that a full buffer overwrites its oldest samples and reads back chronologically."""
+        buffer = RingBuffer(capacity=3, width=2)
+        self.assertIsNone(buffer.latest())
+        self.assertIsNone(buffer.ewma())
+        for i in range(5):
+            buffer.append(100.0 + i, [i, 10 * i])
+
+        self.assertEqual(len(buffer), 3)
+        times, values = buffer.window()
+        np.testing.assert_array_equal(times, [102.0, 103.0, 104.0])
+        np.testing.assert_array_equal(values, [[2, 20], [3, 30], [4, 40]])
+        np.testing.assert_array_equal(buffer.latest(), [4, 40])
+
+    def test_ewma_and_time_window(self):
+        """Test the EWMA update and that a window drops samples older than its length."""
+        buffer = RingBuffer(capacity=4, width=1)
+        now = time.time()
+        buffer.append(now - 60, [10.0], alpha=0.5)
+        buffer.append(now, [20.0], alpha=0.5)
+        self.assertAlmostEqual(float(buffer.ewma()[0]), 15.0)
+        times, values = buffer.window(seconds=10)
+        np.testing.assert_array_equal(values, [[20.0]])
+
+class TestTelemetrySampler(unittest.TestCase):
+
+    def wait_for(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("Condition not met before the timeout")
+            time.sleep(0.01)
+
+    def test_start_stop_and_latest(self):
+        """Test that the background thread fills the buffers until it is stopped."""
+        sampler = TelemetrySampler(interval=0.02, capacity=10)
+        self.assertIsNone(sampler.latest("cpu"))
+        with sampler:
+            self.assertIs(sampler.start(), sampler)  # Starting twice keeps the running thread
+            self.wait_for(lambda: len(sampler.buffers["cpu"]) >= 2)
+            cpu = sampler.latest("cpu")
+            self.assertIsInstance(cpu, float)
+            self.assertTrue(0.0 <= cpu <= 100.0)
+            self.assertEqual(len(sampler.latest("per_core")), len(sampler.buffers["per_core"].latest()))
+            self.assertIsNotNone(sampler.percentile("memory", 95))
+        self.assertIsNone(sampler._thread)
+
+        # No samples are taken once stopped
+        count = len(sampler.buffers["cpu"])
+        time.sleep(0.1)
+        self.assertEqual(len(sampler.buffers["cpu"]), count)
+        with self.assertRaises(ValueError):
+            sampler.latest("disk")
+
+    def test_start_primes_the_system_wide_cpu_counter(self):
+        """Test that starting the sampler primes psutil, so the fallback's first read is not a bare 0.0."""
+        with patch('quantum_firmware_optimization.scripts.telemetry_sampler.psutil.cpu_percent') as mock_cpu_percent:
+            sampler = TelemetrySampler(interval=60.0)
+            sampler.start()
+            sampler.stop()
+        self.assertIn(call(interval=None), mock_cpu_percent.call_args_list)
+        self.assertIn(call(interval=None, percpu=True), mock_cpu_percent.call_args_list)
+
+    def test_gpu_loads_keep_gputil_ids(self):
+        """Test that GPU samples are reported under GPUtil's ids, not list positions."""
+        with patch.object(TelemetrySampler, "_get_gpus", return_value=[(3, 50.0), (7, 20.0)]):
+            sampler = TelemetrySampler(interval=1.0)
+            self.assertEqual(sampler.gpu_ids, (3, 7))
+            self.assertIsNone(sampler.latest_gpus())
+            sampler.sample()
+            self.assertEqual(sampler.latest_gpus(), [(3, 50.0), (7, 20.0)])
+
+        # A sample taken after the GPU set changed is skipped
+        with patch.object(TelemetrySampler, "_get_gpus", return_value=[(3, 90.0)]):
+            sampler.sample()
+        self.assertEqual(sampler.latest_gpus(), [(3, 50.0), (7, 20.0)])
+
+if __name__ == '__main__':
+    unittest.main()
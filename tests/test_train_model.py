@@ -0,0 +1,58 @@
+# quantum_firmware_optimization/tests/test_train_model.py
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from quantum_firmware_optimization.scripts.train_model import (
+    evaluate_model, load_data, numeric_features, preprocess_data, split_data, train_model
+)
+
+class TestTrainModel(unittest.TestCase):
+
+    def test_numeric_features(self):
+        """Test that string columns are dropped and numeric ones imputed and standardized."""
+        features = pd.DataFrame({
+            "Name": ["a", "b", "c", "d"],
+            "Cores": [2, 4, None, 8],
+            "Integrated": [True, False, True, False],
+            "Constant": [5.0, 5.0, 5.0, 5.0],
+            "Empty": [np.nan] * 4,
+        })
+        numeric = numeric_features(features)
+        self.assertEqual(list(numeric.columns), ["Cores", "Integrated", "Constant", "Empty"])
+        self.assertFalse(numeric.isna().any().any())
+        # The missing core count takes the median before scaling
+        np.testing.assert_allclose(numeric["Cores"], (np.array([2, 4, 4, 8]) - 4.5) / np.std([2, 4, 4, 8], ddof=1))
+        np.testing.assert_allclose(numeric["Integrated"].mean(), 0.0, atol=1e-12)
+        # Constant and all-missing columns do not divide by zero
+        np.testing.assert_array_equal(numeric["Constant"], 0.0)
+        np.testing.assert_array_equal(numeric["Empty"], 0.0)
+
+    def test_catalog_with_string_columns_trains(self):
+        """Test that a catalog with value+unit and free-text columns goes from CSV to a fitted model."""
+        rng = np.random.default_rng(0)
+        producers = rng.choice(["AMD", "Intel"], size=60)
+        intel = producers == "Intel"
+        frame = pd.DataFrame({
+            "Name": [f"Chip {i}" for i in range(60)],
+            "Producer": producers,
+            "Base Clock": [f"{clock:.1f} GHz" for clock in np.where(intel, 3.0, 3.8) + rng.normal(0, 0.1, 60)],
+            "Cores": np.where(intel, 6, 12),
+            "Socket": np.where(intel, "LGA1700", "AM4"),
+        })
+        with tempfile.TemporaryDirectory() as tmp:
+            data_path = os.path.join(tmp, "CPUData.csv")
+            frame.to_csv(data_path, index=False)
+            features, labels = preprocess_data(load_data(data_path, use_cache=False))
+
+        X = numeric_features(features)
+        self.assertEqual(list(X.columns), ["Base Clock", "Cores"])
+        X_train, X_test, y_train, y_test = split_data(X, labels)
+        model = train_model(X_train, y_train, algorithm='knn')
+        accuracy, _ = evaluate_model(model, X_test, y_test)
+        self.assertEqual(accuracy, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# quantum_firmware_optimization/tests/test_tree_engine.py
+
+import os
+import tempfile
+import unittest
+import joblib
+import numpy as np
+from sklearn.datasets import make_classification
+from sklearn.ensemble import ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+from quantum_firmware_optimization.scripts.tree_engine import compile_ensemble
+
+LABELS = np.array(['CPU', 'GPU', 'QPU', 'Hybrid'])
+
+class TestTreeEngine(unittest.TestCase):
+
+    def make_data(self, n_classes):
+        X, y = make_classification(n_samples=500, n_features=8, n_informative=5, n_classes=n_classes, random_state=0)
+        return X[:350], LABELS[y[:350]], X[350:]
+
+    def assert_parity(self, model, X_test):
+        flat = compile_ensemble(model)
+        np.testing.assert_array_equal(flat.predict(X_test), model.predict(X_test))
+        np.testing.assert_allclose(flat.predict_proba(X_test), model.predict_proba(X_test), rtol=1e-9, atol=1e-12)
+        np.testing.assert_array_equal(flat.predict(X_test[:1]), model.predict(X_test[:1]))
+
+    def test_forest_parity(self):
+        """Test that compiled random forests, extra trees and single trees predict like scikit-learn."""
+        for n_classes in (2, 4):
+            X_train, y_train, X_test = self.make_data(n_classes)
+            for model in (RandomForestClassifier(n_estimators=30, random_state=0),
+                          ExtraTreesClassifier(n_estimators=30, random_state=0),
+                          DecisionTreeClassifier(random_state=0)):
+                with self.subTest(model=type(model).__name__, n_classes=n_classes):
+                    self.assert_parity(model.fit(X_train, y_train), X_test)
+
+    def test_gradient_boosting_parity(self):
+        """Test that compiled binary and multiclass gradient boosting predicts like scikit-learn."""
+        for n_classes in (2, 4):
+            X_train, y_train, X_test = self.make_data(n_classes)
+            model = GradientBoostingClassifier(n_estimators=40, random_state=0).fit(X_train, y_train)
+            with self.subTest(n_classes=n_classes):
+                self.assert_parity(model, X_test)
+                np.testing.assert_allclose(compile_ensemble(model).decision_function(X_test),
+                                           model.decision_function(X_test), rtol=1e-9, atol=1e-12)
+
+    def test_missing_values_follow_sklearn(self):
+        """Test that NaN inputs take the same branches as in scikit-learn's trees."""
+        X_train, y_train, X_test = self.make_data(2)
+        X_train[::5, 2] = np.nan
+        X_test[::3, 2] = np.nan
+        X_test[::4, 5] = np.nan
+        model = RandomForestClassifier(n_estimators=20, random_state=0).fit(X_train, y_train)
+        self.assert_parity(model, X_test)
+
+    def test_memory_mapped_round_trip(self):
+        """Test that a compiled model loaded memory-mapped predicts the same."""
+        X_train, y_train, X_test = self.make_data(4)
+        model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X_train, y_train)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "model.flat.joblib")
+            joblib.dump(compile_ensemble(model), path)
+            loaded = joblib.load(path, mmap_mode="r")
+            self.assertIsInstance(loaded.children, np.memmap)
+            np.testing.assert_array_equal(loaded.predict(X_test), model.predict(X_test))
+
+    def test_rejects_unsupported_models(self):
+        """Test that non-tree models and wrongly shaped input are rejected."""
+        X_train, y_train, X_test = self.make_data(2)
+        with self.assertRaises(ValueError):
+            compile_ensemble(LogisticRegression().fit(X_train, y_train))
+        flat = compile_ensemble(DecisionTreeClassifier(random_state=0).fit(X_train, y_train))
+        with self.assertRaises(ValueError):
+            flat.predict(X_test[:, :3])
+
+if __name__ == '__main__':
+    unittest.main()
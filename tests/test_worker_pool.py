@@ -0,0 +1,104 @@
+# quantum_firmware_optimization/tests/test_worker_pool.py
+
+import os
+import time
+import unittest
+import numpy as np
+from quantum_firmware_optimization.scripts.worker_pool import (
+    CLASSICAL, QUANTUM, SharedArray, WorkerCrashedError, WorkerPool, attach_payload, release_segments, share_payload
+)
+
+SHM_DIR = "/dev/shm"
+THRESHOLD = 1024
+
+def scale(payload):
+    """Return the input array and its double, both large enough to come back through shared memory."""
+    return {"input": payload["x"].copy(), "doubled": payload["x"] * 2}
+
+def misbehave(payload):
+    """Exit without reporting on 'crash', never return on 'hang', echo anything else."""
+    if isinstance(payload, str) and payload == "crash":
+        os._exit(1)
+    if isinstance(payload, str) and payload == "hang":
+        time.sleep(60)
+    return payload
+
+def shm_entries():
+    return set(os.listdir(SHM_DIR)) if os.path.isdir(SHM_DIR) else set()
+
+class TestWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.shm_before = shm_entries()
+
+    def make_pool(self, function, **kwargs):
+        pool = WorkerPool({CLASSICAL: function, QUANTUM: function}, workers={CLASSICAL: 1, QUANTUM: 1},
+                          shm_threshold=THRESHOLD, health_interval=0.05, **kwargs)
+        self.addCleanup(pool.shutdown, wait=False)
+        return pool
+
+    def test_share_and_attach_round_trip(self):
+        """Test that large arrays are replaced by descriptors and read back unchanged."""
+        big = np.arange(1000, dtype=np.float64)
+        small = np.arange(3)
+        segments = []
+        shared = share_payload({"big": big, "small": small, "items": [big, "label"]}, THRESHOLD, segments)
+        self.assertIsInstance(shared["big"], SharedArray)
+        self.assertIs(shared["small"], small)
+        self.assertEqual(len(segments), 2)
+
+        attached_segments = []
+        attached = attach_payload(shared, attached_segments, copy=True)
+        np.testing.assert_array_equal(attached["big"], big)
+        np.testing.assert_array_equal(attached["items"][0], big)
+        self.assertEqual(attached["items"][1], "label")
+        release_segments(attached_segments)
+        release_segments(segments, unlink=True)
+        self.assertEqual(shm_entries() - self.shm_before, set())
+
+    def test_shared_memory_round_trip(self):
+        """Test that arrays sent to and returned by workers through shared memory match."""
+        pool = self.make_pool(scale)
+        x = np.random.RandomState(0).rand(64, 64)
+        for backend in (CLASSICAL, QUANTUM):
+            with self.subTest(backend=backend):
+                result = pool.submit(backend, {"x": x}).result(timeout=30)
+                np.testing.assert_array_equal(result["input"], x)
+                np.testing.assert_array_equal(result["doubled"], x * 2)
+
+    def test_crashed_worker_is_restarted(self):
+        """Test that a worker dying mid-task fails that task and is replaced."""
+        pool = self.make_pool(misbehave)
+        with self.assertRaises(WorkerCrashedError):
+            pool.submit(CLASSICAL, "crash").result(timeout=30)
+        self.assertGreaterEqual(pool.restarts, 1)
+        self.assertEqual(pool.submit(CLASSICAL, "after crash").result(timeout=30), "after crash")
+        self.assertTrue(all(worker["alive"] for worker in pool.health().values()))
+
+    def test_task_timeout(self):
+        """Test that a task running past task_timeout fails with TimeoutError and its worker is restarted."""
+        pool = self.make_pool(misbehave, task_timeout=0.5)
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            pool.submit(QUANTUM, "hang").result(timeout=30)
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertEqual(pool.submit(QUANTUM, "next").result(timeout=30), "next")
+
+    def test_shutdown_unlinks_every_segment(self):
+        """Test that finished, in-flight and queued tasks leave no shared memory behind."""
+        pool = self.make_pool(misbehave)
+        large = np.ones(4096)
+        np.testing.assert_array_equal(pool.submit(CLASSICAL, large).result(timeout=30), large)
+        pool.submit(QUANTUM, "hang")
+        queued = pool.submit(QUANTUM, {"x": large})
+        self.assertTrue(shm_entries() - self.shm_before)
+
+        pool.shutdown(wait=False)
+        with self.assertRaises(WorkerCrashedError):
+            queued.result(timeout=5)
+        self.assertEqual(shm_entries() - self.shm_before, set())
+        with self.assertRaises(RuntimeError):
+            pool.submit(CLASSICAL, "late")
+
+if __name__ == '__main__':
+    unittest.main()
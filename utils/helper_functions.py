@@ -5,13 +5,6 @@ import os
 import json
 import yaml
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("helper_functions.log"),
-                        logging.StreamHandler()
-                    ])
 logger = logging.getLogger(__name__)
 
 def load_json(file_path):
@@ -111,6 +104,9 @@ def create_directory(dir_path):
         return False
 
 if __name__ == "__main__":
+    from logging_setup import configure_logging
+    configure_logging(log_file="helper_functions.log")
+
     # Example usage
     test_json_path = "test.json"
     test_yaml_path = "test.yaml"
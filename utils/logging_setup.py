@@ -0,0 +1,125 @@
+# quantum_firmware_optimization/utils/logging_setup.py
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_LOG_FILE = "quantum_firmware_optimization.log"
+DEFAULT_LEVEL = "INFO"
+# Upper bound on the length of any single formatted log message. Hot paths should
+# also cap large arguments themselves with a %-style precision, e.g. "%.512s".
+DEFAULT_MAX_MESSAGE_LENGTH = 4096
+
+_listener = None
+_queue_handler = None
+_configure_lock = threading.Lock()
+
+class CappedFormatter(logging.Formatter):
+    """Formatter that caps the rendered message so one call cannot flood the log."""
+
+    def __init__(self, fmt=DEFAULT_FORMAT, max_message_length=DEFAULT_MAX_MESSAGE_LENGTH):
+        super().__init__(fmt)
+        self.max_message_length = max_message_length
+
+    def formatMessage(self, record):
+        message = record.message
+        if self.max_message_length and len(message) > self.max_message_length:
+            record.message = f"{message[:self.max_message_length]}... [{len(message) - self.max_message_length} more chars]"
+        return super().formatMessage(record)
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves all formatting to the background listener.
+
+    The stock QueueHandler renders the message in the calling thread so records can
+    be pickled. Records here never leave the process, so the caller only pays for
+    creating the record and putting it on the queue.
+    """
+
+    def prepare(self, record):
+        return record
+
+def parse_module_levels(spec):
+    """
+    Parse per-module levels from a "module=LEVEL,other.module=LEVEL" string.
+
+    Args:
+        spec (str): The level specification, e.g. from the QFO_LOG_LEVELS variable.
+
+    Returns:
+        dict: Mapping of logger name to level name.
+    """
+    module_levels = {}
+    for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+        name, _, level = item.partition("=")
+        if not level:
+            raise ValueError(f"Invalid module log level '{item}', expected module=LEVEL")
+        module_levels[name.strip()] = level.strip().upper()
+    return module_levels
+
+def configure_logging(level=None, log_file=DEFAULT_LOG_FILE, module_levels=None, console=True,
+                      max_message_length=DEFAULT_MAX_MESSAGE_LENGTH, fmt=DEFAULT_FORMAT):
+    """
+    Route all logging through a queue drained by a background listener thread.
+
+    Calling this again replaces the previous configuration.
+
+    Args:
+        level (str or int, optional): Root level. Defaults to QFO_LOG_LEVEL or INFO.
+        log_file (str, optional): File to write to. None disables file logging.
+        module_levels (dict, optional): Per-logger levels, e.g. {"hybrid_processing": "DEBUG"}.
+            Entries from the QFO_LOG_LEVELS variable are applied on top.
+        console (bool): Whether to also log to stderr.
+        max_message_length (int): Cap on the length of any rendered message.
+        fmt (str): The log record format.
+
+    Returns:
+        logging.handlers.QueueListener: The running listener.
+    """
+    global _listener, _queue_handler
+    level = level if level is not None else os.environ.get("QFO_LOG_LEVEL", DEFAULT_LEVEL)
+    module_levels = {**(module_levels or {}), **parse_module_levels(os.environ.get("QFO_LOG_LEVELS"))}
+
+    formatter = CappedFormatter(fmt, max_message_length)
+    handlers = []
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    with _configure_lock:
+        shutdown_logging()
+        log_queue = queue.SimpleQueue()
+        _queue_handler = AsyncQueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(_queue_handler)
+        root.setLevel(level if isinstance(level, int) else level.upper())
+        for name, module_level in module_levels.items():
+            logging.getLogger(name).setLevel(module_level if isinstance(module_level, int) else module_level.upper())
+
+        _listener.start()
+    return _listener
+
+def shutdown_logging():
+    """Flush queued records and stop the background listener."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+atexit.register(shutdown_logging)